@@ -1,18 +1,71 @@
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from user_service.src.api.dependencies import service_overloaded_handler
 from user_service.src.api.endpoints import router as user_router
 from user_service.src.core.config import settings
-from user_service.src.db.base import init_db
+from user_service.src.core.events import event_bus
+from user_service.src.core.exceptions import ServiceOverloaded
+from user_service.src.core.oauth import oauth_providers
+from user_service.src.db.base import (
+    init_db,
+    async_session_maker,
+    audit_log,
+    session_registry,
+    memory_user_store,
+)
+from user_service.src.workers.archiver import UserArchiver
+from user_service.src.workers.oauth_refresher import OAuthTokenRefresher
+from user_service.src.workers.outbox import OutboxDispatcher
+
 
-#
-# @asynccontextmanager
-# async def lifespan(app: FastAPI):
-#     await init_db()
-#     yield
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if settings.MIGRATE_ON_STARTUP:
+        await init_db()
+    if settings.USER_DB_BACKEND == "memory":
+        memory_user_store.load()
+        memory_user_store.start()
+    if settings.AUDIT_LOG_ENABLED:
+        audit_log.subscribe(event_bus)
+        audit_log.start()
+    event_bus.start()
+    if settings.SESSIONS_ENABLED:
+        session_registry.start()
+    outbox_dispatcher = None
+    if settings.EVENT_OUTBOX_ENABLED:
+        outbox_dispatcher = OutboxDispatcher(async_session_maker, event_bus)
+        outbox_dispatcher.start()
+    oauth_token_refresher = None
+    if settings.OAUTH_REFRESH_ENABLED and oauth_providers:
+        oauth_token_refresher = OAuthTokenRefresher(
+            async_session_maker, oauth_providers
+        )
+        oauth_token_refresher.start()
+    user_archiver = None
+    if settings.USER_ARCHIVE_ENABLED and settings.USER_DB_BACKEND != "memory":
+        user_archiver = UserArchiver(async_session_maker)
+        user_archiver.start()
+    yield
+    if user_archiver is not None:
+        await user_archiver.stop()
+    if settings.USER_DB_BACKEND == "memory":
+        await memory_user_store.stop()
+    if settings.SESSIONS_ENABLED:
+        await session_registry.stop()
+    if oauth_token_refresher is not None:
+        await oauth_token_refresher.stop()
+    for provider in oauth_providers.values():
+        await provider.aclose()
+    if outbox_dispatcher is not None:
+        await outbox_dispatcher.stop()
+    await event_bus.stop()
+    if settings.AUDIT_LOG_ENABLED:
+        await audit_log.stop()
 
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
-    # lifespan=lifespan,
+    lifespan=lifespan,
 )
 app.include_router(router=user_router)
+app.add_exception_handler(ServiceOverloaded, service_overloaded_handler)
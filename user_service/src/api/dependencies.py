@@ -0,0 +1,166 @@
+from typing import Annotated, Any, AsyncGenerator, Callable, Optional
+from fastapi import Depends, HTTPException, Request, status
+from fastapi.responses import JSONResponse
+from fastapi.security import OAuth2PasswordBearer
+from fastapi.security.utils import get_authorization_scheme_param
+from user_service.src.core.admission import (
+    admission_limiters,
+    request_priority,
+    PRIORITY_AUTHENTICATED,
+)
+from user_service.src.core.config import settings
+from user_service.src.core.exceptions import (
+    ErrorCode,
+    UserNotExists,
+    InvalidID,
+    ServiceOverloaded,
+)
+from user_service.src.core.jwt_token import get_jwt_token_service
+from user_service.src.core.interfaces import BaseTokenService, BaseOAuthProvider
+from user_service.src.core.oauth import oauth_providers
+from user_service.src.db.base import get_user_manager, get_session_registry
+from user_service.src.db.sessions import SessionRegistry
+from user_service.src.db import UserManager
+from user_service.src.models import UserSnapshot
+
+oauth2_scheme = OAuth2PasswordBearer(tokenUrl="login", auto_error=False)
+
+
+def _unauthorized() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
+async def current_token_claims(
+    request: Request,
+    token: Annotated[Optional[str], Depends(oauth2_scheme)],
+    token_service: Annotated[BaseTokenService, Depends(get_jwt_token_service)],
+    session_registry: Annotated[
+        Optional[SessionRegistry], Depends(get_session_registry)
+    ],
+) -> dict[str, Any]:
+    """
+    Verifies the bearer token of the request and returns its claims.
+
+    The claims are stored on ``request.state`` so the token is decoded at most once per
+    request, no matter how many dependencies or handlers ask for it. Endpoints that only
+    need the claims should depend on this directly to avoid the user lookup. When session
+    tracking is enabled, tokens bound to a session (with a ``jti``) are rejected once the
+    session is revoked or evicted. An authenticated request is prioritized by admission
+    control from here on.
+
+    :raises HTTPException: 401 if the token is missing or invalid.
+    """
+    claims = getattr(request.state, "token_claims", None)
+    if claims is None:
+        claims = await token_service.read_claims(token)
+        if not claims:
+            raise _unauthorized()
+        jti = claims.get("jti")
+        if session_registry is not None and jti is not None:
+            if not await session_registry.is_active(jti):
+                raise _unauthorized()
+            session_registry.touch(jti)
+        request.state.token_claims = claims
+        request_priority.set(PRIORITY_AUTHENTICATED)
+    return claims
+
+
+async def current_user(
+    request: Request,
+    claims: Annotated[dict[str, Any], Depends(current_token_claims)],
+    user_manager: Annotated[UserManager, Depends(get_user_manager)],
+) -> UserSnapshot:
+    """
+    Loads a snapshot of the user the bearer token was issued to.
+
+    The snapshot is stored on ``request.state`` so it is fetched at most once per request.
+    Handlers that change the user load the entity with ``UserManager.get_user_by_id``.
+
+    :raises HTTPException: 401 if the token subject does not match an existing user.
+    """
+    user = getattr(request.state, "user", None)
+    if user is None:
+        try:
+            parsed_id = await user_manager.parse_id(claims.get("sub"))
+            user = await user_manager.get_snapshot_by_id(parsed_id)
+        except (UserNotExists, InvalidID):
+            raise _unauthorized()
+        request.state.user = user
+    return user
+
+
+async def current_active_user(
+    user: Annotated[UserSnapshot, Depends(current_user)],
+) -> UserSnapshot:
+    """
+    :raises HTTPException: 401 if the user is not active.
+    """
+    if not user.is_active:
+        raise _unauthorized()
+    return user
+
+
+async def current_superuser(
+    user: Annotated[UserSnapshot, Depends(current_active_user)],
+) -> UserSnapshot:
+    """
+    :raises HTTPException: 403 if the user is not a superuser.
+    """
+    if not user.is_superuser:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN)
+    return user
+
+
+async def get_oauth_provider(oauth_name: str) -> BaseOAuthProvider:
+    """
+    :raises HTTPException: 404 if no provider with this name is configured.
+    """
+    oauth_provider = oauth_providers.get(oauth_name)
+    if oauth_provider is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+    return oauth_provider
+
+
+def admission_control(name: str) -> Callable[..., AsyncGenerator[None, None]]:
+    """
+    Builds a dependency admitting requests through the ``name`` limiter of
+    ``admission_limiters``, configured by ``ADMISSION_ROUTE_CONCURRENCY``.
+
+    The slot is held until the response is sent. Requests with a valid bearer token are
+    queued ahead of anonymous ones; the token is only checked, as the route may not be
+    authenticated. Routes without a configured limit are not limited.
+    """
+    limiter = admission_limiters.get(name)
+
+    async def admit(
+        request: Request,
+        token_service: Annotated[BaseTokenService, Depends(get_jwt_token_service)],
+    ) -> AsyncGenerator[None, None]:
+        if limiter is None or not settings.ADMISSION_CONTROL_ENABLED:
+            yield
+            return
+        scheme, token = get_authorization_scheme_param(
+            request.headers.get("Authorization")
+        )
+        if scheme.lower() == "bearer" and await token_service.read_claims(token):
+            request_priority.set(PRIORITY_AUTHENTICATED)
+        async with limiter.limit():
+            yield
+
+    return admit
+
+
+async def service_overloaded_handler(
+    request: Request, exc: ServiceOverloaded
+) -> JSONResponse:
+    """
+    Answers requests shed by admission control with 503 and ``Retry-After``.
+    """
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": ErrorCode.SERVICE_OVERLOADED},
+        headers={"Retry-After": str(exc.retry_after)},
+    )
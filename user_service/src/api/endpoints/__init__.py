@@ -1,7 +1,23 @@
 from fastapi import APIRouter
 from user_service.src.api.endpoints.register import router as register
 from user_service.src.api.endpoints.auth import router as auth
+from user_service.src.api.endpoints.verify import router as verify
+from user_service.src.api.endpoints.reset import router as reset
+from user_service.src.api.endpoints.jwks import router as jwks
+from user_service.src.api.endpoints.introspect import router as introspect
+from user_service.src.api.endpoints.oauth import router as oauth
+from user_service.src.api.endpoints.audit import router as audit
+from user_service.src.api.endpoints.sessions import router as sessions
+from user_service.src.api.endpoints.users import router as users
 
 router = APIRouter()
 router.include_router(router=register, tags=["Register"])
 router.include_router(router=auth, tags=["Auth"])
+router.include_router(router=verify, tags=["Verify"])
+router.include_router(router=reset, tags=["Reset password"])
+router.include_router(router=jwks, tags=["JWKS"])
+router.include_router(router=introspect, tags=["Introspect"])
+router.include_router(router=oauth, tags=["OAuth"])
+router.include_router(router=audit, tags=["Audit"])
+router.include_router(router=sessions, tags=["Sessions"])
+router.include_router(router=users, tags=["Users"])
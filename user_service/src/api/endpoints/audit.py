@@ -0,0 +1,38 @@
+from datetime import datetime
+from typing import Annotated, Optional
+from uuid import UUID
+from fastapi import APIRouter, Depends, Query
+from user_service.src.api.dependencies import current_active_user, current_superuser
+from user_service.src.db.audit import AuditLog
+from user_service.src.db.base import get_audit_log
+from user_service.src.models import UserSnapshot
+from user_service.src.schemes import AuditLogEntry
+
+router = APIRouter(prefix="/audit")
+
+Limit = Annotated[int, Query(ge=1, le=500)]
+
+
+@router.get("/me", response_model=list[AuditLogEntry], name="audit_me")
+async def my_history(
+    user: Annotated[UserSnapshot, Depends(current_active_user)],
+    audit_log: Annotated[AuditLog, Depends(get_audit_log)],
+    limit: Limit = 50,
+    before: Optional[datetime] = None,
+):
+    return await audit_log.get_recent(user.id, limit, before)
+
+
+@router.get(
+    "/{user_id}",
+    response_model=list[AuditLogEntry],
+    name="audit_user",
+    dependencies=[Depends(current_superuser)],
+)
+async def user_history(
+    user_id: UUID,
+    audit_log: Annotated[AuditLog, Depends(get_audit_log)],
+    limit: Limit = 50,
+    before: Optional[datetime] = None,
+):
+    return await audit_log.get_recent(user_id, limit, before)
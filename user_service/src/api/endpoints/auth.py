@@ -1,8 +1,10 @@
-from typing import Annotated
+from typing import Annotated, Optional
 from fastapi import APIRouter, Request, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
+from user_service.src.api.dependencies import admission_control
 from user_service.src.core.exceptions import ErrorCode
-from user_service.src.db.base import get_user_manager
+from user_service.src.db.base import get_user_manager, get_session_registry
+from user_service.src.db.sessions import SessionRegistry
 from user_service.src.db import UserManager
 from user_service.src.schemes.bearer import BearerResponse
 from user_service.src.core.jwt_token import get_jwt_token_service, JWTTokenService
@@ -14,6 +16,7 @@ router = APIRouter()
     "/login",
     response_model=BearerResponse,
     status_code=status.HTTP_200_OK,
+    dependencies=[Depends(admission_control("login"))],
     responses={
         status.HTTP_400_BAD_REQUEST: {
             "model": ErrorCode,
@@ -35,14 +38,24 @@ async def login(
     credentials: Annotated[OAuth2PasswordRequestForm, Depends()],
     user_manager: Annotated[UserManager, Depends(get_user_manager)],
     jwt_token_service: Annotated[JWTTokenService, Depends(get_jwt_token_service)],
+    session_registry: Annotated[
+        Optional[SessionRegistry], Depends(get_session_registry)
+    ],
 ):
-    user = await user_manager.authenticate(credentials)
+    user = await user_manager.authenticate(credentials, request)
     if not user or not user.is_active:
+        if user:
+            await user_manager.on_after_login_failure(
+                credentials.username, user, request
+            )
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=ErrorCode.LOGIN_BAD_CREDENTIALS,
         )
-    access_token = await jwt_token_service.write_token(user)
+    jti = None
+    if session_registry is not None:
+        jti = (await session_registry.create(user, request)).jti
+    access_token = await jwt_token_service.write_token(user, jti)
     response = BearerResponse(access_token=access_token, token_type="bearer")
     await user_manager.on_after_login(user, request, response)
     return response
@@ -0,0 +1,89 @@
+from typing import Annotated, Optional
+from fastapi import APIRouter, Depends, Form, status
+from user_service.src.core.cache import (
+    TokenIntrospectionCache,
+    get_introspection_cache,
+)
+from user_service.src.core.exceptions import UserNotExists, InvalidID
+from user_service.src.core.jwt_token import get_jwt_token_service, JWTTokenService
+from user_service.src.core.tenant import get_tenant_id
+from user_service.src.db.base import get_user_manager, get_session_registry
+from user_service.src.db import UserManager
+from user_service.src.db.sessions import SessionRegistry
+from user_service.src.schemes import IntrospectionResponse
+
+router = APIRouter()
+
+INACTIVE_TOKEN = {"active": False}
+
+
+@router.post(
+    "/introspect",
+    response_model=IntrospectionResponse,
+    response_model_exclude_none=True,
+    status_code=status.HTTP_200_OK,
+    name="introspect",
+)
+async def introspect(
+    token: Annotated[str, Form()],
+    tenant_id: Annotated[str, Depends(get_tenant_id)],
+    user_manager: Annotated[UserManager, Depends(get_user_manager)],
+    jwt_token_service: Annotated[JWTTokenService, Depends(get_jwt_token_service)],
+    token_cache: Annotated[TokenIntrospectionCache, Depends(get_introspection_cache)],
+    session_registry: Annotated[
+        Optional[SessionRegistry], Depends(get_session_registry)
+    ],
+    token_type_hint: Annotated[Optional[str], Form()] = None,
+):
+    """
+    Token introspection as described in RFC 7662.
+
+    Results are cached per tenant by token hash until the token expires or the cache TTL
+    elapses, so repeated checks of the same token skip both the signature check and the
+    user lookup. Tokens bound to a session (with a ``jti``) are inactive once the session is
+    revoked or evicted; the registry drops their cached results when that happens.
+    """
+    cached = token_cache.get(token, tenant_id)
+    if cached is not None:
+        return cached
+
+    claims = await jwt_token_service.read_claims(token)
+    if not claims:
+        token_cache.set(token, INACTIVE_TOKEN, tenant_id=tenant_id)
+        return INACTIVE_TOKEN
+
+    jti = claims.get("jti")
+    if session_registry is not None and jti is not None:
+        if not await session_registry.is_active(jti):
+            token_cache.set(
+                token, INACTIVE_TOKEN, claims.get("exp"), tenant_id=tenant_id
+            )
+            return INACTIVE_TOKEN
+
+    subject = claims.get("sub")
+    try:
+        parsed_id = await user_manager.parse_id(subject)
+        user = await user_manager.get_identity_by_id(parsed_id)
+    except (UserNotExists, InvalidID):
+        token_cache.set(token, INACTIVE_TOKEN, claims.get("exp"), tenant_id=tenant_id)
+        return INACTIVE_TOKEN
+
+    if not user.is_active:
+        token_cache.set(
+            token, INACTIVE_TOKEN, claims.get("exp"), subject, tenant_id=tenant_id
+        )
+        return INACTIVE_TOKEN
+
+    introspection = {
+        "active": True,
+        "sub": subject,
+        "email": user.email,
+        "aud": claims.get("aud"),
+        "exp": claims.get("exp"),
+        "iat": int(claims["iat"]) if "iat" in claims else None,
+        "token_type": "Bearer",
+    }
+    token_cache.set(
+        token, introspection, claims.get("exp"), subject, jti, tenant_id=tenant_id
+    )
+    return introspection
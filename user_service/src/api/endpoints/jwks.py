@@ -0,0 +1,54 @@
+import hashlib
+import json
+from functools import lru_cache
+from typing import Annotated
+from fastapi import APIRouter, Depends, Header, Response, status
+from user_service.src.core.config import settings
+from user_service.src.core.jwt_token import get_jwt_token_service, JWTTokenService
+from user_service.src.core.security import get_public_jwk
+
+router = APIRouter()
+
+
+@lru_cache(maxsize=8)
+def render_jwks(public_keys: tuple[str, ...], algorithm: str) -> tuple[bytes, str]:
+    """
+    Serializes the key set and computes its strong ETag.
+
+    The rendered document only changes when the set of verification keys changes, so it is
+    cached per key set instead of being serialized and hashed on every request.
+
+    :param public_keys: The PEM encoded public keys of the set, in publication order.
+    :param algorithm: The JWT algorithm the keys are used with.
+    :return: The JSON body and its ETag.
+    """
+    keys = [get_public_jwk(public_key, algorithm) for public_key in public_keys]
+    body = json.dumps({"keys": keys}, separators=(",", ":"), sort_keys=True).encode()
+    return body, f'"{hashlib.sha256(body).hexdigest()}"'
+
+
+@router.get(
+    "/.well-known/jwks.json",
+    status_code=status.HTTP_200_OK,
+    name="jwks",
+    responses={
+        status.HTTP_304_NOT_MODIFIED: {
+            "description": "The key set matches the ETag sent in If-None-Match.",
+        },
+    },
+)
+async def jwks(
+    jwt_token_service: Annotated[JWTTokenService, Depends(get_jwt_token_service)],
+    if_none_match: Annotated[str | None, Header()] = None,
+):
+    body, etag = render_jwks(
+        tuple(jwt_token_service.verification_keys.values()),
+        jwt_token_service.algorithm,
+    )
+    headers = {
+        "ETag": etag,
+        "Cache-Control": f"public, max-age={settings.JWKS_CACHE_MAX_AGE_SECONDS}",
+    }
+    if if_none_match and etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -0,0 +1,244 @@
+from typing import Annotated, Any, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from user_service.src.api.dependencies import current_active_user, get_oauth_provider
+from user_service.src.core.exceptions import (
+    ErrorCode,
+    OAuthAccountAlreadyLinked,
+    OAuthProviderError,
+    UserAlreadyExists,
+)
+from user_service.src.core.config import settings
+from user_service.src.core.emails import normalize_email
+from user_service.src.core.interfaces import BaseOAuthProvider
+from user_service.src.core.jwt_token import get_jwt_token_service, JWTTokenService
+from user_service.src.core.oauth import generate_state_token, decode_state_token
+from user_service.src.db.base import get_user_manager, get_session_registry
+from user_service.src.db.sessions import SessionRegistry
+from user_service.src.db import UserManager
+from user_service.src.models import UserSnapshot
+from user_service.src.schemes import (
+    model_validate,
+    ErrorModel,
+    OAuthAuthorizeResponse,
+    User,
+)
+from user_service.src.schemes.bearer import BearerResponse
+
+router = APIRouter(prefix="/oauth")
+
+
+def _bad_request(error_code: ErrorCode) -> HTTPException:
+    return HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=error_code)
+
+
+async def _exchange_code(
+    oauth_provider: BaseOAuthProvider, code: str, redirect_uri: str
+) -> tuple[dict[str, Any], str, str]:
+    try:
+        token = await oauth_provider.get_access_token(code, redirect_uri)
+        account_id, account_email = await oauth_provider.get_id_email(
+            token["access_token"]
+        )
+    except OAuthProviderError:
+        raise HTTPException(
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail=ErrorCode.OAUTH_PROVIDER_ERROR,
+        )
+    if account_email is None:
+        raise _bad_request(ErrorCode.OAUTH_NOT_AVAILABLE_EMAIL)
+    return token, account_id, normalize_email(account_email)
+
+
+@router.get(
+    "/{oauth_name}/authorize",
+    response_model=OAuthAuthorizeResponse,
+    name="oauth_authorize",
+)
+async def authorize(
+    request: Request,
+    oauth_provider: Annotated[BaseOAuthProvider, Depends(get_oauth_provider)],
+    scopes: Annotated[Optional[list[str]], Query()] = None,
+):
+    redirect_uri = str(
+        request.url_for("oauth_callback", oauth_name=oauth_provider.name)
+    )
+    state = generate_state_token({"oauth_name": oauth_provider.name})
+    return OAuthAuthorizeResponse(
+        authorization_url=oauth_provider.get_authorization_url(
+            redirect_uri, state, scopes
+        )
+    )
+
+
+@router.get(
+    "/{oauth_name}/callback",
+    response_model=BearerResponse,
+    name="oauth_callback",
+    responses={
+        status.HTTP_400_BAD_REQUEST: {
+            "model": ErrorModel,
+            "content": {
+                "application/json": {
+                    "examples": {
+                        ErrorCode.OAUTH_INVALID_STATE: {
+                            "summary": "The state parameter is invalid or expired.",
+                            "value": {"detail": ErrorCode.OAUTH_INVALID_STATE},
+                        },
+                        ErrorCode.OAUTH_NOT_AVAILABLE_EMAIL: {
+                            "summary": "The provider did not return an email.",
+                            "value": {"detail": ErrorCode.OAUTH_NOT_AVAILABLE_EMAIL},
+                        },
+                        ErrorCode.OAUTH_USER_ALREADY_EXISTS: {
+                            "summary": "A user with this email already exists.",
+                            "value": {"detail": ErrorCode.OAUTH_USER_ALREADY_EXISTS},
+                        },
+                        ErrorCode.OAUTH_ACCOUNT_ALREADY_LINKED: {
+                            "summary": "The account is linked to a user of another tenant.",
+                            "value": {"detail": ErrorCode.OAUTH_ACCOUNT_ALREADY_LINKED},
+                        },
+                        ErrorCode.LOGIN_BAD_CREDENTIALS: {
+                            "summary": "The user is not active.",
+                            "value": {"detail": ErrorCode.LOGIN_BAD_CREDENTIALS},
+                        },
+                    }
+                }
+            },
+        },
+    },
+)
+async def callback(
+    request: Request,
+    code: str,
+    state: str,
+    oauth_provider: Annotated[BaseOAuthProvider, Depends(get_oauth_provider)],
+    user_manager: Annotated[UserManager, Depends(get_user_manager)],
+    jwt_token_service: Annotated[JWTTokenService, Depends(get_jwt_token_service)],
+    session_registry: Annotated[
+        Optional[SessionRegistry], Depends(get_session_registry)
+    ],
+):
+    state_data = decode_state_token(state)
+    if (
+        not state_data
+        or state_data.get("oauth_name") != oauth_provider.name
+        or "sub" in state_data
+    ):
+        raise _bad_request(ErrorCode.OAUTH_INVALID_STATE)
+
+    redirect_uri = str(
+        request.url_for("oauth_callback", oauth_name=oauth_provider.name)
+    )
+    token, account_id, account_email = await _exchange_code(
+        oauth_provider, code, redirect_uri
+    )
+    try:
+        user = await user_manager.oauth_callback(
+            oauth_provider.name,
+            token["access_token"],
+            account_id,
+            account_email,
+            token.get("expires_at"),
+            token.get("refresh_token"),
+            request,
+            associate_by_email=settings.OAUTH_ASSOCIATE_BY_EMAIL,
+        )
+    except UserAlreadyExists:
+        raise _bad_request(ErrorCode.OAUTH_USER_ALREADY_EXISTS)
+    except OAuthAccountAlreadyLinked:
+        raise _bad_request(ErrorCode.OAUTH_ACCOUNT_ALREADY_LINKED)
+    if not user.is_active:
+        raise _bad_request(ErrorCode.LOGIN_BAD_CREDENTIALS)
+
+    jti = None
+    if session_registry is not None:
+        jti = (await session_registry.create(user, request)).jti
+    access_token = await jwt_token_service.write_token(user, jti)
+    response = BearerResponse(access_token=access_token, token_type="bearer")
+    await user_manager.on_after_login(user, request, response)
+    return response
+
+
+@router.get(
+    "/{oauth_name}/associate/authorize",
+    response_model=OAuthAuthorizeResponse,
+    name="oauth_associate_authorize",
+)
+async def associate_authorize(
+    request: Request,
+    oauth_provider: Annotated[BaseOAuthProvider, Depends(get_oauth_provider)],
+    user: Annotated[UserSnapshot, Depends(current_active_user)],
+    scopes: Annotated[Optional[list[str]], Query()] = None,
+):
+    redirect_uri = str(
+        request.url_for("oauth_associate_callback", oauth_name=oauth_provider.name)
+    )
+    state = generate_state_token(
+        {"oauth_name": oauth_provider.name, "sub": str(user.id)}
+    )
+    return OAuthAuthorizeResponse(
+        authorization_url=oauth_provider.get_authorization_url(
+            redirect_uri, state, scopes
+        )
+    )
+
+
+@router.get(
+    "/{oauth_name}/associate/callback",
+    response_model=User,
+    name="oauth_associate_callback",
+    responses={
+        status.HTTP_400_BAD_REQUEST: {
+            "model": ErrorModel,
+            "content": {
+                "application/json": {
+                    "examples": {
+                        ErrorCode.OAUTH_INVALID_STATE: {
+                            "summary": "The state parameter is invalid or expired.",
+                            "value": {"detail": ErrorCode.OAUTH_INVALID_STATE},
+                        },
+                        ErrorCode.OAUTH_ACCOUNT_ALREADY_LINKED: {
+                            "summary": "The account is linked to another user.",
+                            "value": {"detail": ErrorCode.OAUTH_ACCOUNT_ALREADY_LINKED},
+                        },
+                    }
+                }
+            },
+        },
+    },
+)
+async def associate_callback(
+    request: Request,
+    code: str,
+    state: str,
+    oauth_provider: Annotated[BaseOAuthProvider, Depends(get_oauth_provider)],
+    user: Annotated[UserSnapshot, Depends(current_active_user)],
+    user_manager: Annotated[UserManager, Depends(get_user_manager)],
+):
+    state_data = decode_state_token(state)
+    if (
+        not state_data
+        or state_data.get("oauth_name") != oauth_provider.name
+        or state_data.get("sub") != str(user.id)
+    ):
+        raise _bad_request(ErrorCode.OAUTH_INVALID_STATE)
+
+    redirect_uri = str(
+        request.url_for("oauth_associate_callback", oauth_name=oauth_provider.name)
+    )
+    token, account_id, account_email = await _exchange_code(
+        oauth_provider, code, redirect_uri
+    )
+    try:
+        user = await user_manager.oauth_associate_callback(
+            user,
+            oauth_provider.name,
+            token["access_token"],
+            account_id,
+            account_email,
+            token.get("expires_at"),
+            token.get("refresh_token"),
+            request,
+        )
+    except OAuthAccountAlreadyLinked:
+        raise _bad_request(ErrorCode.OAUTH_ACCOUNT_ALREADY_LINKED)
+    return model_validate(User, user)
@@ -5,6 +5,7 @@ from fastapi import (
     HTTPException,
 )
 from typing import Annotated
+from user_service.src.api.dependencies import admission_control
 from user_service.src.core.exceptions import (
     InvalidPasswordException,
     UserAlreadyExists,
@@ -22,6 +23,7 @@ router = APIRouter()
     status_code=status.HTTP_201_CREATED,
     response_model=User,
     name="register",
+    dependencies=[Depends(admission_control("register"))],
     responses={
         status.HTTP_400_BAD_REQUEST: {
             "model": ErrorModel,
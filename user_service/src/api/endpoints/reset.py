@@ -0,0 +1,102 @@
+from typing import Annotated
+from fastapi import APIRouter, Body, Depends, HTTPException, Request, status
+from pydantic import EmailStr
+from user_service.src.api.dependencies import admission_control
+from user_service.src.core.exceptions import (
+    ErrorCode,
+    InvalidPasswordException,
+    InvalidResetPasswordToken,
+    UserInactive,
+    UserNotExists,
+    UserUpdateConflict,
+)
+from user_service.src.db.base import get_user_manager
+from user_service.src.db import UserManager
+from user_service.src.schemes import ErrorModel
+
+router = APIRouter()
+
+
+@router.post(
+    "/forgot-password",
+    status_code=status.HTTP_202_ACCEPTED,
+    name="forgot_password",
+)
+async def forgot_password(
+    request: Request,
+    email: Annotated[EmailStr, Body(embed=True)],
+    user_manager: Annotated[UserManager, Depends(get_user_manager)],
+):
+    # Always 202, so the endpoint does not reveal which emails are registered.
+    try:
+        user = await user_manager.get_user_by_email(email)
+        await user_manager.forgot_password(user, request)
+    except (UserNotExists, UserInactive):
+        pass
+    return None
+
+
+@router.post(
+    "/reset-password",
+    name="reset_password",
+    dependencies=[Depends(admission_control("reset_password"))],
+    responses={
+        status.HTTP_400_BAD_REQUEST: {
+            "model": ErrorModel,
+            "content": {
+                "application/json": {
+                    "examples": {
+                        ErrorCode.RESET_PASSWORD_BAD_TOKEN: {
+                            "summary": "Bad, expired or already used token.",
+                            "value": {"detail": ErrorCode.RESET_PASSWORD_BAD_TOKEN},
+                        },
+                        ErrorCode.RESET_PASSWORD_INVALID_PASSWORD: {
+                            "summary": "Password validation failed.",
+                            "value": {
+                                "detail": {
+                                    "error_code": ErrorCode.RESET_PASSWORD_INVALID_PASSWORD,
+                                    "message": "Password must be at least 8 characters long.",
+                                }
+                            },
+                        },
+                    }
+                }
+            },
+        },
+        status.HTTP_409_CONFLICT: {
+            "model": ErrorModel,
+            "content": {
+                "application/json": {
+                    "example": {"detail": ErrorCode.UPDATE_USER_CONFLICT},
+                }
+            },
+        },
+    },
+)
+async def reset_password(
+    request: Request,
+    token: Annotated[str, Body()],
+    password: Annotated[str, Body()],
+    user_manager: Annotated[UserManager, Depends(get_user_manager)],
+):
+    try:
+        await user_manager.reset_password(token, password, request)
+    except (InvalidResetPasswordToken, UserInactive):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=ErrorCode.RESET_PASSWORD_BAD_TOKEN,
+        )
+    except InvalidPasswordException as err:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "error_code": ErrorCode.RESET_PASSWORD_INVALID_PASSWORD,
+                "message": err.message,
+            },
+        )
+    except UserUpdateConflict:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=ErrorCode.UPDATE_USER_CONFLICT,
+        )
+    return None
@@ -0,0 +1,51 @@
+from typing import Annotated, Any, Optional
+from fastapi import APIRouter, Depends, HTTPException, status
+from user_service.src.api.dependencies import current_active_user, current_token_claims
+from user_service.src.db.base import get_session_registry
+from user_service.src.db.sessions import SessionRegistry
+from user_service.src.models import UserSnapshot
+from user_service.src.schemes import model_validate, Session
+
+router = APIRouter(prefix="/sessions")
+
+
+async def _get_session_registry(
+    session_registry: Annotated[
+        Optional[SessionRegistry], Depends(get_session_registry)
+    ],
+) -> SessionRegistry:
+    """
+    :raises HTTPException: 404 if session tracking is disabled.
+    """
+    if session_registry is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+    return session_registry
+
+
+@router.get("", response_model=list[Session], name="list_sessions")
+async def list_sessions(
+    user: Annotated[UserSnapshot, Depends(current_active_user)],
+    claims: Annotated[dict[str, Any], Depends(current_token_claims)],
+    session_registry: Annotated[SessionRegistry, Depends(_get_session_registry)],
+):
+    sessions = []
+    for user_session in await session_registry.list_sessions(user.id):
+        entry = model_validate(Session, user_session)
+        entry.current = user_session.jti == claims.get("jti")
+        sessions.append(entry)
+    return sessions
+
+
+@router.delete(
+    "/{jti}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    name="revoke_session",
+)
+async def revoke_session(
+    jti: str,
+    user: Annotated[UserSnapshot, Depends(current_active_user)],
+    session_registry: Annotated[SessionRegistry, Depends(_get_session_registry)],
+):
+    if not await session_registry.revoke(user.id, jti):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+    return None
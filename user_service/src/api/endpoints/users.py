@@ -0,0 +1,241 @@
+from typing import Annotated, Any, Optional
+from uuid import UUID
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from user_service.src.api.dependencies import (
+    current_active_user,
+    current_superuser,
+    current_token_claims,
+)
+from user_service.src.core.exceptions import (
+    ErrorCode,
+    InvalidCurrentPassword,
+    InvalidPasswordException,
+    UserAlreadyExists,
+    UserNotExists,
+    UserUpdateConflict,
+)
+from user_service.src.db.base import get_user_manager, get_session_registry
+from user_service.src.db import UserManager
+from user_service.src.db.sessions import SessionRegistry
+from user_service.src.models import UserSnapshot, UserTable
+from user_service.src.schemes import (
+    model_validate,
+    ErrorModel,
+    User,
+    UserBulkUpdate,
+    UserBulkUpdateResponse,
+    UserSelfUpdate,
+    UserUpdate,
+)
+
+router = APIRouter(prefix="/users")
+
+UPDATE_RESPONSES = {
+    status.HTTP_400_BAD_REQUEST: {
+        "model": ErrorModel,
+        "content": {
+            "application/json": {
+                "examples": {
+                    ErrorCode.UPDATE_USER_EMAIL_ALREADY_EXISTS: {
+                        "summary": "A user with this email already exists.",
+                        "value": {"detail": ErrorCode.UPDATE_USER_EMAIL_ALREADY_EXISTS},
+                    },
+                    ErrorCode.UPDATE_USER_BAD_CURRENT_PASSWORD: {
+                        "summary": "The current password is missing or wrong.",
+                        "value": {"detail": ErrorCode.UPDATE_USER_BAD_CURRENT_PASSWORD},
+                    },
+                    ErrorCode.UPDATE_USER_INVALID_PASSWORD: {
+                        "summary": "The password is invalid or unchanged.",
+                        "value": {
+                            "detail": {
+                                "error_code": ErrorCode.UPDATE_USER_INVALID_PASSWORD,
+                                "message": "Password must be at least 8 characters long.",
+                            }
+                        },
+                    },
+                }
+            }
+        },
+    },
+    status.HTTP_409_CONFLICT: {
+        "model": ErrorModel,
+        "content": {
+            "application/json": {
+                "example": {"detail": ErrorCode.UPDATE_USER_CONFLICT},
+            }
+        },
+    },
+}
+
+
+async def _get_user(
+    user_id: UUID, user_manager: Annotated[UserManager, Depends(get_user_manager)]
+) -> UserTable:
+    """
+    :raises HTTPException: 404 if the user does not exist in the tenant.
+    """
+    try:
+        return await user_manager.get_user_by_id(user_id)
+    except UserNotExists:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+
+
+async def _update_user(
+    user_manager: UserManager,
+    user: UserTable,
+    user_update: UserUpdate,
+    request: Request,
+    safe: bool,
+    current_password: Optional[str] = None,
+) -> User:
+    try:
+        updated_user = await user_manager.update_user(
+            user, user_update, request, safe=safe, current_password=current_password
+        )
+    except InvalidCurrentPassword:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=ErrorCode.UPDATE_USER_BAD_CURRENT_PASSWORD,
+        )
+    except InvalidPasswordException as err:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "error_code": ErrorCode.UPDATE_USER_INVALID_PASSWORD,
+                "message": err.message,
+            },
+        )
+    except UserAlreadyExists:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=ErrorCode.UPDATE_USER_EMAIL_ALREADY_EXISTS,
+        )
+    except UserUpdateConflict:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=ErrorCode.UPDATE_USER_CONFLICT,
+        )
+    return model_validate(User, updated_user)
+
+
+@router.get("/me", response_model=User, name="users_current_user")
+async def me(user: Annotated[UserSnapshot, Depends(current_active_user)]):
+    return user.to_user()
+
+
+@router.patch(
+    "/me",
+    response_model=User,
+    name="users_patch_current_user",
+    responses=UPDATE_RESPONSES,
+)
+async def update_me(
+    request: Request,
+    user_update: UserSelfUpdate,
+    current: Annotated[UserSnapshot, Depends(current_active_user)],
+    claims: Annotated[dict[str, Any], Depends(current_token_claims)],
+    user_manager: Annotated[UserManager, Depends(get_user_manager)],
+    session_registry: Annotated[
+        Optional[SessionRegistry], Depends(get_session_registry)
+    ],
+):
+    """
+    Updates the current user.
+
+    Changing the password or the email requires the current password, so a stolen token
+    alone cannot take over the account. A password change signs out every other session.
+    """
+    user = await _get_user(current.id, user_manager)
+    changes_credentials = user_update.password is not None or (
+        user_update.email is not None and user_update.email != user.email
+    )
+    if changes_credentials and user_update.current_password is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=ErrorCode.UPDATE_USER_BAD_CURRENT_PASSWORD,
+        )
+    updated_user = await _update_user(
+        user_manager,
+        user,
+        user_update,
+        request,
+        safe=True,
+        current_password=user_update.current_password,
+    )
+    # An unchanged password is rejected, so a successful update with one changed it.
+    if user_update.password is not None and session_registry is not None:
+        await session_registry.revoke_all(user.id, keep=claims.get("jti"))
+    return updated_user
+
+
+@router.delete(
+    "/me",
+    status_code=status.HTTP_204_NO_CONTENT,
+    name="users_delete_current_user",
+)
+async def delete_me(
+    request: Request,
+    current: Annotated[UserSnapshot, Depends(current_active_user)],
+    user_manager: Annotated[UserManager, Depends(get_user_manager)],
+):
+    user = await _get_user(current.id, user_manager)
+    await user_manager.delete_user(user, request)
+    return None
+
+
+@router.patch(
+    "",
+    response_model=UserBulkUpdateResponse,
+    name="users_bulk_update",
+    dependencies=[Depends(current_superuser)],
+)
+async def bulk_update(
+    request: Request,
+    bulk_update: UserBulkUpdate,
+    user_manager: Annotated[UserManager, Depends(get_user_manager)],
+):
+    updated = await user_manager.bulk_update_users(
+        bulk_update.ids, {"is_active": bulk_update.is_active}, request
+    )
+    return UserBulkUpdateResponse(updated=[identity.id for identity in updated])
+
+
+@router.get(
+    "/{user_id}",
+    response_model=User,
+    name="users_user",
+    dependencies=[Depends(current_superuser)],
+)
+async def get_user(user: Annotated[UserTable, Depends(_get_user)]):
+    return model_validate(User, user)
+
+
+@router.patch(
+    "/{user_id}",
+    response_model=User,
+    name="users_patch_user",
+    dependencies=[Depends(current_superuser)],
+    responses=UPDATE_RESPONSES,
+)
+async def update_user(
+    request: Request,
+    user_update: UserUpdate,
+    user: Annotated[UserTable, Depends(_get_user)],
+    user_manager: Annotated[UserManager, Depends(get_user_manager)],
+):
+    return await _update_user(user_manager, user, user_update, request, safe=False)
+
+
+@router.delete(
+    "/{user_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    name="users_delete_user",
+    dependencies=[Depends(current_superuser)],
+)
+async def delete_user(
+    request: Request,
+    user: Annotated[UserTable, Depends(_get_user)],
+    user_manager: Annotated[UserManager, Depends(get_user_manager)],
+):
+    await user_manager.delete_user(user, request)
+    return None
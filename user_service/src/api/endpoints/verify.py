@@ -0,0 +1,93 @@
+from typing import Annotated
+from fastapi import APIRouter, Body, Depends, HTTPException, Request, status
+from pydantic import EmailStr
+from user_service.src.core.exceptions import (
+    ErrorCode,
+    InvalidVerifyToken,
+    UserAlreadyVerified,
+    UserInactive,
+    UserNotExists,
+    UserUpdateConflict,
+)
+from user_service.src.db.base import get_user_manager
+from user_service.src.db import UserManager
+from user_service.src.schemes import model_validate, ErrorModel, User
+
+router = APIRouter()
+
+
+@router.post(
+    "/request-verify-token",
+    status_code=status.HTTP_202_ACCEPTED,
+    name="request_verify_token",
+)
+async def request_verify_token(
+    request: Request,
+    email: Annotated[EmailStr, Body(embed=True)],
+    user_manager: Annotated[UserManager, Depends(get_user_manager)],
+):
+    # Always 202, so the endpoint does not reveal which emails are registered.
+    try:
+        user = await user_manager.get_user_by_email(email)
+        await user_manager.request_verify(user, request)
+    except (UserNotExists, UserInactive, UserAlreadyVerified):
+        pass
+    return None
+
+
+@router.post(
+    "/verify",
+    response_model=User,
+    name="verify",
+    responses={
+        status.HTTP_400_BAD_REQUEST: {
+            "model": ErrorModel,
+            "content": {
+                "application/json": {
+                    "examples": {
+                        ErrorCode.VERIFY_USER_BAD_TOKEN: {
+                            "summary": "Bad token, not existing user or "
+                            "not the e-mail currently set for the user.",
+                            "value": {"detail": ErrorCode.VERIFY_USER_BAD_TOKEN},
+                        },
+                        ErrorCode.VERIFY_USER_ALREADY_VERIFIED: {
+                            "summary": "The user is already verified.",
+                            "value": {"detail": ErrorCode.VERIFY_USER_ALREADY_VERIFIED},
+                        },
+                    }
+                }
+            },
+        },
+        status.HTTP_409_CONFLICT: {
+            "model": ErrorModel,
+            "content": {
+                "application/json": {
+                    "example": {"detail": ErrorCode.UPDATE_USER_CONFLICT},
+                }
+            },
+        },
+    },
+)
+async def verify(
+    request: Request,
+    token: Annotated[str, Body(embed=True)],
+    user_manager: Annotated[UserManager, Depends(get_user_manager)],
+):
+    try:
+        user = await user_manager.verify(token, request)
+    except InvalidVerifyToken:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=ErrorCode.VERIFY_USER_BAD_TOKEN,
+        )
+    except UserAlreadyVerified:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=ErrorCode.VERIFY_USER_ALREADY_VERIFIED,
+        )
+    except UserUpdateConflict:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=ErrorCode.UPDATE_USER_CONFLICT,
+        )
+    return model_validate(User, user)
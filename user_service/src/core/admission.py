@@ -0,0 +1,133 @@
+import asyncio
+import heapq
+import itertools
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import AsyncIterator, Optional
+from user_service.src.core.config import settings
+from user_service.src.core.exceptions import ServiceOverloaded
+
+PRIORITY_AUTHENTICATED = 0
+PRIORITY_ANONYMOUS = 1
+
+# Priority of the current request. Raised once the request proved a valid bearer token,
+# so limiters deeper in the call, such as the password hashing one, favour it as well.
+request_priority: ContextVar[int] = ContextVar(
+    "request_priority", default=PRIORITY_ANONYMOUS
+)
+
+
+@dataclass
+class AdmissionMetrics:
+    admitted: int = 0
+    queued: int = 0
+    shed: int = 0
+    timed_out: int = 0
+
+
+class AdmissionLimiter:
+    """
+    Concurrency limit with a bounded, prioritized wait queue, for CPU-heavy work.
+
+    At most ``concurrency`` callers hold a slot at once. Further callers wait in a queue of
+    at most ``max_queue`` entries, served by priority and then in arrival order, so
+    authenticated requests overtake anonymous ones, and a freed slot is handed straight to
+    the next waiter. A caller that finds the queue full is shed at once and one that waited
+    ``queue_timeout`` seconds gives up; both get ``ServiceOverloaded``, answered with 503
+    and ``Retry-After``. Rejecting early keeps the latency of admitted requests bounded
+    instead of letting a backlog of slow work build up behind them.
+
+    :param name: Name of the limiter, e.g. the route it protects.
+    :param concurrency: Maximum number of callers holding a slot at once.
+    :param max_queue: Maximum number of waiting callers.
+    :param queue_timeout: Seconds a caller waits for a slot.
+    :param retry_after: Seconds suggested to rejected clients.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        concurrency: int,
+        *,
+        max_queue: int = settings.ADMISSION_MAX_QUEUE,
+        queue_timeout: float = settings.ADMISSION_QUEUE_TIMEOUT_SECONDS,
+        retry_after: int = settings.ADMISSION_RETRY_AFTER_SECONDS,
+    ):
+        self.name = name
+        self.concurrency = concurrency
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.retry_after = retry_after
+        self.metrics = AdmissionMetrics()
+        self.in_flight = 0
+        self._waiters: list[tuple[int, int, asyncio.Future]] = []
+        self._sequence = itertools.count()
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._waiters)
+
+    async def acquire(self, priority: Optional[int] = None) -> None:
+        """
+        Waits for a slot. Every successful call must be paired with ``release``.
+
+        :param priority: Lower is served first. Defaults to the request priority.
+        :raises ServiceOverloaded: If the queue is full or the wait timed out.
+        """
+        if self.in_flight < self.concurrency and not self._waiters:
+            self.in_flight += 1
+            self.metrics.admitted += 1
+            return
+        if len(self._waiters) >= self.max_queue:
+            self.metrics.shed += 1
+            raise ServiceOverloaded(self.retry_after)
+        if priority is None:
+            priority = request_priority.get()
+        future = asyncio.get_running_loop().create_future()
+        entry = (priority, next(self._sequence), future)
+        heapq.heappush(self._waiters, entry)
+        self.metrics.queued += 1
+        try:
+            await asyncio.wait_for(future, self.queue_timeout)
+        except asyncio.TimeoutError:
+            self._remove(entry)
+            self.metrics.timed_out += 1
+            raise ServiceOverloaded(self.retry_after)
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # The slot was handed over just before the caller went away.
+                self.release()
+            else:
+                self._remove(entry)
+            raise
+        self.metrics.admitted += 1
+
+    def release(self) -> None:
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                future.set_result(None)
+                return
+        self.in_flight -= 1
+
+    @asynccontextmanager
+    async def limit(self, priority: Optional[int] = None) -> AsyncIterator[None]:
+        await self.acquire(priority)
+        try:
+            yield
+        finally:
+            self.release()
+
+    def _remove(self, entry: tuple[int, int, asyncio.Future]) -> None:
+        try:
+            self._waiters.remove(entry)
+        except ValueError:
+            return
+        heapq.heapify(self._waiters)
+
+
+admission_limiters = {
+    name: AdmissionLimiter(name, concurrency)
+    for name, concurrency in settings.ADMISSION_ROUTE_CONCURRENCY.items()
+}
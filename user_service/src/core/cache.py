@@ -0,0 +1,150 @@
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, Optional, NamedTuple
+from user_service.src.core.config import settings
+
+
+class CacheEntry(NamedTuple):
+    value: dict[str, Any]
+    expires_at: float
+    subject: Optional[str]
+    jti: Optional[str]
+
+
+class TokenIntrospectionCache:
+    """
+    Bounded LRU cache of introspection results keyed by the SHA-256 digest of the token and
+    the tenant it was introspected in.
+
+    Tokens themselves are never stored. The tenant is part of the key because a token only
+    introspects as active in the tenant whose user it was issued to. Every entry expires at
+    the earliest of the token's ``exp`` claim and the configured TTL, so a cached answer can
+    never outlive the token and changes to the user (e.g. deactivation) are picked up after
+    at most one TTL. Entries can also be dropped explicitly per token, per subject or per
+    session (``jti``) when a token, user or session is revoked.
+
+    :param maxsize: The maximum number of entries kept in the cache.
+    :param ttl: The maximum lifetime of an entry, in seconds.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = settings.INTROSPECTION_CACHE_SIZE,
+        ttl: int = settings.INTROSPECTION_CACHE_TTL_SECONDS,
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[bytes, CacheEntry] = OrderedDict()
+        self._subjects: dict[str, set[bytes]] = {}
+        self._sessions: dict[str, set[bytes]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(
+        self, token: str, tenant_id: Optional[str] = None
+    ) -> Optional[dict[str, Any]]:
+        """
+        Returns the cached introspection result for the token, if it is still fresh.
+
+        :param token: The token as presented by the client.
+        :param tenant_id: The tenant the token was introspected in.
+        :return: The cached result, or None on a miss.
+        """
+        key = self._key(token, tenant_id)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= time.time():
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry.value
+
+    def set(
+        self,
+        token: str,
+        value: dict[str, Any],
+        expires_at: Optional[float] = None,
+        subject: Optional[str] = None,
+        jti: Optional[str] = None,
+        tenant_id: Optional[str] = None,
+    ) -> None:
+        """
+        Stores an introspection result for the token.
+
+        :param token: The token as presented by the client.
+        :param value: The introspection result.
+        :param expires_at: The ``exp`` claim of the token, as a UNIX timestamp.
+        :param subject: The ``sub`` claim of the token, used for per-subject invalidation.
+        :param jti: The ``jti`` claim of the token, used for per-session invalidation.
+        :param tenant_id: The tenant the token was introspected in.
+        """
+        deadline = time.time() + self.ttl
+        if expires_at is not None:
+            deadline = min(deadline, expires_at)
+        key = self._key(token, tenant_id)
+        self._remove(key)
+        self._entries[key] = CacheEntry(value, deadline, subject, jti)
+        if subject is not None:
+            self._subjects.setdefault(subject, set()).add(key)
+        if jti is not None:
+            self._sessions.setdefault(jti, set()).add(key)
+        while len(self._entries) > self.maxsize:
+            self._remove(next(iter(self._entries)))
+
+    def invalidate(self, token: str, tenant_id: Optional[str] = None) -> None:
+        self._remove(self._key(token, tenant_id))
+
+    def invalidate_subject(self, subject: str) -> None:
+        """
+        Drops every cached result for tokens issued to the given subject.
+
+        :param subject: The ``sub`` claim, i.e. the string form of the user ID.
+        """
+        for key in list(self._subjects.get(subject, ())):
+            self._remove(key)
+
+    def invalidate_session(self, jti: str) -> None:
+        """
+        Drops the cached results for tokens bound to the given session.
+
+        :param jti: The ``jti`` claim of the session's tokens.
+        """
+        for key in list(self._sessions.get(jti, ())):
+            self._remove(key)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._subjects.clear()
+        self._sessions.clear()
+
+    def _remove(self, key: bytes) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        _unindex(self._subjects, entry.subject, key)
+        _unindex(self._sessions, entry.jti, key)
+
+    @staticmethod
+    def _key(token: str, tenant_id: Optional[str]) -> bytes:
+        digest = hashlib.sha256(token.encode())
+        if tenant_id is not None:
+            digest.update(b"\0" + tenant_id.encode())
+        return digest.digest()
+
+
+def _unindex(index: dict[str, set[bytes]], name: Optional[str], key: bytes) -> None:
+    keys = index.get(name) if name is not None else None
+    if keys is not None:
+        keys.discard(key)
+        if not keys:
+            del index[name]
+
+
+introspection_cache = TokenIntrospectionCache()
+
+
+async def get_introspection_cache() -> TokenIntrospectionCache:
+    return introspection_cache
@@ -1,7 +1,8 @@
 from datetime import timedelta
 from pathlib import Path
 from dotenv import load_dotenv
-from pydantic import field_validator, PostgresDsn, ValidationInfo
+from typing import Literal, Optional
+from pydantic import BaseModel, field_validator, PostgresDsn, ValidationInfo
 from pydantic_settings import BaseSettings
 
 BASE_DIR = Path(__file__).parent.parent.parent.parent
@@ -10,14 +11,90 @@ ENV_PATH = BASE_DIR / "user_service" / ".env"
 load_dotenv(dotenv_path=ENV_PATH)
 
 
+class OAuthProviderSettings(BaseModel):
+    client_id: str
+    client_secret: str
+    authorize_endpoint: str
+    access_token_endpoint: str
+    userinfo_endpoint: str
+    refresh_token_endpoint: Optional[str] = None
+    scopes: list[str] = []
+    id_field: str = "sub"
+    email_field: str = "email"
+
+
 class Settings(BaseSettings):
     PROJECT_NAME: str
+    TENANT_HEADER: str = "X-Tenant-ID"
+    DEFAULT_TENANT_ID: Optional[str] = "default"
     JWT_ACCESS_TOKEN_EXPIRES_MINUTES: int = 60 * 24
     JWT_REFRESH_TOKEN_EXPIRES_MINUTES: int = 60 * 24 * 100
     JWT_AUDIENCE: str = "pyapp_fastapi"
     JWT_ALGORITHM: str = "RS256"
     JWT_PRIVATE_KEY: Path = BASE_DIR / "certs" / "private.pem"
     JWT_PUBLIC_KEY: Path = BASE_DIR / "certs" / "public.pem"
+    JWT_ADDITIONAL_PUBLIC_KEYS: list[Path] = []
+    JWKS_CACHE_MAX_AGE_SECONDS: int = 60 * 60
+    INTROSPECTION_CACHE_SIZE: int = 10_000
+    INTROSPECTION_CACHE_TTL_SECONDS: int = 60
+    VERIFY_TOKEN_EXPIRES_MINUTES: int = 60 * 24
+    RESET_PASSWORD_TOKEN_EXPIRES_MINUTES: int = 60
+    OAUTH_PROVIDERS: dict[str, OAuthProviderSettings] = {}
+    OAUTH_STATE_TOKEN_EXPIRES_MINUTES: int = 10
+    OAUTH_ASSOCIATE_BY_EMAIL: bool = False
+    OAUTH_REFRESH_ENABLED: bool = False
+    OAUTH_REFRESH_INTERVAL_SECONDS: float = 60
+    OAUTH_REFRESH_MARGIN_SECONDS: int = 5 * 60
+    OAUTH_REFRESH_BATCH_SIZE: int = 100
+    OAUTH_REFRESH_CONCURRENCY: int = 10
+    OAUTH_REFRESH_MAX_RETRIES: int = 3
+    OAUTH_REFRESH_BACKOFF_SECONDS: float = 0.5
+    EVENT_QUEUE_SIZE: int = 10_000
+    EVENT_WORKERS: int = 4
+    EVENT_MAX_ATTEMPTS: int = 5
+    EVENT_PUBLISH_TIMEOUT_SECONDS: float = 0.1
+    EVENT_OUTBOX_ENABLED: bool = False
+    OUTBOX_DISPATCH_INTERVAL_SECONDS: float = 1.0
+    OUTBOX_DISPATCH_BATCH_SIZE: int = 100
+    OUTBOX_MAX_ATTEMPTS: int = 10
+    OUTBOX_RETENTION_DAYS: int = 7
+    AUDIT_LOG_ENABLED: bool = True
+    AUDIT_LOG_BATCH_SIZE: int = 500
+    AUDIT_LOG_FLUSH_INTERVAL_SECONDS: float = 1.0
+    AUDIT_LOG_MAX_BUFFER: int = 50_000
+    SESSIONS_ENABLED: bool = False
+    SESSIONS_MAX_PER_USER: int = 10
+    SESSIONS_FLUSH_INTERVAL_SECONDS: float = 30
+    SESSIONS_CACHE_TTL_SECONDS: int = 30
+    SESSIONS_CACHE_SIZE: int = 100_000
+    MIGRATE_ON_STARTUP: bool = False
+    MIGRATION_LOCK_TIMEOUT_MS: int = 5_000
+    MIGRATION_BACKFILL_BATCH_SIZE: int = 1_000
+    MIGRATION_BACKFILL_PAUSE_SECONDS: float = 0.1
+    USER_UPDATE_MAX_RETRIES: int = 3
+    ADMISSION_CONTROL_ENABLED: bool = True
+    ADMISSION_ROUTE_CONCURRENCY: dict[str, int] = {
+        "login": 64,
+        "register": 32,
+        "reset_password": 32,
+    }
+    ADMISSION_MAX_QUEUE: int = 256
+    ADMISSION_QUEUE_TIMEOUT_SECONDS: float = 2.0
+    ADMISSION_RETRY_AFTER_SECONDS: int = 1
+    PASSWORD_HASHING_CONCURRENCY: int = 4
+    PASSWORD_HASHING_QUEUE_TIMEOUT_SECONDS: float = 10.0
+    USER_ARCHIVE_ENABLED: bool = False
+    USER_ARCHIVE_INTERVAL_SECONDS: float = 60 * 60
+    USER_ARCHIVE_BATCH_SIZE: int = 500
+    USER_ARCHIVE_INACTIVE_AFTER_DAYS: int = 180
+    USER_ARCHIVE_DELETED_AFTER_DAYS: int = 30
+    USER_DB_BACKEND: Literal["postgresql", "sqlite", "memory"] = "postgresql"
+    SQLITE_DB_PATH: Path = BASE_DIR / "user_service.db"
+    SQLITE_BUSY_TIMEOUT_MS: int = 5_000
+    SQLITE_CACHE_SIZE_KIB: int = 64 * 1024
+    SQLITE_MMAP_SIZE_BYTES: int = 256 * 1024 * 1024
+    MEMORY_DB_SNAPSHOT_PATH: Optional[Path] = None
+    MEMORY_DB_SNAPSHOT_INTERVAL_SECONDS: float = 30
     DATABASE_USER: str
     DATABASE_PASSWORD: str
     DATABASE_HOST: str
@@ -29,6 +106,8 @@ class Settings(BaseSettings):
     @field_validator("ASYNC_DB_URI", mode="after")
     @classmethod
     def db_uri(cls, v: str | None, info: ValidationInfo) -> str | None:
+        if isinstance(v, str) and v == "" and info.data["USER_DB_BACKEND"] == "sqlite":
+            return f"sqlite+aiosqlite:///{info.data['SQLITE_DB_PATH']}"
         if isinstance(v, str) and v == "":
             return str(
                 PostgresDsn.build(
@@ -0,0 +1,8 @@
+def normalize_email(email: str) -> str:
+    """
+    The canonical form of an email address, used wherever emails are stored or compared.
+
+    Matches SQL ``lower()``, which the ``lower(email)`` index on ``users`` is built on, so a
+    lookup hits the index however the email was cased when it was typed.
+    """
+    return email.strip().lower()
@@ -0,0 +1,202 @@
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime, UTC
+from typing import Any, Awaitable, Callable, Optional
+from uuid import UUID, uuid4
+from user_service.src.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+USER_REGISTERED = "user.registered"
+USER_UPDATED = "user.updated"
+USER_DELETED = "user.deleted"
+USER_LOGGED_IN = "user.logged_in"
+USER_LOGIN_FAILED = "user.login_failed"
+USER_VERIFY_REQUESTED = "user.verify_requested"
+USER_VERIFIED = "user.verified"
+USER_FORGOT_PASSWORD = "user.forgot_password"
+USER_PASSWORD_RESET = "user.password_reset"
+
+# Events written to the outbox by SQLAlchemyUserDatabase, in the same transaction as the change.
+OUTBOX_EVENTS = frozenset({USER_REGISTERED, USER_UPDATED, USER_DELETED})
+
+# Events recorded in the audit log.
+AUDIT_EVENTS = frozenset({USER_LOGGED_IN, USER_LOGIN_FAILED})
+
+
+@dataclass
+class Event:
+    """
+    A domain event. ``id`` is stable across redeliveries, so handlers can deduplicate.
+    """
+
+    type: str
+    payload: dict[str, Any]
+    id: UUID = field(default_factory=uuid4)
+    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    attempts: int = 0
+
+
+EventHandler = Callable[[Event], Awaitable[None]]
+
+
+def user_event_payload(user: Any, request: Optional[Any] = None) -> dict[str, Any]:
+    """
+    Builds the JSON-serializable payload shared by all user events.
+
+    :param user: The user the event is about.
+    :param request: Optional FastAPI Request object, used to record the client address and agent.
+    """
+    payload = {"user_id": str(user.id), "email": user.email}
+    if request is not None:
+        payload.update(request_event_context(request))
+    return payload
+
+
+def request_event_context(request: Any) -> dict[str, Any]:
+    """
+    The client address and agent of a request, as recorded in event payloads.
+    """
+    return {
+        "ip": request.client.host if request.client else None,
+        "user_agent": request.headers.get("user-agent"),
+    }
+
+
+@dataclass
+class EventBusMetrics:
+    published: int = 0
+    delivered: int = 0
+    retried: int = 0
+    failed: int = 0
+    dropped: int = 0
+    backpressure_waits: int = 0
+
+
+class EventBus:
+    """
+    In-process event bus with a bounded queue drained by a pool of worker tasks.
+
+    ``publish`` only enqueues, so side effects run off the request path. When the queue is
+    full the publisher waits up to ``publish_timeout`` seconds for room (backpressure) and
+    then drops the event. A handler that raises is retried until the event has been tried
+    ``max_attempts`` times, so handlers see every event at least once and must be idempotent.
+
+    :param maxsize: The maximum number of queued events.
+    :param workers: The number of worker tasks.
+    :param max_attempts: The maximum number of delivery attempts per event.
+    :param publish_timeout: Seconds a publisher waits for room in a full queue.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = settings.EVENT_QUEUE_SIZE,
+        workers: int = settings.EVENT_WORKERS,
+        max_attempts: int = settings.EVENT_MAX_ATTEMPTS,
+        publish_timeout: float = settings.EVENT_PUBLISH_TIMEOUT_SECONDS,
+    ):
+        self.maxsize = maxsize
+        self.workers = workers
+        self.max_attempts = max_attempts
+        self.publish_timeout = publish_timeout
+        self.metrics = EventBusMetrics()
+        self._handlers: dict[str, list[EventHandler]] = {}
+        self._queue: Optional[asyncio.Queue[Event]] = None
+        self._tasks: list[asyncio.Task] = []
+
+    @property
+    def queue(self) -> asyncio.Queue[Event]:
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.maxsize)
+        return self._queue
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queue.qsize() if self._queue is not None else 0
+
+    def subscribe(self, event_type: str, handler: EventHandler) -> None:
+        """
+        Registers a handler for an event type, or for every event with ``"*"``.
+        """
+        self._handlers.setdefault(event_type, []).append(handler)
+
+    async def publish(self, event: Event) -> bool:
+        """
+        Enqueues an event for asynchronous delivery.
+
+        :return: False if the queue stayed full for ``publish_timeout`` and the event was dropped.
+        """
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.metrics.backpressure_waits += 1
+            try:
+                await asyncio.wait_for(self.queue.put(event), self.publish_timeout)
+            except asyncio.TimeoutError:
+                self.metrics.dropped += 1
+                logger.warning("Event queue is full, dropping %s", event.type)
+                return False
+        self.metrics.published += 1
+        return True
+
+    async def dispatch(self, event: Event) -> bool:
+        """
+        Runs every handler subscribed to the event, inline.
+
+        :return: True if all handlers succeeded.
+        """
+        event.attempts += 1
+        handlers = self._handlers.get(event.type, []) + self._handlers.get("*", [])
+        results = await asyncio.gather(
+            *(handler(event) for handler in handlers), return_exceptions=True
+        )
+        errors = [result for result in results if isinstance(result, Exception)]
+        for error in errors:
+            logger.error("Handler failed for %s", event.type, exc_info=error)
+        if errors:
+            return False
+        self.metrics.delivered += 1
+        return True
+
+    def start(self) -> None:
+        if not self._tasks:
+            self._tasks = [
+                asyncio.create_task(self._worker()) for _ in range(self.workers)
+            ]
+
+    async def join(self) -> None:
+        await self.queue.join()
+
+    async def stop(self, drain: bool = True) -> None:
+        """
+        Stops the workers, by default after the queued events have been handled.
+        """
+        if drain and self._tasks:
+            await self.join()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def _worker(self) -> None:
+        while True:
+            event = await self.queue.get()
+            try:
+                if not await self.dispatch(event):
+                    if event.attempts < self.max_attempts:
+                        self.metrics.retried += 1
+                        self.queue.put_nowait(event)
+                    else:
+                        self.metrics.failed += 1
+            except asyncio.QueueFull:
+                self.metrics.failed += 1
+            finally:
+                self.queue.task_done()
+
+
+event_bus = EventBus()
+
+
+async def get_event_bus() -> EventBus:
+    return event_bus
@@ -26,6 +26,14 @@ class UserAlreadyExists(FastAPIUsersException):
     pass
 
 
+class UserUpdateConflict(FastAPIUsersException):
+    """
+    Exception raised when a user was changed concurrently since it was loaded.
+    """
+
+    pass
+
+
 class UserNotExists(FastAPIUsersException):
     """
     Exception raised when a user does not exist in the system.
@@ -72,11 +80,53 @@ class InvalidPasswordException(FastAPIUsersException):
 
     :param reason: The reason for the invalid password exception (e.g., too weak, incorrect format).
     """
+
     def __init__(self, message) -> None:
         super().__init__(message)
         self.message = message
 
 
+class InvalidCurrentPassword(FastAPIUsersException):
+    """
+    Exception raised when the current password given to confirm a change does not match.
+    """
+
+    pass
+
+
+class OAuthProviderError(FastAPIUsersException):
+    """
+    Exception raised when an OAuth provider rejects a request or returns an unexpected response.
+
+    :param permanent: Whether the same request can never succeed, e.g. because the provider
+        rejected the grant as revoked or expired.
+    """
+
+    def __init__(self, message, permanent: bool = False) -> None:
+        super().__init__(message)
+        self.permanent = permanent
+
+
+class OAuthAccountAlreadyLinked(FastAPIUsersException):
+    """
+    Exception raised when an OAuth account is already linked to another user.
+    """
+
+    pass
+
+
+class ServiceOverloaded(FastAPIUsersException):
+    """
+    Exception raised when a request is shed by admission control.
+
+    :param retry_after: Seconds the client should wait before retrying.
+    """
+
+    def __init__(self, retry_after: int) -> None:
+        super().__init__(retry_after)
+        self.retry_after = retry_after
+
+
 class ErrorCode(str, Enum):
     """
     Enum representing various error codes for user-related operations.
@@ -85,10 +135,14 @@ class ErrorCode(str, Enum):
     registration, verification, and password management.
     """
 
+    INVALID_TENANT = "INVALID_TENANT"
     REGISTER_INVALID_PASSWORD = "REGISTER_INVALID_PASSWORD"
     REGISTER_USER_ALREADY_EXISTS = "REGISTER_USER_ALREADY_EXISTS"
     OAUTH_NOT_AVAILABLE_EMAIL = "OAUTH_NOT_AVAILABLE_EMAIL"
     OAUTH_USER_ALREADY_EXISTS = "OAUTH_USER_ALREADY_EXISTS"
+    OAUTH_INVALID_STATE = "OAUTH_INVALID_STATE"
+    OAUTH_PROVIDER_ERROR = "OAUTH_PROVIDER_ERROR"
+    OAUTH_ACCOUNT_ALREADY_LINKED = "OAUTH_ACCOUNT_ALREADY_LINKED"
     LOGIN_BAD_CREDENTIALS = "LOGIN_BAD_CREDENTIALS"
     LOGIN_USER_NOT_VERIFIED = "LOGIN_USER_NOT_VERIFIED"
     RESET_PASSWORD_BAD_TOKEN = "RESET_PASSWORD_BAD_TOKEN"
@@ -97,6 +151,6 @@ class ErrorCode(str, Enum):
     VERIFY_USER_ALREADY_VERIFIED = "VERIFY_USER_ALREADY_VERIFIED"
     UPDATE_USER_EMAIL_ALREADY_EXISTS = "UPDATE_USER_EMAIL_ALREADY_EXISTS"
     UPDATE_USER_INVALID_PASSWORD = "UPDATE_USER_INVALID_PASSWORD"
-
-
-
+    UPDATE_USER_BAD_CURRENT_PASSWORD = "UPDATE_USER_BAD_CURRENT_PASSWORD"
+    UPDATE_USER_CONFLICT = "UPDATE_USER_CONFLICT"
+    SERVICE_OVERLOADED = "SERVICE_OVERLOADED"
@@ -1,4 +1,4 @@
-from typing import Protocol, TypeVar, Optional, Any, Union
+from typing import Protocol, Sequence, TypeVar, Optional, Any, Union
 
 from fastapi import Request
 from user_service.src.core.typing import StringType
@@ -68,21 +68,57 @@ class BaseUserDatabase(Protocol[UP, ID]):
 
     :method get_user_by_id: Fetch a user from the database by their unique identifier.
     :method get_user_by_email: Fetch a user from the database by their email address.
+    :method get_snapshot_by_id: Fetch a read-only snapshot of a user by their unique identifier.
+    :method get_snapshot_by_email: Fetch a read-only snapshot of a user by their email address.
+    :method get_credentials_by_email: Fetch only the columns needed to check a login.
+    :method get_identity_by_id: Fetch only the ID, email and active flag of a user.
     :method create_user: Create a new user in the database.
     :method update_user: Update an existing user's information in the database.
-    :method delete_user: Delete a user from the database.
+    :method delete_user: Soft-delete a user, hiding it from every lookup.
+    :method bulk_update_users: Set the same values on many users in one statement.
+    :method get_by_oauth_account: Fetch a user by a linked OAuth account.
+    :method upsert_oauth_account: Link an OAuth account to a user or refresh its tokens.
     """
 
     async def get_user_by_id(self, user_id: ID) -> Optional[UP]: ...
 
     async def get_user_by_email(self, email: StringType) -> Optional[UP]: ...
 
+    async def get_snapshot_by_id(self, user_id: ID) -> Optional[UserProtocol]: ...
+
+    async def get_snapshot_by_email(
+        self, email: StringType
+    ) -> Optional[UserProtocol]: ...
+
+    async def get_credentials_by_email(self, email: StringType) -> Optional[Any]: ...
+
+    async def get_identity_by_id(self, user_id: ID) -> Optional[Any]: ...
+
     async def create_user(self, create_dict: dict[str, Any]) -> UP: ...
 
-    async def update_user(self, update_user: UP, update_dict: dict[str, Any]) -> UP: ...
+    async def update_user(
+        self,
+        update_user: UP,
+        update_dict: dict[str, Any],
+        *,
+        emit_event: bool = True,
+        expected_version: Optional[int] = None,
+    ) -> UP: ...
 
     async def delete_user(self, delete_user: UP) -> None: ...
 
+    async def bulk_update_users(
+        self, user_ids: Sequence[ID], update_dict: dict[str, Any]
+    ) -> list[Any]: ...
+
+    async def get_by_oauth_account(
+        self, oauth: str, account_id: str
+    ) -> Optional[UP]: ...
+
+    async def upsert_oauth_account(
+        self, user: UP, create_dict: dict[str, Any], *, emit_event: bool = False
+    ) -> UP: ...
+
 
 class BaseUserManager(Protocol[UP, ID]):
     """
@@ -92,13 +128,16 @@ class BaseUserManager(Protocol[UP, ID]):
 
     :method get_user_by_email: Fetch a user by their email address.
     :method get_user_by_id: Fetch a user by their unique identifier.
+    :method get_snapshot_by_id: Fetch a read-only snapshot of a user by their unique identifier.
     :method create_user: Create a new user in the system.
     :method update_user: Update an existing user's information.
+    :method delete_user: Delete a user.
     """
 
     async def parse_id(self, user_id: Any) -> ID: ...
     async def get_user_by_email(self, email: StringType) -> Optional[UP]: ...
     async def get_user_by_id(self, user_id: ID) -> Optional[UP]: ...
+    async def get_snapshot_by_id(self, user_id: ID) -> UserProtocol: ...
     async def create_user(
         self, create_dict: UserCreate, request: Optional[Request] = None
     ) -> UP: ...
@@ -108,8 +147,14 @@ class BaseUserManager(Protocol[UP, ID]):
         update_user: UP,
         update_dict: UserUpdate,
         request: Optional[Request] = None,
+        *,
+        safe: bool = True,
     ) -> UP: ...
 
+    async def delete_user(
+        self, user: UP, request: Optional[Request] = None
+    ) -> None: ...
+
 
 class BaseTokenService(Protocol[UP, ID]):
     """
@@ -119,12 +164,43 @@ class BaseTokenService(Protocol[UP, ID]):
     allowing it to be used with various types of tokens (e.g., JWT, OAuth, etc.).
     It can be implemented to handle different types of authentication tokens for different users.
 
+    :method read_claims: Validates and decodes the provided token without loading the user.
     :method read_token: Validates and decodes the provided token, returning the corresponding user if valid.
     :method write_token: Generates a token for the current user.
     """
 
+    async def read_claims(self, token: Optional[str]) -> Optional[dict[str, Any]]: ...
+
     async def read_token(
         self, token: Optional[str], user_manager: BaseUserManager[UP, ID]
-    ) -> Optional[UP]: ...
-    async def write_token(self, current_user: UP) -> str: ...
+    ) -> Optional[UserProtocol]: ...
+    async def write_token(self, current_user: UP, jti: Optional[str] = None) -> str: ...
     async def destroy_token(self, token: str, user: UP) -> None: ...
+
+
+class BaseOAuthProvider(Protocol):
+    """
+    Protocol for an OAuth2 identity provider.
+
+    :method get_authorization_url: Build the URL the user is redirected to for consent.
+    :method get_access_token: Exchange an authorization code for tokens.
+    :method refresh_token: Exchange a refresh token for new tokens.
+    :method get_id_email: Fetch the provider account ID and email for an access token.
+    :method aclose: Release the provider's HTTP connections.
+    """
+
+    name: str
+
+    def get_authorization_url(
+        self, redirect_uri: str, state: str, scopes: Optional[list[str]] = None
+    ) -> str: ...
+
+    async def get_access_token(
+        self, code: str, redirect_uri: str
+    ) -> dict[str, Any]: ...
+
+    async def refresh_token(self, refresh_token: str) -> dict[str, Any]: ...
+
+    async def get_id_email(self, access_token: str) -> tuple[str, Optional[str]]: ...
+
+    async def aclose(self) -> None: ...
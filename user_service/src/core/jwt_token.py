@@ -1,9 +1,10 @@
 from datetime import datetime, UTC
-from typing import Optional
+from typing import Optional, Sequence, Any
 from uuid import UUID
 
+import jwt
 from user_service.src.core.exceptions import UserNotExists, InvalidID
-from user_service.src.core.security import decode_jwt, encode_jwt
+from user_service.src.core.security import decode_jwt, encode_jwt, get_key_id
 from user_service.src.core.config import settings
 from user_service.src.core.interfaces import (
     BaseTokenService,
@@ -11,7 +12,7 @@ from user_service.src.core.interfaces import (
     BaseUserManager,
     ID,
 )
-from user_service.src.models import UserTable
+from user_service.src.models import UserTable, UserSnapshot
 from jwt import PyJWTError
 
 
@@ -38,6 +39,9 @@ class JWTTokenService(BaseTokenService[UP, ID]):
         algorithm: str = settings.JWT_ALGORITHM,
         public_key: str = settings.JWT_PUBLIC_KEY.read_text(),
         private_key: str = settings.JWT_PRIVATE_KEY.read_text(),
+        additional_public_keys: Sequence[str] = tuple(
+            path.read_text() for path in settings.JWT_ADDITIONAL_PUBLIC_KEYS
+        ),
     ):
         """
         Initializes the JWTTokenService with configuration values.
@@ -47,14 +51,21 @@ class JWTTokenService(BaseTokenService[UP, ID]):
         :param algorithm: The algorithm used to sign the JWT token.
         :param public_key: The public key used to verify the JWT token.
         :param private_key: The private key used to sign the JWT token.
+        :param additional_public_keys: Public keys that are still accepted for verification
+            during a key rotation, e.g. the previous signing key.
         """
         self.token_expires_delta = token_expires_delta
         self.token_audience = token_audience
         self.algorithm = algorithm
         self.public_key = public_key
         self.private_key = private_key
+        self.key_id = get_key_id(public_key, algorithm)
+        self.verification_keys: dict[str, str] = {self.key_id: public_key}
+        for additional_public_key in additional_public_keys:
+            kid = get_key_id(additional_public_key, algorithm)
+            self.verification_keys.setdefault(kid, additional_public_key)
 
-    async def write_token(self, current_user: UP) -> str:
+    async def write_token(self, current_user: UP, jti: Optional[str] = None) -> str:
         """
         Generates a JWT token for the specified user.
 
@@ -63,6 +74,7 @@ class JWTTokenService(BaseTokenService[UP, ID]):
         delta.
 
         :param current_user: The user for whom the JWT token will be created.
+        :param jti: Optional token ID, set when the token is bound to a registered session.
         :return: A signed JWT token as a string.
         """
         payload = {
@@ -71,52 +83,91 @@ class JWTTokenService(BaseTokenService[UP, ID]):
             "aud": self.token_audience,
             "iat": datetime.now(UTC).timestamp(),
         }
+        if jti is not None:
+            payload["jti"] = jti
         return encode_jwt(
             payload=payload,
             key=self.private_key,
             token_expires_delta=self.token_expires_delta,
             algorithm=self.algorithm,
+            header={"kid": self.key_id},
         )
 
-    async def read_token(
-        self, token: Optional[str], user_manager: BaseUserManager[UserTable, UUID]
-    ) -> Optional[UserTable]:
+    async def read_claims(self, token: Optional[str]) -> Optional[dict[str, Any]]:
         """
-        Decodes and validates the given JWT token.
+        Verifies the signature, audience and expiry of the given JWT token.
 
-        This method decodes the JWT token and checks the validity of the token. If the token is valid,
-        it retrieves the associated user from the database using the decoded user ID. If any validation
-        fails (e.g., token is invalid or user not found), it returns None.
+        Unlike ``read_token`` this never touches the database, which makes it suitable for
+        callers that only need the claims.
 
         :param token: The JWT token to be validated and decoded.
-        :param user_manager: An instance of the user manager used to fetch user data.
-        :return: The corresponding UserTable instance if the token is valid, or None if the token is invalid.
+        :return: The decoded claims if the token is valid, or None otherwise.
         """
         if not token:
             return None
 
         try:
-            decoded_jwt = decode_jwt(
+            public_key = self._get_verification_key(token)
+            if not public_key:
+                return None
+            return decode_jwt(
                 token,
-                key=self.public_key,
+                key=public_key,
                 token_audience=self.token_audience,
                 algorithm=self.algorithm,
             )
-            user_id = decoded_jwt.get("sub")
-            if not user_id:
-                return None
         except PyJWTError:
             return None
 
+    async def read_token(
+        self, token: Optional[str], user_manager: BaseUserManager[UserTable, UUID]
+    ) -> Optional[UserSnapshot]:
+        """
+        Decodes and validates the given JWT token.
+
+        This method decodes the JWT token and checks the validity of the token. If the token is valid,
+        it retrieves a snapshot of the associated user from the database using the decoded user ID. If any
+        validation fails (e.g., token is invalid or user not found), it returns None.
+
+        :param token: The JWT token to be validated and decoded.
+        :param user_manager: An instance of the user manager used to fetch user data.
+        :return: The snapshot of the corresponding user if the token is valid, or None if the token is invalid.
+        """
+        decoded_jwt = await self.read_claims(token)
+        if not decoded_jwt:
+            return None
+        user_id = decoded_jwt.get("sub")
+        if not user_id:
+            return None
+
         try:
             parsed_id = await user_manager.parse_id(user_id)
-            return await user_manager.get_user_by_id(parsed_id)
+            return await user_manager.get_snapshot_by_id(parsed_id)
         except (UserNotExists, InvalidID):
             return None
 
     async def destroy_token(self, token: str, user: UP) -> None:
-        raise JWTTokenServiceDestroyNotSupportedError("Token destroy is not supported for JWT. It`s valid until it expires")
+        raise JWTTokenServiceDestroyNotSupportedError(
+            "Token destroy is not supported for JWT. It`s valid until it expires"
+        )
 
-async def get_jwt_token_service():
-    return JWTTokenService()
+    def _get_verification_key(self, token: str) -> Optional[str]:
+        """
+        Picks the public key matching the ``kid`` header of the token.
 
+        Tokens issued before key ids were introduced carry no ``kid`` and are verified
+        with the current public key. Tokens with an unknown ``kid`` are rejected.
+
+        :raises PyJWTError: If the token header cannot be decoded.
+        """
+        kid = jwt.get_unverified_header(token).get("kid")
+        if kid is None:
+            return self.public_key
+        return self.verification_keys.get(kid)
+
+
+jwt_token_service = JWTTokenService()
+
+
+async def get_jwt_token_service():
+    return jwt_token_service
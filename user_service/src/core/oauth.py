@@ -0,0 +1,195 @@
+import time
+from typing import Any, Optional, Sequence
+from urllib.parse import urlencode
+import httpx
+from jwt import PyJWTError
+from user_service.src.core.config import settings
+from user_service.src.core.exceptions import OAuthProviderError
+from user_service.src.core.interfaces import BaseOAuthProvider
+from user_service.src.core.security import encode_jwt, decode_jwt
+
+STATE_TOKEN_AUDIENCE = "user_service:oauth-state"
+
+
+class OAuth2Provider(BaseOAuthProvider):
+    """
+    Generic OAuth2 authorization code provider.
+
+    The HTTP client is created once and reused, so calls to the provider share pooled
+    keep-alive connections instead of opening a new TLS connection per callback.
+
+    :param name: The provider name used in URLs and stored as ``oauth_name``.
+    :param client_id: The client ID registered with the provider.
+    :param client_secret: The client secret registered with the provider.
+    :param authorize_endpoint: The URL the user is redirected to for consent.
+    :param access_token_endpoint: The URL used to exchange codes for tokens.
+    :param userinfo_endpoint: The URL returning the account ID and email.
+    :param refresh_token_endpoint: The URL used to refresh tokens, defaults to the access token endpoint.
+    :param scopes: The scopes requested by default.
+    :param id_field: The userinfo field holding the account ID.
+    :param email_field: The userinfo field holding the account email.
+    :param transport: Optional httpx transport, e.g. to talk to a stand-in provider in tests.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        client_id: str,
+        client_secret: str,
+        authorize_endpoint: str,
+        access_token_endpoint: str,
+        userinfo_endpoint: str,
+        refresh_token_endpoint: Optional[str] = None,
+        scopes: Sequence[str] = (),
+        id_field: str = "sub",
+        email_field: str = "email",
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.name = name
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self.authorize_endpoint = authorize_endpoint
+        self.access_token_endpoint = access_token_endpoint
+        self.userinfo_endpoint = userinfo_endpoint
+        self.refresh_token_endpoint = refresh_token_endpoint or access_token_endpoint
+        self.scopes = list(scopes)
+        self.id_field = id_field
+        self.email_field = email_field
+        self.transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(transport=self.transport, timeout=10.0)
+        return self._client
+
+    def get_authorization_url(
+        self, redirect_uri: str, state: str, scopes: Optional[list[str]] = None
+    ) -> str:
+        params = {
+            "response_type": "code",
+            "client_id": self.client_id,
+            "redirect_uri": redirect_uri,
+            "state": state,
+        }
+        scopes = scopes or self.scopes
+        if scopes:
+            params["scope"] = " ".join(scopes)
+        return f"{self.authorize_endpoint}?{urlencode(params)}"
+
+    async def get_access_token(self, code: str, redirect_uri: str) -> dict[str, Any]:
+        return await self._request_token(
+            self.access_token_endpoint,
+            {
+                "grant_type": "authorization_code",
+                "code": code,
+                "redirect_uri": redirect_uri,
+            },
+        )
+
+    async def refresh_token(self, refresh_token: str) -> dict[str, Any]:
+        return await self._request_token(
+            self.refresh_token_endpoint,
+            {
+                "grant_type": "refresh_token",
+                "refresh_token": refresh_token,
+            },
+        )
+
+    async def get_id_email(self, access_token: str) -> tuple[str, Optional[str]]:
+        try:
+            response = await self.client.get(
+                self.userinfo_endpoint,
+                headers={"Authorization": f"Bearer {access_token}"},
+            )
+        except httpx.HTTPError as e:
+            raise OAuthProviderError(
+                f"{self.name} userinfo request failed: {e!r}"
+            ) from e
+        if response.status_code != httpx.codes.OK:
+            raise OAuthProviderError(
+                f"{self.name} userinfo request failed with {response.status_code}"
+            )
+        data = self._parse_json(response, "userinfo")
+        if self.id_field not in data:
+            raise OAuthProviderError(f"{self.name} userinfo response has no account ID")
+        return str(data[self.id_field]), data.get(self.email_field)
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _request_token(self, url: str, data: dict[str, str]) -> dict[str, Any]:
+        try:
+            response = await self.client.post(
+                url,
+                data={
+                    **data,
+                    "client_id": self.client_id,
+                    "client_secret": self.client_secret,
+                },
+                headers={"Accept": "application/json"},
+            )
+        except httpx.HTTPError as e:
+            raise OAuthProviderError(f"{self.name} token request failed: {e!r}") from e
+        if response.status_code != httpx.codes.OK:
+            raise OAuthProviderError(
+                f"{self.name} token request failed with {response.status_code}",
+                permanent=_is_invalid_grant(response),
+            )
+        token = self._parse_json(response, "token")
+        if "access_token" not in token:
+            raise OAuthProviderError(f"{self.name} token response has no access token")
+        if "expires_in" in token and "expires_at" not in token:
+            token["expires_at"] = int(time.time()) + int(token["expires_in"])
+        return token
+
+    def _parse_json(self, response: httpx.Response, request: str) -> dict[str, Any]:
+        try:
+            data = response.json()
+        except ValueError as e:
+            raise OAuthProviderError(
+                f"{self.name} {request} response is not JSON"
+            ) from e
+        if not isinstance(data, dict):
+            raise OAuthProviderError(f"{self.name} {request} response is not an object")
+        return data
+
+
+def _is_invalid_grant(response: httpx.Response) -> bool:
+    # RFC 6749 section 5.2: the code or refresh token is invalid, expired or revoked.
+    if response.status_code not in (httpx.codes.BAD_REQUEST, httpx.codes.UNAUTHORIZED):
+        return False
+    try:
+        data = response.json()
+    except ValueError:
+        return False
+    return isinstance(data, dict) and data.get("error") == "invalid_grant"
+
+
+def generate_state_token(
+    data: dict[str, str],
+    token_expires_delta: int = settings.OAUTH_STATE_TOKEN_EXPIRES_MINUTES,
+) -> str:
+    """
+    Signs the OAuth ``state`` parameter, so callbacks need no server-side state storage.
+    """
+    return encode_jwt(
+        payload={**data, "aud": STATE_TOKEN_AUDIENCE},
+        token_expires_delta=token_expires_delta,
+    )
+
+
+def decode_state_token(token: str) -> Optional[dict[str, Any]]:
+    try:
+        return decode_jwt(token, token_audience=STATE_TOKEN_AUDIENCE)
+    except PyJWTError:
+        return None
+
+
+oauth_providers: dict[str, BaseOAuthProvider] = {
+    name: OAuth2Provider(name=name, **provider.model_dump())
+    for name, provider in settings.OAUTH_PROVIDERS.items()
+}
@@ -1,13 +1,29 @@
+import asyncio
+import hashlib
+import json
+from base64 import urlsafe_b64encode
 from datetime import timedelta, datetime, UTC
-from typing import Union, Any, Optional
+from functools import lru_cache
+from typing import Callable, TypeVar, Union, Any, Optional
 from passlib.context import CryptContext
 import jwt
+from user_service.src.core.admission import AdmissionLimiter
 from user_service.src.core.config import settings
 from user_service.src.core.exceptions import InvalidPasswordException
 from user_service.src.core.typing import StringType
 
+T = TypeVar("T")
+
 password_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# Requests reaching a hash were already admitted by their route, so they get a longer wait
+# than the route queues rather than being shed halfway through.
+password_hashing_limiter = AdmissionLimiter(
+    "password_hashing",
+    settings.PASSWORD_HASHING_CONCURRENCY,
+    queue_timeout=settings.PASSWORD_HASHING_QUEUE_TIMEOUT_SECONDS,
+)
+
 
 def hash_password(password: str) -> str:
     return password_context.hash(password)
@@ -17,6 +33,22 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return password_context.verify(plain_password, hashed_password)
 
 
+async def run_password_hashing(func: Callable[..., T], *args: Any) -> T:
+    """
+    Runs a password hashing function, such as ``hash_password``, in a worker thread.
+
+    bcrypt releases the GIL, so hashes run in parallel and the event loop keeps serving
+    cheap requests meanwhile. With admission control enabled, at most
+    ``PASSWORD_HASHING_CONCURRENCY`` hashes run at once, around one per core; further
+    callers queue in ``password_hashing_limiter``, authenticated requests first, and are
+    shed with ``ServiceOverloaded`` once it is full.
+    """
+    if not settings.ADMISSION_CONTROL_ENABLED:
+        return await asyncio.to_thread(func, *args)
+    async with password_hashing_limiter.limit():
+        return await asyncio.to_thread(func, *args)
+
+
 def validate_password(password: str):
     if len(password) < 8:
         raise InvalidPasswordException("Password must be at least 8 characters long.")
@@ -33,6 +65,17 @@ def verify_and_update_password(
     return password_context.verify_and_update(plain_password, hashed_password)
 
 
+def get_password_fingerprint(hashed_password: str) -> str:
+    """
+    Digest of a password hash, embedded in single-use tokens such as reset tokens.
+
+    The token is bound to the password it was issued for: once the password changes the
+    fingerprint no longer matches, so the token is spent without storing it anywhere.
+    Comparing fingerprints costs one SHA-256 instead of a second slow password hash.
+    """
+    return hashlib.sha256(hashed_password.encode()).hexdigest()
+
+
 def encode_jwt(
     payload: dict[str, Any],
     key: str = settings.JWT_PRIVATE_KEY.read_text(),
@@ -65,3 +108,43 @@ def decode_jwt(
         algorithms=[algorithm],
     )
     return jwt_decoded
+
+
+JWK_THUMBPRINT_MEMBERS = {
+    "RSA": ("e", "kty", "n"),
+    "EC": ("crv", "kty", "x", "y"),
+    "OKP": ("crv", "kty", "x"),
+}
+
+
+@lru_cache(maxsize=32)
+def get_public_jwk(
+    public_key: str,
+    algorithm: str = settings.JWT_ALGORITHM,
+) -> dict[str, str]:
+    """
+    Converts a PEM encoded public key into a JSON Web Key (RFC 7517).
+
+    The key id is the RFC 7638 thumbprint of the key, so it is stable across restarts and
+    identical on every instance that loads the same PEM file. The result is cached because
+    parsing the PEM is far more expensive than the lookup itself.
+
+    :param public_key: The PEM encoded public key.
+    :param algorithm: The JWT algorithm the key is used with.
+    :return: The public JWK with ``kid``, ``alg`` and ``use`` members set.
+    """
+    jwt_algorithm = jwt.get_algorithm_by_name(algorithm)
+    jwk = jwt_algorithm.to_jwk(jwt_algorithm.prepare_key(public_key), as_dict=True)
+    jwk.pop("key_ops", None)
+    members = {name: jwk[name] for name in JWK_THUMBPRINT_MEMBERS[jwk["kty"]]}
+    digest = hashlib.sha256(
+        json.dumps(members, separators=(",", ":"), sort_keys=True).encode()
+    ).digest()
+    jwk["kid"] = urlsafe_b64encode(digest).rstrip(b"=").decode()
+    jwk["alg"] = algorithm
+    jwk["use"] = "sig"
+    return jwk
+
+
+def get_key_id(public_key: str, algorithm: str = settings.JWT_ALGORITHM) -> str:
+    return get_public_jwk(public_key, algorithm)["kid"]
@@ -0,0 +1,33 @@
+import re
+from typing import Annotated, Optional
+from fastapi import Header, HTTPException, Request, status
+from user_service.src.core.config import settings
+from user_service.src.core.exceptions import ErrorCode
+
+TENANT_ID_PATTERN = re.compile(r"[A-Za-z0-9_-]{1,64}")
+
+
+async def get_tenant_id(
+    request: Request,
+    tenant_id: Annotated[Optional[str], Header(alias=settings.TENANT_HEADER)] = None,
+) -> str:
+    """
+    Resolves the tenant of the request from the tenant header.
+
+    The header is typically set by the ingress from the host name, so browser redirects
+    such as OAuth callbacks carry it too. Requests without it fall back to
+    ``DEFAULT_TENANT_ID``. The result is stored on ``request.state`` so hooks and
+    middleware see the same tenant without parsing the header again.
+
+    :raises HTTPException: 400 if the tenant is missing and there is no default, or malformed.
+    """
+    resolved = getattr(request.state, "tenant_id", None)
+    if resolved is None:
+        resolved = tenant_id or settings.DEFAULT_TENANT_ID
+        if resolved is None or not TENANT_ID_PATTERN.fullmatch(resolved):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=ErrorCode.INVALID_TENANT,
+            )
+        request.state.tenant_id = resolved
+    return resolved
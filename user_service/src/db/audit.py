@@ -0,0 +1,218 @@
+import asyncio
+import logging
+from dataclasses import dataclass
+from datetime import datetime, UTC
+from typing import Any, Optional
+from uuid import UUID, uuid4
+from sqlalchemy import insert, select, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from user_service.src.core.config import settings
+from user_service.src.core.events import Event, EventBus, AUDIT_EVENTS
+from user_service.src.models import AuditLogTable
+from user_service.src.workers.base import PeriodicWorker
+
+logger = logging.getLogger(__name__)
+
+AUDIT_LOG_COLUMNS = ("id", "ts", "event_type", "user_id", "email", "ip", "user_agent")
+
+
+@dataclass
+class AuditLogMetrics:
+    recorded: int = 0
+    written: int = 0
+    dropped: int = 0
+    flushes: int = 0
+
+
+class AuditLog(PeriodicWorker):
+    """
+    Buffered writer and query API for the audit log.
+
+    ``record`` only appends to an in-memory buffer, so logging a login costs no database
+    round trip. The buffer is written in one statement when it reaches ``batch_size`` rows
+    or every ``interval`` seconds, whichever comes first: with ``COPY`` on asyncpg and a
+    multi-row INSERT elsewhere. Rows of a failed flush are put back and retried with the
+    next one; past ``max_buffer`` rows the oldest are dropped, so a database outage cannot
+    exhaust memory.
+
+    :param session_maker: The factory used to open a session per flush or query.
+    :param audit_log_table: The SQLAlchemy model representing the audit log table.
+    :param batch_size: Number of buffered rows that triggers a flush.
+    :param interval: Seconds between time-based flushes.
+    :param max_buffer: Maximum number of buffered rows.
+    """
+
+    def __init__(
+        self,
+        session_maker: async_sessionmaker[AsyncSession],
+        audit_log_table: type[AuditLogTable] = AuditLogTable,
+        *,
+        batch_size: int = settings.AUDIT_LOG_BATCH_SIZE,
+        interval: float = settings.AUDIT_LOG_FLUSH_INTERVAL_SECONDS,
+        max_buffer: int = settings.AUDIT_LOG_MAX_BUFFER,
+    ):
+        super().__init__(interval)
+        self.session_maker = session_maker
+        self.audit_log_table = audit_log_table
+        self.batch_size = batch_size
+        self.max_buffer = max_buffer
+        self.metrics = AuditLogMetrics()
+        self._buffer: list[dict[str, Any]] = []
+        self._lock = asyncio.Lock()
+        self._flush_task: Optional[asyncio.Task] = None
+        self._partitions: set[tuple[int, int]] = set()
+
+    def subscribe(self, event_bus: EventBus) -> None:
+        for event_type in AUDIT_EVENTS:
+            event_bus.subscribe(event_type, self.handle_event)
+
+    async def handle_event(self, event: Event) -> None:
+        user_id = event.payload.get("user_id")
+        self.record(
+            event.type,
+            user_id=UUID(user_id) if user_id else None,
+            email=event.payload.get("email"),
+            ip=event.payload.get("ip"),
+            user_agent=event.payload.get("user_agent"),
+            ts=event.created_at,
+            id=event.id,
+        )
+
+    def record(
+        self,
+        event_type: str,
+        *,
+        user_id: Optional[UUID] = None,
+        email: Optional[str] = None,
+        ip: Optional[str] = None,
+        user_agent: Optional[str] = None,
+        ts: Optional[datetime] = None,
+        id: Optional[UUID] = None,
+    ) -> None:
+        """
+        Buffers an audit record. Never blocks and never touches the database.
+        """
+        self._buffer.append(
+            {
+                "id": id or uuid4(),
+                "ts": ts or datetime.now(UTC),
+                "event_type": event_type,
+                "user_id": user_id,
+                "email": email[:100] if email else None,
+                "ip": ip,
+                "user_agent": user_agent[:255] if user_agent else None,
+            }
+        )
+        self.metrics.recorded += 1
+        self._trim()
+        if len(self._buffer) >= self.batch_size and (
+            self._flush_task is None or self._flush_task.done()
+        ):
+            self._flush_task = asyncio.create_task(self._flush_quietly())
+
+    async def run_once(self) -> int:
+        return await self.flush()
+
+    async def stop(self) -> None:
+        await super().stop()
+        await self.flush()
+
+    async def flush(self) -> int:
+        """
+        Writes the buffered records.
+
+        :return: The number of written records.
+        """
+        async with self._lock:
+            rows, self._buffer = self._buffer, []
+            if not rows:
+                return 0
+            try:
+                async with self.session_maker() as session, session.begin():
+                    partitions = await self._write(session, rows)
+            except Exception:
+                self._buffer[:0] = rows
+                self._trim()
+                raise
+            # Only cache partitions once they are committed: a rolled back flush also
+            # rolls back their creation.
+            self._partitions |= partitions
+            self.metrics.written += len(rows)
+            self.metrics.flushes += 1
+            return len(rows)
+
+    async def get_recent(
+        self,
+        user_id: UUID,
+        limit: int = 50,
+        before: Optional[datetime] = None,
+    ) -> list[AuditLogTable]:
+        """
+        Returns the most recent records of a user, newest first.
+
+        Served by the ``(user_id, ts)`` index; pass the ``ts`` of the last record as
+        ``before`` to fetch the next page. Records still in the buffer are not included.
+
+        :param user_id: The user whose history to return.
+        :param limit: Maximum number of records.
+        :param before: Only return records older than this.
+        """
+        table = self.audit_log_table
+        statement = (
+            select(table)
+            .where(table.user_id == user_id)
+            .order_by(table.ts.desc())
+            .limit(limit)
+        )
+        if before is not None:
+            statement = statement.where(table.ts < before)
+        async with self.session_maker() as session:
+            return list(await session.scalars(statement))
+
+    async def _write(
+        self, session: AsyncSession, rows: list[dict[str, Any]]
+    ) -> set[tuple[int, int]]:
+        partitions = await self._ensure_partitions(session, rows)
+        if session.get_bind().dialect.driver == "asyncpg":
+            connection = await session.connection()
+            raw_connection = await connection.get_raw_connection()
+            await raw_connection.driver_connection.copy_records_to_table(
+                self.audit_log_table.__tablename__,
+                records=[tuple(row[c] for c in AUDIT_LOG_COLUMNS) for row in rows],
+                columns=AUDIT_LOG_COLUMNS,
+            )
+        else:
+            await session.execute(insert(self.audit_log_table), rows)
+        return partitions
+
+    async def _ensure_partitions(
+        self, session: AsyncSession, rows: list[dict[str, Any]]
+    ) -> set[tuple[int, int]]:
+        if session.get_bind().dialect.name != "postgresql":
+            return set()
+        table_name = self.audit_log_table.__tablename__
+        months = {(row["ts"].year, row["ts"].month) for row in rows} - self._partitions
+        for year, month in sorted(months):
+            start = datetime(year, month, 1, tzinfo=UTC)
+            end = datetime(year + month // 12, month % 12 + 1, 1, tzinfo=UTC)
+            await session.execute(
+                text(
+                    f"CREATE TABLE IF NOT EXISTS {table_name}_y{year}m{month:02d} "
+                    f"PARTITION OF {table_name} "
+                    f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+                )
+            )
+        return months
+
+    async def _flush_quietly(self) -> None:
+        try:
+            await self.flush()
+        except Exception:
+            logger.exception("Audit log flush failed")
+
+    def _trim(self) -> None:
+        excess = len(self._buffer) - self.max_buffer
+        if excess > 0:
+            del self._buffer[:excess]
+            self.metrics.dropped += excess
+            logger.warning("Audit log buffer is full, dropped %d records", excess)
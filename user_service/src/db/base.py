@@ -1,16 +1,28 @@
-from typing import AsyncGenerator, Annotated
+from typing import AsyncGenerator, Annotated, Optional
 from fastapi import Depends
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from user_service.src.core.cache import introspection_cache
 from user_service.src.core.config import settings
+from user_service.src.core.events import event_bus
+from user_service.src.core.tenant import get_tenant_id
+from user_service.src.db.audit import AuditLog
 from user_service.src.db.database import SQLAlchemyUserDatabase
+from user_service.src.db.engine import create_db_engine
 from user_service.src.db.manager import UserManager
-from user_service.src.models import UserTable, Base
-
-engine = create_async_engine(
-    url=settings.ASYNC_DB_URI,
-    echo=settings.ASYNC_DB_ECHO,
+from user_service.src.db.memory import InMemoryUserDatabase, InMemoryUserStore
+from user_service.src.db.session import LazyAsyncSession
+from user_service.src.db.sessions import SessionRegistry
+from user_service.src.migrations.runner import upgrade_database
+from user_service.src.models import (
+    UserTable,
+    OAuthAccountTable,
+    OutboxTable,
+    UserArchiveTable,
+    UserArchiveOAuthAccountTable,
 )
 
+engine = create_db_engine()
+
 async_session_maker = async_sessionmaker(
     bind=engine,
     expire_on_commit=False,
@@ -18,6 +30,10 @@ async_session_maker = async_sessionmaker(
     autoflush=False,
 )
 
+audit_log = AuditLog(async_session_maker)
+session_registry = SessionRegistry(async_session_maker, token_cache=introspection_cache)
+memory_user_store = InMemoryUserStore()
+
 
 async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
     async with async_session_maker() as session:
@@ -25,8 +41,10 @@ async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
 
 
 async def init_db():
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    """
+    Brings the schema up to date by running the migrations, see ``upgrade_database``.
+    """
+    await upgrade_database(engine)
 
 
 async def get_db(
@@ -39,6 +57,55 @@ async def get_db(
 
 
 async def get_user_manager(
-    user_db: Annotated[SQLAlchemyUserDatabase, Depends(get_db)]
+    tenant_id: Annotated[str, Depends(get_tenant_id)],
 ) -> AsyncGenerator[UserManager, None]:
-    yield UserManager(user_db)
+    """
+    Provides a user manager bound to a fresh session.
+
+    The session, database and manager are created in a single dependency instead of the
+    ``get_async_session`` -> ``get_db`` -> ``get_user_manager`` chain, so every request that
+    needs a manager enters one async generator instead of three. Only the session is per
+    request; the token service and caches the manager uses are process-wide singletons.
+    The session itself is created lazily, so requests that never query the database never
+    create one. The database is scoped to the tenant of the request, and with
+    ``USER_ARCHIVE_ENABLED`` it restores archived users on lookups by email.
+
+    With ``USER_DB_BACKEND=memory`` the users live in the process-wide
+    ``memory_user_store`` instead and no session is opened.
+    """
+    if settings.USER_DB_BACKEND == "memory":
+        yield UserManager(
+            InMemoryUserDatabase(memory_user_store, tenant_id),
+            introspection_cache,
+            event_bus,
+        )
+        return
+    async with LazyAsyncSession(async_session_maker) as session:
+        yield UserManager(
+            SQLAlchemyUserDatabase(
+                session,
+                UserTable,
+                OAuthAccountTable,
+                OutboxTable if settings.EVENT_OUTBOX_ENABLED else None,
+                tenant_id,
+                UserArchiveTable if settings.USER_ARCHIVE_ENABLED else None,
+                (
+                    UserArchiveOAuthAccountTable
+                    if settings.USER_ARCHIVE_ENABLED
+                    else None
+                ),
+            ),
+            introspection_cache,
+            event_bus,
+        )
+
+
+async def get_audit_log() -> AuditLog:
+    return audit_log
+
+
+async def get_session_registry() -> Optional[SessionRegistry]:
+    """
+    Provides the session registry, or None when session tracking is disabled.
+    """
+    return session_registry if settings.SESSIONS_ENABLED else None
@@ -1,11 +1,81 @@
-from typing import Optional, Union, AnyStr, Any
+from datetime import datetime, UTC
+from functools import lru_cache
+from typing import Literal, Optional, Sequence, Union, AnyStr, Any, TypeVar
 from uuid import UUID
-from sqlalchemy import select, Select
+from sqlalchemy import (
+    bindparam,
+    delete,
+    func,
+    insert,
+    or_,
+    select,
+    update,
+    Select,
+    Insert,
+    ColumnElement,
+)
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.exc import StaleDataError
 
+from user_service.src.core.emails import normalize_email
+from user_service.src.core.exceptions import UserAlreadyExists, UserUpdateConflict
 from user_service.src.core.interfaces import BaseUserDatabase
 from user_service.src.core.typing import StringType
-from user_service.src.models import UserTable, OAuthAccountTable
+from user_service.src.core.events import (
+    USER_REGISTERED,
+    USER_UPDATED,
+    USER_DELETED,
+    user_event_payload,
+)
+from user_service.src.models import (
+    UserTable,
+    OAuthAccountTable,
+    OutboxTable,
+    UserArchiveTable,
+    UserArchiveOAuthAccountTable,
+    UserSnapshot,
+    UserCredentials,
+    UserIdentity,
+)
+
+P = TypeVar("P", UserSnapshot, UserCredentials, UserIdentity)
+
+
+@lru_cache(maxsize=None)
+def lookup_statement(
+    user_table: type[UserTable],
+    projection: Optional[type[P]],
+    key: Literal["id", "email"],
+    tenant_scoped: bool,
+) -> Select:
+    """
+    Builds one of the fixed user lookups, once per combination of its arguments.
+
+    The values are bound parameters (``user_id`` or ``email``, and ``tenant_id``), so every
+    call reuses the same statement object: SQLAlchemy memoizes its cache key and finds the
+    compiled form in the compiled cache without rebuilding the construct, and the SQL text
+    stays identical, so asyncpg reuses its prepared statement for it. Soft-deleted users
+    are never returned.
+
+    :param user_table: The SQLAlchemy model representing the user table.
+    :param projection: The projection to select, or None to load the entity.
+    :param key: Whether to look up by ID or by lower-cased email.
+    :param tenant_scoped: Whether to restrict the lookup to the ``tenant_id`` parameter.
+    """
+    if projection is None:
+        statement = select(user_table)
+    else:
+        statement = select(*projection.columns(user_table))
+    if key == "id":
+        statement = statement.where(user_table.id == bindparam("user_id"))
+    else:
+        statement = statement.where(func.lower(user_table.email) == bindparam("email"))
+    if tenant_scoped:
+        statement = statement.where(user_table.tenant_id == bindparam("tenant_id"))
+    return statement.where(user_table.deleted_at.is_(None))
 
 
 class SQLAlchemyUserDatabase(BaseUserDatabase[UserTable, UUID]):
@@ -18,21 +88,47 @@ class SQLAlchemyUserDatabase(BaseUserDatabase[UserTable, UUID]):
     :param session: SQLAlchemy AsyncSession instance for interacting with the database.
     :param user_table: The SQLAlchemy model representing the user table.
     :param oauth_account_table: Optional SQLAlchemy model representing the OAuth account table.
+    :param outbox_table: Optional SQLAlchemy model representing the outbox table. When set,
+        user changes append an event to the outbox in the same transaction.
+    :param tenant_id: Optional tenant the database is scoped to. When set, every lookup is
+        restricted to the tenant's users, so it is served by the tenant-leading indexes,
+        and new users are created in the tenant.
+    :param archive_table: Optional SQLAlchemy model representing the archive table filled
+        by ``UserArchiver``. When set, a lookup by email or ID that misses the user table
+        restores the archived user first, so archiving is transparent to logins,
+        registrations and administration.
+    :param archive_oauth_account_table: Optional SQLAlchemy model holding the OAuth account
+        keys of the archived users. When set, a lookup by OAuth account also restores the
+        archived user, even if the provider email no longer matches.
     """
 
     session: AsyncSession
     user_table: type[UserTable]
     oauth_account_table: Optional[type[OAuthAccountTable]]
+    outbox_table: Optional[type[OutboxTable]]
+    tenant_id: Optional[str]
+    archive_table: Optional[type[UserArchiveTable]]
+    archive_oauth_account_table: Optional[type[UserArchiveOAuthAccountTable]]
 
     def __init__(
         self,
         session: AsyncSession,
         user_table: type[UserTable],
         oauth_account_table: Optional[type[OAuthAccountTable]] = None,
+        outbox_table: Optional[type[OutboxTable]] = None,
+        tenant_id: Optional[str] = None,
+        archive_table: Optional[type[UserArchiveTable]] = None,
+        archive_oauth_account_table: Optional[
+            type[UserArchiveOAuthAccountTable]
+        ] = None,
     ):
         self.session = session
         self.user_table = user_table
         self.oauth_account_table = oauth_account_table
+        self.outbox_table = outbox_table
+        self.tenant_id = tenant_id
+        self.archive_table = archive_table
+        self.archive_oauth_account_table = archive_oauth_account_table
 
     async def get_user_by_id(self, user_id: UUID) -> Optional[UserTable]:
         """
@@ -41,18 +137,67 @@ class SQLAlchemyUserDatabase(BaseUserDatabase[UserTable, UUID]):
         :param user_id: The ID of the user.
         :return: The user object if found, otherwise None.
         """
-        statement = select(self.user_table).where(self.user_table.id == user_id)
-        return await self._get_user(statement)
+        user = await self._get_user(*self._lookup(None, user_id=user_id))
+        if user is None and await self._restore_archived(user_ids=[user_id]):
+            user = await self._get_user(*self._lookup(None, user_id=user_id))
+        return user
 
     async def get_user_by_email(self, email: StringType) -> Optional[UserTable]:
         """
         Retrieves a user by their email.
 
+        Emails are matched case-insensitively through the ``lower(email)`` index.
+
         :param email: The email of the user.
         :return: The user object if found, otherwise None.
         """
-        statement = select(self.user_table).where(self.user_table.email == email)
-        return await self._get_user(statement)
+        email = normalize_email(email)
+        user = await self._get_user(*self._lookup(None, email=email))
+        if user is None and await self._restore_archived(email=email):
+            user = await self._get_user(*self._lookup(None, email=email))
+        return user
+
+    async def get_snapshot_by_id(self, user_id: UUID) -> Optional[UserSnapshot]:
+        """
+        Retrieves a snapshot of a user by their unique ID, without loading an ORM entity.
+
+        :param user_id: The ID of the user.
+        :return: The user snapshot if found, otherwise None.
+        """
+        return await self._get_projection_or_restore(UserSnapshot, user_id=user_id)
+
+    async def get_snapshot_by_email(self, email: StringType) -> Optional[UserSnapshot]:
+        """
+        Retrieves a snapshot of a user by their email, without loading an ORM entity.
+
+        :param email: The email of the user.
+        :return: The user snapshot if found, otherwise None.
+        """
+        return await self._get_projection_or_restore(
+            UserSnapshot, email=normalize_email(email)
+        )
+
+    async def get_credentials_by_email(
+        self, email: StringType
+    ) -> Optional[UserCredentials]:
+        """
+        Retrieves only what a login needs: the ID, email, password hash and active flag.
+
+        :param email: The email of the user.
+        :return: The credentials row if found, otherwise None.
+        """
+        return await self._get_projection_or_restore(
+            UserCredentials, email=normalize_email(email)
+        )
+
+    async def get_identity_by_id(self, user_id: UUID) -> Optional[UserIdentity]:
+        """
+        Retrieves only the ID, email and active flag of a user, e.g. to introspect a token.
+
+        :param user_id: The ID of the user.
+        :return: The identity row if found, otherwise None.
+        """
+        return await self._get_projection_or_restore(UserIdentity, user_id=user_id)
 
     async def get_by_oauth_account(
         self, oauth: str, account_id: str
@@ -69,13 +214,74 @@ class SQLAlchemyUserDatabase(BaseUserDatabase[UserTable, UUID]):
             raise NotImplementedError()
 
         statement = (
-            select(self.user_table)
+            self._select_user()
             .join(self.oauth_account_table)
             .where(self.oauth_account_table.oauth_name == oauth)
             .where(self.oauth_account_table.account_id == account_id)
+            .options(selectinload(self.user_table.oauth_accounts))
+        )
+
+        user = await self._get_user(statement)
+        if user is None and await self._restore_archived(oauth=(oauth, account_id)):
+            user = await self._get_user(statement)
+        return user
+
+    async def upsert_oauth_account(
+        self, user: UserTable, create_dict: dict[str, Any], *, emit_event: bool = False
+    ) -> UserTable:
+        """
+        Links an OAuth account to a user, or refreshes its tokens if it is already linked.
+
+        The account is written with a single ``INSERT ... ON CONFLICT (oauth_name, account_id)
+        DO UPDATE`` against the unique composite index, so there is no read-before-write and
+        concurrent callbacks for the same account cannot create duplicates. The update only
+        applies to the user's own link: an account linked to another user is neither moved
+        nor has its tokens overwritten, and its owner is looked up instead.
+
+        :param user: The user the account should be linked to.
+        :param create_dict: The OAuth account attributes, including ``oauth_name`` and ``account_id``.
+        :param emit_event: Write a ``USER_UPDATED`` event to the outbox, e.g. when a user links
+            an account. Token refreshes on login are not user changes and leave it unset.
+        :return: The user owning the account, with its OAuth accounts loaded, or None if the
+            account is linked to a user of another tenant.
+        :raises NotImplementedError: If OAuth support is not available.
+        """
+        if not self.oauth_account_table:
+            raise NotImplementedError()
+
+        insert_statement = self._insert(self.oauth_account_table).values(
+            user_id=user.id, **create_dict
         )
+        statement = insert_statement.on_conflict_do_update(
+            index_elements=[
+                self.oauth_account_table.oauth_name,
+                self.oauth_account_table.account_id,
+            ],
+            set_={
+                key: insert_statement.excluded[key]
+                for key in create_dict
+                if key not in ("oauth_name", "account_id")
+            },
+            where=self.oauth_account_table.user_id == insert_statement.excluded.user_id,
+        ).returning(self.oauth_account_table.user_id)
+        owner_id = (await self.session.execute(statement)).scalar_one_or_none()
+        if owner_id is None:
+            # Already linked to another user, which the conflict clause left untouched.
+            owner_id = await self.session.scalar(
+                select(self.oauth_account_table.user_id)
+                .where(self.oauth_account_table.oauth_name == create_dict["oauth_name"])
+                .where(self.oauth_account_table.account_id == create_dict["account_id"])
+            )
+        elif emit_event:
+            self._add_event(USER_UPDATED, user, fields=["oauth_name"])
+        await self.session.commit()
 
-        return await self._get_user(statement)
+        return await self._get_user(
+            self._select_user()
+            .where(self.user_table.id == owner_id)
+            .options(selectinload(self.user_table.oauth_accounts))
+            .execution_options(populate_existing=True)
+        )
 
     async def create_user(self, create_dict: dict[str, Any]) -> UserTable:
         """
@@ -83,41 +289,115 @@ class SQLAlchemyUserDatabase(BaseUserDatabase[UserTable, UUID]):
 
         :param create_dict: Dictionary of user attributes to create the new user.
         :return: The created user object.
+        :raises UserAlreadyExists: If the tenant already has a user with this email.
         """
+        create_dict = {**create_dict, "email": normalize_email(create_dict["email"])}
+        if self.tenant_id is not None:
+            create_dict["tenant_id"] = self.tenant_id
         user = self.user_table(**create_dict)
         self.session.add(user)
-        await self.session.commit()
+        await self._flush()
         await self.session.refresh(user)
+        self._add_event(USER_REGISTERED, user)
+        await self.session.commit()
         return user
 
     async def update_user(
         self,
         user: UserTable,
         update_dict: dict[str, Union[str, bool]],
+        *,
+        emit_event: bool = True,
+        expected_version: Optional[int] = None,
     ) -> UserTable:
         """
         Updates an existing user in the database.
 
         :param user: The user object to be updated.
         :param update_dict: Dictionary of attributes to update for the user.
+        :param emit_event: Write a ``USER_UPDATED`` event to the outbox. Unset for internal
+            writes such as upgrading a password hash on login.
+        :param expected_version: The version the changes were derived from, when the user
+            may have been changed through this session since.
         :return: The updated user object.
+        :raises UserAlreadyExists: If the new email belongs to another user of the tenant.
+        :raises UserUpdateConflict: If the user was changed since it was loaded. The update
+            is guarded by the ``version`` column, so the concurrent change is kept.
         """
+        if expected_version is not None and user.version != expected_version:
+            raise UserUpdateConflict()
+        if "email" in update_dict:
+            update_dict = {
+                **update_dict,
+                "email": normalize_email(update_dict["email"]),
+            }
         for k, v in update_dict.items():
             setattr(user, k, v)
         self.session.add(user)
-        await self.session.commit()
+        await self._flush()
         await self.session.refresh(user)
+        if emit_event:
+            self._add_event(USER_UPDATED, user, fields=sorted(update_dict))
+        await self.session.commit()
         return user
 
     async def delete_user(self, user: UserTable) -> None:
         """
-        Deletes a user from the database.
+        Soft-deletes a user by setting ``deleted_at``.
+
+        The user is hidden from every lookup right away and moved to the archive table by
+        ``UserArchiver`` later. The unique email index only covers users that are not
+        deleted, so the email can be registered again right away. The version is bumped
+        without being checked, so a deletion always wins over a concurrent update.
 
         :param user: The user object to delete.
         """
-        await self.session.delete(user)
+        table = self.user_table
+        await self.session.execute(
+            update(table)
+            .where(table.id == user.id)
+            .values(deleted_at=datetime.now(UTC), version=table.version + 1)
+            .execution_options(synchronize_session="fetch")
+        )
+        self._add_event(USER_DELETED, user)
         await self.session.commit()
 
+    async def bulk_update_users(
+        self, user_ids: Sequence[UUID], update_dict: dict[str, Any]
+    ) -> list[UserIdentity]:
+        """
+        Sets the same values on many users with a single ``UPDATE ... RETURNING``.
+
+        Users that already have every value are filtered out by the statement, so they are
+        neither written nor returned. The version of every written user is bumped, so a
+        later update of a copy loaded before fails its optimistic lock. Archived users are
+        restored first, so they can be reactivated.
+
+        :param user_ids: The IDs of the users to update. Unknown IDs are ignored.
+        :param update_dict: The values to set, e.g. ``{"is_active": False}``.
+        :return: The identities of the users that changed.
+        """
+        await self._restore_archived(user_ids=user_ids)
+        table = self.user_table
+        statement = (
+            update(table)
+            .where(table.id.in_(user_ids))
+            .where(table.deleted_at.is_(None))
+            .where(or_(*(getattr(table, k) != v for k, v in update_dict.items())))
+            .values(**update_dict, version=table.version + 1)
+            .returning(*UserIdentity.columns(table))
+            .execution_options(synchronize_session=False)
+        )
+        if self.tenant_id is not None:
+            statement = statement.where(table.tenant_id == self.tenant_id)
+        identities = [
+            UserIdentity.from_row(row) for row in await self.session.execute(statement)
+        ]
+        for identity in identities:
+            self._add_event(USER_UPDATED, identity, fields=sorted(update_dict))
+        await self.session.commit()
+        return identities
+
     async def update_oauth_account(
         self,
         user: UserTable,
@@ -143,6 +423,200 @@ class SQLAlchemyUserDatabase(BaseUserDatabase[UserTable, UUID]):
 
         return user
 
-    async def _get_user(self, statement: Select) -> Optional[UserTable]:
-        result = await self.session.execute(statement)
-        return result.unique().scalar_one_or_none()
+    async def _flush(self) -> None:
+        """
+        Flushes the session, reporting a violation of the unique email index as
+        ``UserAlreadyExists`` and a stale ``version`` as ``UserUpdateConflict``, like the
+        other backends. The transaction is rolled back, which expires the loaded users.
+        """
+        try:
+            await self.session.flush()
+        except IntegrityError:
+            await self.session.rollback()
+            raise UserAlreadyExists()
+        except StaleDataError:
+            await self.session.rollback()
+            raise UserUpdateConflict()
+
+    def _add_event(self, event_type: str, user: UserTable, **extra: Any) -> None:
+        if self.outbox_table is not None:
+            self.session.add(
+                self.outbox_table(
+                    event_type=event_type,
+                    payload={**user_event_payload(user), **extra},
+                )
+            )
+
+    def _select_user(self) -> Select:
+        statement = select(self.user_table).where(self.user_table.deleted_at.is_(None))
+        if self.tenant_id is not None:
+            statement = statement.where(self.user_table.tenant_id == self.tenant_id)
+        return statement
+
+    def _lookup(
+        self, projection: Optional[type[P]], **params: Any
+    ) -> tuple[Select, dict[str, Any]]:
+        key = "id" if "user_id" in params else "email"
+        tenant_scoped = self.tenant_id is not None
+        if tenant_scoped:
+            params["tenant_id"] = self.tenant_id
+        statement = lookup_statement(self.user_table, projection, key, tenant_scoped)
+        return statement, params
+
+    def _insert(self, table: type[Any]) -> Insert:
+        dialect_name = self.session.get_bind().dialect.name
+        if dialect_name == "postgresql":
+            return postgresql.insert(table)
+        if dialect_name == "sqlite":
+            return sqlite.insert(table)
+        raise NotImplementedError(f"Upserts are not supported for {dialect_name}")
+
+    async def _get_user(
+        self, statement: Select, params: Optional[dict[str, Any]] = None
+    ) -> Optional[UserTable]:
+        """
+        Executes a lookup and returns the connection to the pool right away.
+
+        A lookup that starts its own transaction ends it immediately, so the connection is
+        not held idle while the caller hashes passwords or signs tokens. Lookups inside a
+        transaction the caller already started are left alone. This relies on the session
+        being created with ``expire_on_commit=False`` so the returned user stays loaded.
+        """
+        in_transaction = self.session.in_transaction()
+        result = await self.session.execute(statement, params)
+        user = result.unique().scalar_one_or_none()
+        if not in_transaction:
+            await self.session.commit()
+        return user
+
+    async def _get_projection(
+        self, projection: type[P], statement: Select, params: dict[str, Any]
+    ) -> Optional[P]:
+        """
+        Runs a lookup selecting only the columns of ``projection`` and builds it from the row.
+
+        Column selects return plain rows, so nothing is hydrated through the unit of work or
+        registered in the identity map. The connection is released like in ``_get_user``.
+        """
+        in_transaction = self.session.in_transaction()
+        row = (await self.session.execute(statement, params)).first()
+        if not in_transaction:
+            await self.session.commit()
+        return projection.from_row(row) if row is not None else None
+
+    async def _get_projection_or_restore(
+        self, projection: type[P], **params: Any
+    ) -> Optional[P]:
+        result = await self._get_projection(
+            projection, *self._lookup(projection, **params)
+        )
+        if result is None:
+            restore = (
+                {"email": params["email"]}
+                if "email" in params
+                else {"user_ids": [params["user_id"]]}
+            )
+            if await self._restore_archived(**restore):
+                result = await self._get_projection(
+                    projection, *self._lookup(projection, **params)
+                )
+        return result
+
+    async def _restore_archived(
+        self,
+        *,
+        email: Optional[str] = None,
+        user_ids: Optional[Sequence[UUID]] = None,
+        oauth: Optional[tuple[str, str]] = None,
+    ) -> bool:
+        """
+        Moves the archived users with this email, these IDs or this OAuth account back into
+        the user table, with their OAuth accounts.
+
+        Most misses are for users that do not exist at all, so an indexed existence check
+        comes first and the common case costs one read, without a write or a commit.
+        Deleted users are never restored. The archived row is claimed with
+        ``DELETE ... RETURNING``, so of two concurrent lookups only one restores it: the
+        other waits for the row lock and finds nothing, then finds the restored user. The
+        restore runs in a SAVEPOINT, so if a user with the email was created meanwhile only
+        the restore is rolled back. Like the lookups, it commits unless the caller started
+        the transaction. Restored users get a fresh ``updated_at``, so they are not archived
+        again on the next run.
+
+        :param email: The normalized email of the user.
+        :param user_ids: The IDs of the users.
+        :param oauth: The provider name and account ID of an OAuth account of the user.
+        :return: Whether a user was restored.
+        """
+        if self.archive_table is None:
+            return False
+        archive = self.archive_table.__table__
+        if email is not None:
+            condition = func.lower(archive.c.email) == email
+        elif oauth is not None:
+            if self.archive_oauth_account_table is None:
+                return False
+            keys = self.archive_oauth_account_table.__table__
+            condition = archive.c.id.in_(
+                select(keys.c.user_id).where(
+                    keys.c.oauth_name == oauth[0], keys.c.account_id == oauth[1]
+                )
+            )
+        else:
+            condition = archive.c.id.in_(user_ids)
+        conditions = [condition, archive.c.deleted_at.is_(None)]
+        if self.tenant_id is not None:
+            conditions.append(archive.c.tenant_id == self.tenant_id)
+
+        in_transaction = self.session.in_transaction()
+        archived = await self.session.scalar(
+            select(archive.c.id).where(*conditions).limit(1)
+        )
+        if archived is None:
+            if not in_transaction:
+                await self.session.commit()
+            return False
+
+        try:
+            async with self.session.begin_nested():
+                restored = await self._move_archived(conditions)
+        except IntegrityError:
+            restored = False
+        if not in_transaction:
+            await self.session.commit()
+        return restored
+
+    async def _move_archived(self, conditions: list[ColumnElement[bool]]) -> bool:
+        archive = self.archive_table.__table__
+        statement = delete(archive).where(*conditions).returning(*archive.c)
+        rows = (await self.session.execute(statement)).mappings().all()
+        if not rows:
+            return False
+        restored_at = datetime.now(UTC)
+        users = [
+            {
+                **{
+                    key: value
+                    for key, value in row.items()
+                    if key not in ("archived_at", "oauth_accounts")
+                },
+                "updated_at": restored_at,
+            }
+            for row in rows
+        ]
+        accounts = [
+            {**account, "id": UUID(account["id"]), "user_id": row["id"]}
+            for row in rows
+            for account in row["oauth_accounts"]
+        ]
+        await self.session.execute(insert(self.user_table), users)
+        if accounts:
+            if self.oauth_account_table is None:
+                raise NotImplementedError()
+            await self.session.execute(insert(self.oauth_account_table), accounts)
+        if self.archive_oauth_account_table is not None:
+            keys = self.archive_oauth_account_table.__table__
+            await self.session.execute(
+                delete(keys).where(keys.c.user_id.in_([row["id"] for row in rows]))
+            )
+        return True
@@ -0,0 +1,42 @@
+from typing import Any
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from user_service.src.core.config import settings
+
+
+def create_db_engine(url: str = settings.ASYNC_DB_URI, **kwargs: Any) -> AsyncEngine:
+    """
+    Creates an engine configured like the application's.
+
+    Shared by the application and the migration runner, so migrations connect with the same
+    driver and settings as the service. SQLite connections are tuned with
+    ``set_sqlite_pragmas``.
+
+    :param url: The database URL. Defaults to the configured database.
+    :param kwargs: Extra arguments for ``create_async_engine``, e.g. a ``poolclass``.
+    """
+    kwargs.setdefault("echo", settings.ASYNC_DB_ECHO)
+    engine = create_async_engine(url, **kwargs)
+    if engine.dialect.name == "sqlite":
+        event.listen(engine.sync_engine, "connect", set_sqlite_pragmas)
+    return engine
+
+
+def set_sqlite_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
+    """
+    Tunes a SQLite connection for a single-node deployment.
+
+    The write-ahead log lets readers run while a write is in progress, and with
+    ``synchronous=NORMAL`` a commit only appends to the log instead of syncing the database
+    file, which stays durable across application crashes. Writers wait ``busy_timeout``
+    for the lock instead of failing right away, and reads are served from a larger page
+    cache and a memory map of the file.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute(f"PRAGMA busy_timeout={int(settings.SQLITE_BUSY_TIMEOUT_MS)}")
+    cursor.execute(f"PRAGMA cache_size=-{int(settings.SQLITE_CACHE_SIZE_KIB)}")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute(f"PRAGMA mmap_size={int(settings.SQLITE_MMAP_SIZE_BYTES)}")
+    cursor.close()
@@ -1,39 +1,94 @@
-from typing import Optional, Any
+import hmac
+import secrets
+from typing import Any, Awaitable, Callable, Optional, Sequence
 from uuid import UUID
 from fastapi import Request
 from fastapi.security import OAuth2PasswordRequestForm
+from jwt import PyJWTError
+from user_service.src.core.cache import TokenIntrospectionCache
+from user_service.src.core.emails import normalize_email
+from user_service.src.core.events import (
+    Event,
+    EventBus,
+    OUTBOX_EVENTS,
+    USER_REGISTERED,
+    USER_UPDATED,
+    USER_DELETED,
+    USER_LOGGED_IN,
+    USER_LOGIN_FAILED,
+    USER_VERIFY_REQUESTED,
+    USER_VERIFIED,
+    USER_FORGOT_PASSWORD,
+    USER_PASSWORD_RESET,
+    user_event_payload,
+    request_event_context,
+)
 from user_service.src.core.interfaces import UP, ID, BaseUserManager, BaseUserDatabase
 from user_service.src.core.typing import StringType
 from user_service.src.db.database import SQLAlchemyUserDatabase
-from user_service.src.models import UserTable
+from user_service.src.models import (
+    UserTable,
+    UserSnapshot,
+    UserCredentials,
+    UserIdentity,
+)
+from user_service.src.core.config import settings
 from user_service.src.core.exceptions import (
     UserAlreadyExists,
     UserNotExists,
+    UserInactive,
+    UserUpdateConflict,
+    UserAlreadyVerified,
     InvalidID,
     InvalidPasswordException,
+    InvalidCurrentPassword,
+    InvalidVerifyToken,
+    InvalidResetPasswordToken,
+    OAuthAccountAlreadyLinked,
     ErrorCode,
 )
 from user_service.src.core.security import (
     hash_password,
+    run_password_hashing,
     verify_password,
     validate_password,
     verify_and_update_password,
+    get_password_fingerprint,
+    encode_jwt,
+    decode_jwt,
 )
 from user_service.src.schemes import UserCreate, UserUpdate, model_dump
 
 
+VERIFY_TOKEN_AUDIENCE = "user_service:verify"
+RESET_PASSWORD_TOKEN_AUDIENCE = "user_service:reset"
+
+
 class UserManager(BaseUserManager[UserTable, UUID]):
     """
     Manager class for handling user-related operations like creation, update, and authentication.
     This class interacts with the user database and handles logic for user management.
 
     :param user_db: Database interface for user-related operations.
+    :param token_cache: Optional cache of token introspection results that is invalidated
+        whenever a user changes.
+    :param event_bus: Optional event bus the ``on_after_*`` hooks publish to. Events the
+        user database already writes to its outbox are not published a second time.
     """
 
     user_db: BaseUserDatabase[UserTable, UUID]
+    token_cache: Optional[TokenIntrospectionCache]
+    event_bus: Optional[EventBus]
 
-    def __init__(self, user_db: BaseUserDatabase[UserTable, UUID]):
+    def __init__(
+        self,
+        user_db: BaseUserDatabase[UserTable, UUID],
+        token_cache: Optional[TokenIntrospectionCache] = None,
+        event_bus: Optional[EventBus] = None,
+    ):
         self.user_db: BaseUserDatabase[UserTable, UUID] = user_db
+        self.token_cache = token_cache
+        self.event_bus = event_bus
 
     async def parse_id(self, user_id: Any) -> UUID:
         try:
@@ -60,7 +115,9 @@ class UserManager(BaseUserManager[UserTable, UUID]):
             raise UserAlreadyExists()
         user_dict = user_create.create_update_dict()
         password = user_dict.pop("password")
-        user_dict["hashed_password"] = hash_password(password)
+        user_dict["hashed_password"] = await run_password_hashing(
+            hash_password, password
+        )
         created_user = await self.user_db.create_user(user_dict)
         await self.on_after_register(created_user, request)
         return created_user
@@ -92,85 +149,470 @@ class UserManager(BaseUserManager[UserTable, UUID]):
             raise UserNotExists()
         return user
 
+    async def get_snapshot_by_id(self, user_id: UUID) -> UserSnapshot:
+        """
+        Get a read-only snapshot of a user by ID, for paths that do not change the user.
+
+        :param user_id: The unique identifier of the user (UUID).
+        :raises UserNotExists: Raised if a user with the specified ID does not exist in the database.
+        :return: The snapshot of the existing user.
+        """
+        user = await self.user_db.get_snapshot_by_id(user_id)
+        if not user:
+            raise UserNotExists()
+        return user
+
+    async def get_identity_by_id(self, user_id: UUID) -> UserIdentity:
+        """
+        Get only the ID, email and active flag of a user by ID.
+
+        :param user_id: The unique identifier of the user (UUID).
+        :raises UserNotExists: Raised if a user with the specified ID does not exist in the database.
+        :return: The identity of the existing user.
+        """
+        user = await self.user_db.get_identity_by_id(user_id)
+        if not user:
+            raise UserNotExists()
+        return user
+
     async def update_user(
         self,
         user: UserTable,
         update_dict: UserUpdate,
         request: Optional[Request] = None,
+        *,
+        safe: bool = True,
+        current_password: Optional[str] = None,
     ) -> UserTable:
         """
         Update user data in the database.
 
+        Only the fields that differ from the stored user are written, and the password is
+        only hashed when one is given. When nothing changes the user is returned as is,
+        without a write, a token cache invalidation or an event.
+
         :param user: The SQLAlchemy ORM model instance representing the user to update.
         :param update_dict: An object containing the updated user data.
         :param request: Optional FastAPI Request object, useful for logging or additional context.
+        :param safe: If True, the ``is_active``, ``is_superuser`` and ``is_verified`` flags are
+            ignored, as users must not change them on their own account.
+        :param current_password: Optional password confirming the change. When given, nothing
+            is written unless it matches the stored password.
+        :raises InvalidCurrentPassword: Raised if ``current_password`` does not match.
+        :raises UserAlreadyExists: Raised if the new email belongs to another user.
+        :raises InvalidPasswordException: Raised if the new password is invalid or unchanged.
+        :raises UserUpdateConflict: Raised if the user kept changing concurrently, see ``_update_with_retry``.
         :return: The updated UserTable instance reflecting the changes.
         """
-        update_data = update_dict.create_update_dict()
-        updated_user = await self._update_user(user, update_data)
-        await self.on_after_update(request)
+        if safe:
+            update_data = update_dict.create_update_dict()
+        else:
+            update_data = update_dict.create_update_dict_superuser()
+        updated_user, changes = await self._update_user(
+            user, update_data, current_password
+        )
+        if not changes:
+            return updated_user
+        self._invalidate_tokens(updated_user)
+        await self.on_after_update(updated_user, changes, request)
         return updated_user
 
+    async def delete_user(
+        self, user: UserTable, request: Optional[Request] = None
+    ) -> None:
+        """
+        Soft-delete a user and invalidate their cached tokens.
+
+        :param user: The user to delete.
+        :param request: Optional FastAPI Request object, useful for logging or additional context.
+        """
+        await self.user_db.delete_user(user)
+        self._invalidate_tokens(user)
+        await self.on_after_delete(user, request)
+
+    async def bulk_update_users(
+        self,
+        user_ids: Sequence[UUID],
+        update_dict: dict[str, Any],
+        request: Optional[Request] = None,
+    ) -> list[UserIdentity]:
+        """
+        Set the same values on many users in one statement, e.g. to deactivate accounts.
+
+        Only the users whose values actually change are written, have their cached tokens
+        invalidated and get an update event.
+
+        :param user_ids: The IDs of the users to update. Unknown IDs are ignored.
+        :param update_dict: The values to set, e.g. ``{"is_active": False}``.
+        :param request: Optional FastAPI Request object, useful for logging or additional context.
+        :return: The identities of the users that changed.
+        """
+        updated = await self.user_db.bulk_update_users(user_ids, update_dict)
+        for identity in updated:
+            self._invalidate_tokens(identity)
+            await self.on_after_update(identity, update_dict, request)
+        return updated
+
     async def authenticate(
-        self, credentials: OAuth2PasswordRequestForm
-    ) -> Optional[UserTable]:
+        self,
+        credentials: OAuth2PasswordRequestForm,
+        request: Optional[Request] = None,
+    ) -> Optional[UserCredentials]:
         """
         Authenticate a user based on provided credentials.
 
         This method checks the user's credentials and verifies the password.
         If the password is incorrect, it returns None. If the user is found and
-        the password is valid, the user object is returned, potentially with
-        an updated password hash.
+        the password is valid, the user's credentials row is returned, potentially with
+        an updated password hash. Only the columns a login needs are selected; only the
+        rare rehash loads the full entity.
 
         :param credentials: OAuth2PasswordRequestForm containing the user's username (email) and password.
-        :return: The authenticated UserTable instance if the credentials are valid, or None if authentication fails.
+        :param request: Optional FastAPI Request object, passed to ``on_after_login_failure``.
+        :return: The credentials of the authenticated user if they are valid, or None if authentication fails.
         """
-        try:
-            user = await self.get_user_by_email(credentials.username)
-        except UserNotExists:
-            hash_password(credentials.password)
+        email = normalize_email(credentials.username)
+        user = await self.user_db.get_credentials_by_email(email)
+        if not user:
+            await run_password_hashing(hash_password, credentials.password)
+            await self.on_after_login_failure(email, None, request)
+            return None
+
+        verified, updated_password_hash = await run_password_hashing(
+            verify_and_update_password,
+            credentials.password,
+            str(user.hashed_password),
+        )
+        if not verified:
+            await self.on_after_login_failure(email, user, request)
             return None
 
-        if user:
-            verified, updated_password_hash = verify_and_update_password(
-                credentials.password,
-                str(user.hashed_password),
-            )
-            if not verified:
-                return None
-
-            if updated_password_hash:
-                user = await self.user_db.update_user(
-                    user,
+        if updated_password_hash:
+            try:
+                # A rehash is not a change of the user, so no update event is written.
+                await self.user_db.update_user(
+                    await self.get_user_by_id(user.id),
                     {"hashed_password": updated_password_hash},
+                    emit_event=False,
                 )
-            return user
-        return None
+                user = user._replace(hashed_password=updated_password_hash)
+            except UserUpdateConflict:
+                # The user changed meanwhile; the hash is upgraded on a later login.
+                pass
+        return user
 
-    async def _update_user(
-        self, user: UserTable, update_dict: dict[str, Any]
+    async def oauth_callback(
+        self,
+        oauth_name: str,
+        access_token: str,
+        account_id: str,
+        account_email: str,
+        expires_at: Optional[int] = None,
+        refresh_token: Optional[str] = None,
+        request: Optional[Request] = None,
+        *,
+        associate_by_email: bool = False,
+        is_verified_by_default: bool = False,
     ) -> UserTable:
-        validate_dict = {}
-        for k, v in update_dict.items():
-            if k == "email" and v != user.email:
-                try:
-                    await self.get_user_by_email(v)
-                    raise UserAlreadyExists(ErrorCode.UPDATE_USER_EMAIL_ALREADY_EXISTS)
-                except UserNotExists:
-                    validate_dict["email"] = v
-                    validate_dict["is_verified"] = False
-            elif k == "password":
-                if not verify_password(v, user.hashed_password):
-                    password = update_dict["password"]
-                    validate_password(password)
-                    validate_dict["hashed_password"] = hash_password(password)
-                else:
-                    raise InvalidPasswordException(
-                        ErrorCode.UPDATE_USER_INVALID_PASSWORD
-                    )
+        """
+        Find or create the user for an OAuth login and store the latest provider tokens.
+
+        A known OAuth account resolves to its user with one indexed lookup. An unknown account
+        is linked to the user with the same email if ``associate_by_email`` is set, otherwise a
+        new user with a random password is created. The tokens are then written with a single
+        upsert.
+
+        :param oauth_name: The name of the OAuth provider.
+        :param access_token: The access token issued by the provider.
+        :param account_id: The account ID at the provider.
+        :param account_email: The account email at the provider.
+        :param expires_at: Optional expiry of the access token, as a UNIX timestamp.
+        :param refresh_token: Optional refresh token issued by the provider.
+        :param request: Optional FastAPI Request object, useful for logging or additional context.
+        :param associate_by_email: Link the account to an existing user with the same email.
+        :param is_verified_by_default: Mark users created from this provider as verified.
+        :raises UserAlreadyExists: Raised if a user with the email exists and linking by email is disabled.
+        :raises OAuthAccountAlreadyLinked: Raised if the account belongs to a user of another tenant.
+        :return: The user owning the OAuth account.
+        """
+        oauth_account_dict = {
+            "oauth_name": oauth_name,
+            "access_token": access_token,
+            "account_id": account_id,
+            "account_email": account_email,
+            "expires_at": expires_at,
+            "refresh_token": refresh_token,
+        }
+
+        # Linking an account to an existing user changes that user; creating a user already
+        # publishes its registration, and a known account only gets fresh tokens.
+        linked_by_email = False
+        user = await self.user_db.get_by_oauth_account(oauth_name, account_id)
+        if user is None:
+            user = await self.user_db.get_user_by_email(account_email)
+            if user is None:
+                user = await self.user_db.create_user(
+                    {
+                        "email": account_email,
+                        "hashed_password": await run_password_hashing(
+                            hash_password, secrets.token_urlsafe(32)
+                        ),
+                        "is_verified": is_verified_by_default,
+                    }
+                )
+                await self.on_after_register(user, request)
+            elif not associate_by_email:
+                raise UserAlreadyExists()
             else:
-                validate_dict[k] = v
-        return await self.user_db.update_user(user, validate_dict)
+                linked_by_email = True
+
+        linked_user = await self.user_db.upsert_oauth_account(
+            user, oauth_account_dict, emit_event=linked_by_email
+        )
+        if linked_user is None:
+            raise OAuthAccountAlreadyLinked(ErrorCode.OAUTH_ACCOUNT_ALREADY_LINKED)
+        if linked_by_email and linked_user.id == user.id:
+            await self.on_after_update(linked_user, {"oauth_name": oauth_name}, request)
+        return linked_user
+
+    async def oauth_associate_callback(
+        self,
+        user: UserSnapshot,
+        oauth_name: str,
+        access_token: str,
+        account_id: str,
+        account_email: str,
+        expires_at: Optional[int] = None,
+        refresh_token: Optional[str] = None,
+        request: Optional[Request] = None,
+    ) -> UserTable:
+        """
+        Link an OAuth account to an already authenticated user.
+
+        :param user: The authenticated user.
+        :raises OAuthAccountAlreadyLinked: Raised if the account belongs to another user.
+        :return: The user with its OAuth accounts loaded.
+        """
+        linked_user = await self.user_db.upsert_oauth_account(
+            user,
+            {
+                "oauth_name": oauth_name,
+                "access_token": access_token,
+                "account_id": account_id,
+                "account_email": account_email,
+                "expires_at": expires_at,
+                "refresh_token": refresh_token,
+            },
+            emit_event=True,
+        )
+        if linked_user is None or linked_user.id != user.id:
+            raise OAuthAccountAlreadyLinked(ErrorCode.OAUTH_ACCOUNT_ALREADY_LINKED)
+        await self.on_after_update(linked_user, {"oauth_name": oauth_name}, request)
+        return linked_user
+
+    async def request_verify(
+        self, user: UserTable, request: Optional[Request] = None
+    ) -> None:
+        """
+        Issue a verification token for a user and hand it to ``on_after_request_verify``.
+
+        The token is a signed JWT bound to the user's current email, so nothing is stored
+        when it is issued and it stops working once the email changes.
+
+        :param user: The user to verify.
+        :param request: Optional FastAPI Request object, useful for logging or additional context.
+        :raises UserInactive: Raised if the user is not active.
+        :raises UserAlreadyVerified: Raised if the user is already verified.
+        """
+        if not user.is_active:
+            raise UserInactive()
+        if user.is_verified:
+            raise UserAlreadyVerified()
+        token = encode_jwt(
+            payload={
+                "sub": str(user.id),
+                "email": user.email,
+                "aud": VERIFY_TOKEN_AUDIENCE,
+            },
+            token_expires_delta=settings.VERIFY_TOKEN_EXPIRES_MINUTES,
+        )
+        await self.on_after_request_verify(user, token, request)
+
+    async def verify(self, token: str, request: Optional[Request] = None) -> UserTable:
+        """
+        Verify a user with a token issued by ``request_verify``.
+
+        Checking the token takes one signature check and one primary key lookup.
+
+        :param token: The verification token.
+        :param request: Optional FastAPI Request object, useful for logging or additional context.
+        :raises InvalidVerifyToken: Raised if the token is invalid, expired or was issued for another email.
+        :raises UserAlreadyVerified: Raised if the user is already verified.
+        :return: The verified user.
+        """
+        try:
+            data = decode_jwt(token, token_audience=VERIFY_TOKEN_AUDIENCE)
+            user = await self.get_user_by_id(await self.parse_id(data["sub"]))
+        except (PyJWTError, KeyError, InvalidID, UserNotExists):
+            raise InvalidVerifyToken()
+
+        async def verify_update(user: UserTable) -> dict[str, Any]:
+            if data.get("email") != user.email:
+                raise InvalidVerifyToken()
+            if user.is_verified:
+                raise UserAlreadyVerified()
+            return {"is_verified": True}
+
+        verified_user, _ = await self._update_with_retry(user, verify_update)
+        self._invalidate_tokens(verified_user)
+        await self.on_after_verify(verified_user, request)
+        return verified_user
+
+    async def forgot_password(
+        self, user: UserTable, request: Optional[Request] = None
+    ) -> None:
+        """
+        Issue a password reset token for a user and hand it to ``on_after_forgot_password``.
+
+        The token embeds a fingerprint of the current password hash, so it can be used only
+        once: resetting the password changes the hash and spends every outstanding token,
+        without a token table or a database write when the token is issued.
+
+        :param user: The user who forgot their password.
+        :param request: Optional FastAPI Request object, useful for logging or additional context.
+        :raises UserInactive: Raised if the user is not active.
+        """
+        if not user.is_active:
+            raise UserInactive()
+        token = encode_jwt(
+            payload={
+                "sub": str(user.id),
+                "password_fgpt": get_password_fingerprint(user.hashed_password),
+                "aud": RESET_PASSWORD_TOKEN_AUDIENCE,
+            },
+            token_expires_delta=settings.RESET_PASSWORD_TOKEN_EXPIRES_MINUTES,
+        )
+        await self.on_after_forgot_password(user, token, request)
+
+    async def reset_password(
+        self, token: str, password: str, request: Optional[Request] = None
+    ) -> UserTable:
+        """
+        Set a new password with a token issued by ``forgot_password``.
+
+        :param token: The password reset token.
+        :param password: The new password.
+        :param request: Optional FastAPI Request object, useful for logging or additional context.
+        :raises InvalidResetPasswordToken: Raised if the token is invalid, expired or already used.
+        :raises UserInactive: Raised if the user is not active.
+        :raises InvalidPasswordException: Raised if the new password is invalid.
+        :return: The updated user.
+        """
+        try:
+            data = decode_jwt(token, token_audience=RESET_PASSWORD_TOKEN_AUDIENCE)
+            user = await self.get_user_by_id(await self.parse_id(data["sub"]))
+        except (PyJWTError, KeyError, InvalidID, UserNotExists):
+            raise InvalidResetPasswordToken()
+        hashed_password: Optional[str] = None
+
+        async def reset_update(user: UserTable) -> dict[str, Any]:
+            nonlocal hashed_password
+            if not hmac.compare_digest(
+                str(data.get("password_fgpt")),
+                get_password_fingerprint(user.hashed_password),
+            ):
+                raise InvalidResetPasswordToken()
+            if not user.is_active:
+                raise UserInactive()
+            if hashed_password is None:
+                validate_password(password)
+                hashed_password = await run_password_hashing(hash_password, password)
+            return {"hashed_password": hashed_password}
+
+        updated_user, _ = await self._update_with_retry(user, reset_update)
+        self._invalidate_tokens(updated_user)
+        await self.on_after_reset_password(updated_user, request)
+        return updated_user
+
+    async def _update_user(
+        self,
+        user: UserTable,
+        update_dict: dict[str, Any],
+        current_password: Optional[str] = None,
+    ) -> tuple[UserTable, dict[str, Any]]:
+        async def validate_update(user: UserTable) -> dict[str, Any]:
+            if current_password is not None and not await run_password_hashing(
+                verify_password, current_password, user.hashed_password
+            ):
+                raise InvalidCurrentPassword()
+            validate_dict = {}
+            for k, v in update_dict.items():
+                if k == "email":
+                    if v == user.email:
+                        continue
+                    try:
+                        await self.get_user_by_email(v)
+                        raise UserAlreadyExists(
+                            ErrorCode.UPDATE_USER_EMAIL_ALREADY_EXISTS
+                        )
+                    except UserNotExists:
+                        validate_dict["email"] = v
+                        validate_dict["is_verified"] = False
+                elif k == "password":
+                    if not await run_password_hashing(
+                        verify_password, v, user.hashed_password
+                    ):
+                        password = update_dict["password"]
+                        validate_password(password)
+                        validate_dict["hashed_password"] = await run_password_hashing(
+                            hash_password, password
+                        )
+                    else:
+                        raise InvalidPasswordException(
+                            ErrorCode.UPDATE_USER_INVALID_PASSWORD
+                        )
+                else:
+                    validate_dict[k] = v
+            return {k: v for k, v in validate_dict.items() if getattr(user, k) != v}
+
+        return await self._update_with_retry(user, validate_update)
+
+    async def _update_with_retry(
+        self,
+        user: UserTable,
+        build_update_dict: Callable[[UserTable], Awaitable[dict[str, Any]]],
+    ) -> tuple[UserTable, dict[str, Any]]:
+        """
+        Writes the changes ``build_update_dict`` derives from the user, with optimistic locking.
+
+        The write is rejected when the user changed since it was loaded. The user is then
+        reloaded and the changes are derived again from the fresh row, up to
+        ``USER_UPDATE_MAX_RETRIES`` times, so checks such as the current password are never
+        made against stale data and no concurrent change is overwritten. Nothing is written
+        when there are no changes.
+
+        :raises UserUpdateConflict: Raised if the user changed again before every retry.
+        :return: The user and the changes written to it.
+        """
+        user_id = user.id
+        retries = 0
+        while True:
+            try:
+                # ``build_update_dict`` may await, e.g. to hash a password, while another
+                # request writes the same user; the write is checked against this version.
+                version = user.version
+                changes = await build_update_dict(user)
+                if not changes:
+                    return user, changes
+                updated_user = await self.user_db.update_user(
+                    user, changes, expected_version=version
+                )
+                return updated_user, changes
+            except UserUpdateConflict:
+                retries += 1
+                if retries > settings.USER_UPDATE_MAX_RETRIES:
+                    raise
+                user = await self.get_user_by_id(user_id)
 
     async def on_after_register(
         self,
@@ -186,20 +628,125 @@ class UserManager(BaseUserManager[UserTable, UUID]):
         :param created_user: The UserTable instance representing the newly created user.
         :param request: Optional FastAPI Request object, which may provide context for the registration event.
         """
-        pass
+        await self._publish(USER_REGISTERED, created_user, request)
 
-    async def on_after_update(self, request: Optional[Request] = None):
+    async def on_after_update(
+        self,
+        user: UserTable,
+        update_dict: dict[str, Any],
+        request: Optional[Request] = None,
+    ):
         """
         Hook method called after a user is updated.
 
         This method can be used for post-update tasks, such as logging the update event
         or notifying the user of changes to their account.
 
+        :param user: The UserTable instance representing the updated user.
+        :param update_dict: The changes that were written. Only the field names are published.
         :param request: Optional FastAPI Request object, which may provide context for the update event.
         """
-        pass
+        await self._publish(USER_UPDATED, user, request, fields=sorted(update_dict))
+
+    async def on_after_delete(self, user: UserTable, request: Optional[Request] = None):
+        """
+        Hook method called after a user is deleted.
+
+        :param user: The UserTable instance representing the deleted user.
+        :param request: Optional FastAPI Request object, which may provide context for the event.
+        """
+        await self._publish(USER_DELETED, user, request)
 
     async def on_after_login(
         self, user, request: Optional[Request] = None, response=None
     ):
-        pass
+        await self._publish(USER_LOGGED_IN, user, request)
+
+    async def on_after_login_failure(
+        self,
+        email: str,
+        user: Optional[UserCredentials] = None,
+        request: Optional[Request] = None,
+    ):
+        """
+        Hook method called after a failed login attempt.
+
+        :param email: The email the login was attempted with.
+        :param user: The credentials of the user if the email belongs to one, None otherwise.
+        :param request: Optional FastAPI Request object, which may provide context for the event.
+        """
+        if self.event_bus is None:
+            return
+        if user is not None:
+            payload = user_event_payload(user, request)
+        else:
+            payload = {"user_id": None, "email": email}
+            if request is not None:
+                payload.update(request_event_context(request))
+        await self.event_bus.publish(Event(USER_LOGIN_FAILED, payload))
+
+    async def on_after_request_verify(
+        self, user: UserTable, token: str, request: Optional[Request] = None
+    ):
+        """
+        Hook method called after a verification token is issued, e.g. to email it to the user.
+
+        :param user: The UserTable instance representing the user to verify.
+        :param token: The verification token.
+        :param request: Optional FastAPI Request object, which may provide context for the event.
+        """
+        await self._publish(USER_VERIFY_REQUESTED, user, request, token=token)
+
+    async def on_after_verify(self, user: UserTable, request: Optional[Request] = None):
+        """
+        Hook method called after a user is verified.
+
+        :param user: The UserTable instance representing the verified user.
+        :param request: Optional FastAPI Request object, which may provide context for the event.
+        """
+        await self._publish(USER_VERIFIED, user, request)
+
+    async def on_after_forgot_password(
+        self, user: UserTable, token: str, request: Optional[Request] = None
+    ):
+        """
+        Hook method called after a password reset token is issued, e.g. to email it to the user.
+
+        :param user: The UserTable instance representing the user who forgot their password.
+        :param token: The password reset token.
+        :param request: Optional FastAPI Request object, which may provide context for the event.
+        """
+        await self._publish(USER_FORGOT_PASSWORD, user, request, token=token)
+
+    async def on_after_reset_password(
+        self, user: UserTable, request: Optional[Request] = None
+    ):
+        """
+        Hook method called after a user has reset their password.
+
+        :param user: The UserTable instance representing the user.
+        :param request: Optional FastAPI Request object, which may provide context for the event.
+        """
+        await self._publish(USER_PASSWORD_RESET, user, request)
+
+    def _invalidate_tokens(self, user: UserTable) -> None:
+        if self.token_cache is not None:
+            self.token_cache.invalidate_subject(str(user.id))
+
+    async def _publish(
+        self,
+        event_type: str,
+        user: UserTable,
+        request: Optional[Request] = None,
+        **extra: Any,
+    ) -> None:
+        if self.event_bus is None or event_type in self._outbox_events:
+            return
+        payload = {**user_event_payload(user, request), **extra}
+        await self.event_bus.publish(Event(event_type, payload))
+
+    @property
+    def _outbox_events(self) -> frozenset[str]:
+        if getattr(self.user_db, "outbox_table", None) is None:
+            return frozenset()
+        return OUTBOX_EVENTS
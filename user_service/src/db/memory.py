@@ -0,0 +1,368 @@
+import json
+import logging
+import mmap
+import os
+from datetime import datetime, UTC
+from pathlib import Path
+from typing import Any, Optional, Sequence, Union
+from uuid import UUID
+from sqlalchemy import Table
+from user_service.src.core.config import settings
+from user_service.src.core.emails import normalize_email
+from user_service.src.core.exceptions import UserAlreadyExists, UserUpdateConflict
+from user_service.src.core.interfaces import BaseUserDatabase
+from user_service.src.core.typing import StringType
+from user_service.src.models import (
+    UserTable,
+    OAuthAccountTable,
+    UserSnapshot,
+    UserCredentials,
+    UserIdentity,
+)
+from user_service.src.workers.base import PeriodicWorker
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_VERSION = 1
+
+
+class InMemoryUserStore(PeriodicWorker):
+    """
+    Process-wide storage behind ``InMemoryUserDatabase``.
+
+    Users are kept as detached ``UserTable`` instances in a hash index by ID, with a second
+    hash index by lower-cased email and tenant, and OAuth accounts are indexed by provider
+    and account ID. Every operation runs without awaiting, so it is atomic with respect to
+    other tasks on the event loop and needs no lock.
+
+    With a ``snapshot_path`` the store is written to a memory-mapped file every ``interval``
+    seconds when it changed, and on ``stop``, and ``load`` restores it on startup. The file
+    is replaced atomically, so a crash leaves the previous snapshot intact.
+
+    :param snapshot_path: Optional file the store is persisted to.
+    :param interval: Seconds between snapshot writes.
+    """
+
+    def __init__(
+        self,
+        snapshot_path: Optional[Path] = settings.MEMORY_DB_SNAPSHOT_PATH,
+        *,
+        interval: float = settings.MEMORY_DB_SNAPSHOT_INTERVAL_SECONDS,
+    ):
+        super().__init__(interval)
+        self.snapshot_path = snapshot_path
+        self.users: dict[UUID, UserTable] = {}
+        self.emails: dict[str, dict[str, UUID]] = {}
+        self.oauth_accounts: dict[tuple[str, str], OAuthAccountTable] = {}
+        self.dirty = False
+
+    def clear(self) -> None:
+        self.users.clear()
+        self.emails.clear()
+        self.oauth_accounts.clear()
+        self.dirty = True
+
+    async def run_once(self) -> int:
+        if not self.dirty or self.snapshot_path is None:
+            return 0
+        return self.save()
+
+    async def stop(self) -> None:
+        await super().stop()
+        await self.run_once()
+
+    def save(self, path: Optional[Path] = None) -> int:
+        """
+        Writes every user and OAuth account to a memory-mapped file.
+
+        :return: The number of written users.
+        """
+        path = path or self.snapshot_path
+        data = json.dumps(
+            {
+                "version": SNAPSHOT_VERSION,
+                "users": [_dump(UserTable.__table__, u) for u in self.users.values()],
+                "oauth_accounts": [
+                    _dump(OAuthAccountTable.__table__, account)
+                    for account in self.oauth_accounts.values()
+                ],
+            },
+            separators=(",", ":"),
+        ).encode()
+        temporary_path = path.with_name(path.name + ".tmp")
+        with open(temporary_path, "w+b") as file:
+            file.truncate(len(data))
+            with mmap.mmap(file.fileno(), len(data)) as mapped:
+                mapped[:] = data
+                mapped.flush()
+        os.replace(temporary_path, path)
+        self.dirty = False
+        return len(self.users)
+
+    def load(self, path: Optional[Path] = None) -> int:
+        """
+        Replaces the content of the store with a snapshot written by ``save``.
+
+        :return: The number of loaded users, 0 if there is no snapshot yet.
+        """
+        path = path or self.snapshot_path
+        if path is None or not path.exists() or path.stat().st_size == 0:
+            return 0
+        with open(path, "rb") as file:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                data = json.loads(mapped[:])
+        if data.get("version") != SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported snapshot version {data.get('version')}")
+        self.clear()
+        for values in data["users"]:
+            self.add_user(UserTable(**_load(UserTable.__table__, values)))
+        for values in data["oauth_accounts"]:
+            account = OAuthAccountTable(**_load(OAuthAccountTable.__table__, values))
+            self.users[account.user_id].oauth_accounts.append(account)
+            self.oauth_accounts[(account.oauth_name, account.account_id)] = account
+        self.dirty = False
+        logger.info("Loaded %d users from %s", len(self.users), path)
+        return len(self.users)
+
+    def add_user(self, user: UserTable) -> None:
+        if user.deleted_at is None:
+            tenants = self.emails.setdefault(user.email, {})
+            if user.tenant_id in tenants:
+                raise UserAlreadyExists()
+            tenants[user.tenant_id] = user.id
+        self.users[user.id] = user
+        self.dirty = True
+
+    def move_email(self, user: UserTable, email: str) -> None:
+        tenants = self.emails.setdefault(email, {})
+        if user.tenant_id in tenants:
+            raise UserAlreadyExists()
+        tenants[user.tenant_id] = user.id
+        self.unindex_email(user)
+        self.dirty = True
+
+    def unindex_email(self, user: UserTable) -> None:
+        tenants = self.emails.get(user.email, {})
+        if tenants.get(user.tenant_id) == user.id:
+            del tenants[user.tenant_id]
+        if not tenants:
+            self.emails.pop(user.email, None)
+
+
+class InMemoryUserDatabase(BaseUserDatabase[UserTable, UUID]):
+    """
+    In-memory implementation of the user database interface, for edge deployments and
+    load tests.
+
+    It is a cheap per-request view on a shared ``InMemoryUserStore``, optionally scoped to a
+    tenant like ``SQLAlchemyUserDatabase``. Users are returned as detached ``UserTable``
+    instances owned by the store, so changes must go through ``update_user``. Duplicate
+    emails within a tenant raise ``UserAlreadyExists``. Deleted users are soft-deleted like
+    in ``SQLAlchemyUserDatabase`` and free their email; the store has no archive tier.
+
+    :param store: The store holding the users.
+    :param tenant_id: Optional tenant the database is scoped to.
+    """
+
+    def __init__(self, store: InMemoryUserStore, tenant_id: Optional[str] = None):
+        self.store = store
+        self.tenant_id = tenant_id
+
+    async def get_user_by_id(self, user_id: UUID) -> Optional[UserTable]:
+        user = self.store.users.get(user_id)
+        if user is None or not self._visible(user):
+            return None
+        return user
+
+    async def get_user_by_email(self, email: StringType) -> Optional[UserTable]:
+        tenants = self.store.emails.get(normalize_email(email))
+        if not tenants:
+            return None
+        if self.tenant_id is None:
+            user_id = next(iter(tenants.values()))
+        else:
+            user_id = tenants.get(self.tenant_id)
+        return await self.get_user_by_id(user_id) if user_id is not None else None
+
+    async def get_snapshot_by_id(self, user_id: UUID) -> Optional[UserSnapshot]:
+        user = await self.get_user_by_id(user_id)
+        return UserSnapshot.from_table(user) if user is not None else None
+
+    async def get_snapshot_by_email(self, email: StringType) -> Optional[UserSnapshot]:
+        user = await self.get_user_by_email(email)
+        return UserSnapshot.from_table(user) if user is not None else None
+
+    async def get_credentials_by_email(
+        self, email: StringType
+    ) -> Optional[UserCredentials]:
+        user = await self.get_user_by_email(email)
+        if user is None:
+            return None
+        return UserCredentials(
+            user.id, user.email, user.hashed_password, user.is_active
+        )
+
+    async def get_identity_by_id(self, user_id: UUID) -> Optional[UserIdentity]:
+        user = await self.get_user_by_id(user_id)
+        if user is None:
+            return None
+        return UserIdentity(user.id, user.email, user.is_active)
+
+    async def get_by_oauth_account(
+        self, oauth: str, account_id: str
+    ) -> Optional[UserTable]:
+        account = self.store.oauth_accounts.get((oauth, account_id))
+        if account is None:
+            return None
+        return await self.get_user_by_id(account.user_id)
+
+    async def upsert_oauth_account(
+        self, user: UserTable, create_dict: dict[str, Any], *, emit_event: bool = False
+    ) -> Optional[UserTable]:
+        """
+        Links an OAuth account to a user, or refreshes its tokens if it is already linked.
+
+        An account linked to another user is neither moved nor has its tokens overwritten.
+
+        :return: The user owning the account, or None if the account is linked to a user
+            of another tenant.
+        """
+        key = (create_dict["oauth_name"], create_dict["account_id"])
+        account = self.store.oauth_accounts.get(key)
+        if account is None:
+            account = OAuthAccountTable(
+                **_with_defaults(OAuthAccountTable.__table__, create_dict),
+                user_id=user.id,
+            )
+            self.store.users[user.id].oauth_accounts.append(account)
+            self.store.oauth_accounts[key] = account
+        elif account.user_id == user.id:
+            for name, value in create_dict.items():
+                setattr(account, name, value)
+        self.store.dirty = True
+        return await self.get_user_by_id(account.user_id)
+
+    async def create_user(self, create_dict: dict[str, Any]) -> UserTable:
+        create_dict = {**create_dict, "email": normalize_email(create_dict["email"])}
+        if self.tenant_id is not None:
+            create_dict["tenant_id"] = self.tenant_id
+        user = UserTable(**_with_defaults(UserTable.__table__, create_dict))
+        self.store.add_user(user)
+        return user
+
+    async def update_user(
+        self,
+        user: UserTable,
+        update_dict: dict[str, Union[str, bool]],
+        *,
+        emit_event: bool = True,
+        expected_version: Optional[int] = None,
+    ) -> UserTable:
+        # Users are shared by every view on the store, so the version the caller read is
+        # the only way to tell that another request changed the user meanwhile.
+        if expected_version is not None and user.version != expected_version:
+            raise UserUpdateConflict()
+        if "email" in update_dict:
+            update_dict = {
+                **update_dict,
+                "email": normalize_email(update_dict["email"]),
+            }
+        email = update_dict.get("email", user.email)
+        if email != user.email:
+            self.store.move_email(user, email)
+        for key, value in update_dict.items():
+            setattr(user, key, value)
+        user.version += 1
+        user.updated_at = datetime.now(UTC)
+        self.store.dirty = True
+        return user
+
+    async def delete_user(self, user: UserTable) -> None:
+        user.deleted_at = user.updated_at = datetime.now(UTC)
+        user.version += 1
+        self.store.unindex_email(user)
+        self.store.dirty = True
+
+    async def bulk_update_users(
+        self, user_ids: Sequence[UUID], update_dict: dict[str, Any]
+    ) -> list[UserIdentity]:
+        identities = []
+        for user_id in user_ids:
+            user = await self.get_user_by_id(user_id)
+            if user is None or all(
+                getattr(user, key) == value for key, value in update_dict.items()
+            ):
+                continue
+            for key, value in update_dict.items():
+                setattr(user, key, value)
+            user.version += 1
+            user.updated_at = datetime.now(UTC)
+            identities.append(UserIdentity(user.id, user.email, user.is_active))
+        if identities:
+            self.store.dirty = True
+        return identities
+
+    async def update_oauth_account(
+        self,
+        user: UserTable,
+        oauth_account: OAuthAccountTable,
+        update_dict: dict[str, Union[str, bool]],
+    ) -> UserTable:
+        for key, value in update_dict.items():
+            setattr(oauth_account, key, value)
+        self.store.dirty = True
+        return user
+
+    def _visible(self, user: UserTable) -> bool:
+        if user.deleted_at is not None:
+            return False
+        return self.tenant_id is None or user.tenant_id == self.tenant_id
+
+
+def _with_defaults(table: Table, values: dict[str, Any]) -> dict[str, Any]:
+    """
+    Applies the column defaults that SQLAlchemy would otherwise only apply on INSERT.
+    """
+    values = dict(values)
+    for column in table.columns:
+        if column.name in values or column.default is None:
+            continue
+        if column.default.is_callable:
+            values[column.name] = column.default.arg(None)
+        elif column.default.is_scalar:
+            values[column.name] = column.default.arg
+    return values
+
+
+def _dump(table: Table, instance: Any) -> dict[str, Any]:
+    values = {}
+    for column in table.columns:
+        value = getattr(instance, column.name)
+        if isinstance(value, UUID):
+            value = str(value)
+        elif isinstance(value, datetime):
+            value = value.isoformat()
+        values[column.name] = value
+    return values
+
+
+def _load(table: Table, values: dict[str, Any]) -> dict[str, Any]:
+    # Columns added since the snapshot was written get their default.
+    return _with_defaults(
+        table,
+        {
+            column.name: _load_value(column.type.python_type, values[column.name])
+            for column in table.columns
+            if column.name in values
+        },
+    )
+
+
+def _load_value(python_type: type, value: Any) -> Any:
+    if value is None:
+        return None
+    if python_type is UUID:
+        return UUID(value)
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    return value
@@ -0,0 +1,45 @@
+from typing import Any, Optional
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+
+class LazyAsyncSession:
+    """
+    Proxy that creates the underlying AsyncSession on first use.
+
+    ``AsyncSession`` already waits for the first statement before it checks out a pool
+    connection, but building and closing one still costs a greenlet round trip per request.
+    The proxy skips both for requests that never reach the database, e.g. registrations that
+    fail password validation or lookups answered from a cache. Any attribute access is
+    forwarded to the real session, so it can be passed wherever an ``AsyncSession`` is
+    expected.
+
+    :param session_maker: The factory used to create the session on first use.
+    """
+
+    def __init__(self, session_maker: async_sessionmaker[AsyncSession]):
+        self._session_maker = session_maker
+        self._session: Optional[AsyncSession] = None
+
+    @property
+    def is_started(self) -> bool:
+        return self._session is not None
+
+    @property
+    def session(self) -> AsyncSession:
+        if self._session is None:
+            self._session = self._session_maker()
+        return self._session
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.session, name)
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self) -> "LazyAsyncSession":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
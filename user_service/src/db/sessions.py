@@ -0,0 +1,223 @@
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, UTC
+from typing import Any, Optional
+from uuid import UUID, uuid4
+from sqlalchemy import bindparam, delete, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from user_service.src.core.cache import TokenIntrospectionCache
+from user_service.src.core.config import settings
+from user_service.src.core.events import request_event_context
+from user_service.src.core.interfaces import UserProtocol
+from user_service.src.models import SessionTable
+from user_service.src.workers.base import PeriodicWorker
+
+
+class SessionRegistry(PeriodicWorker):
+    """
+    Registry of the sessions behind issued access tokens, keyed by the token's ``jti``.
+
+    Checking a session on every request must not cost a query, so ``is_active`` answers
+    from a bounded cache that is trusted for ``cache_ttl`` seconds, and ``touch`` only
+    records the last-seen time in memory. Touches of the same session are coalesced and
+    written every ``interval`` seconds with a single executemany UPDATE, which also purges
+    expired sessions. Creating a session evicts the oldest ones of the user beyond
+    ``max_sessions``. Revoked and evicted sessions are also dropped from ``token_cache`` so
+    introspection stops reporting their tokens as active. Sessions revoked or evicted by
+    another instance stay usable there until its cache entries expire.
+
+    :param session_maker: The factory used to open a database session per operation.
+    :param session_table: The SQLAlchemy model representing the sessions table.
+    :param max_sessions: Maximum number of active sessions per user.
+    :param interval: Seconds between writes of the last-seen buffer.
+    :param cache_ttl: Seconds a cached session status is trusted.
+    :param cache_size: Maximum number of cached session statuses.
+    :param token_cache: Optional introspection cache to drop revoked sessions from.
+    """
+
+    def __init__(
+        self,
+        session_maker: async_sessionmaker[AsyncSession],
+        session_table: type[SessionTable] = SessionTable,
+        *,
+        max_sessions: int = settings.SESSIONS_MAX_PER_USER,
+        interval: float = settings.SESSIONS_FLUSH_INTERVAL_SECONDS,
+        cache_ttl: float = settings.SESSIONS_CACHE_TTL_SECONDS,
+        cache_size: int = settings.SESSIONS_CACHE_SIZE,
+        token_cache: Optional[TokenIntrospectionCache] = None,
+    ):
+        super().__init__(interval)
+        self.session_maker = session_maker
+        self.session_table = session_table
+        self.max_sessions = max_sessions
+        self.cache_ttl = cache_ttl
+        self.cache_size = cache_size
+        self.token_cache = token_cache
+        self._cache: OrderedDict[str, tuple[bool, float]] = OrderedDict()
+        self._last_seen: dict[str, datetime] = {}
+
+    async def create(
+        self,
+        user: UserProtocol,
+        request: Optional[Any] = None,
+        expires_in_minutes: int = settings.JWT_ACCESS_TOKEN_EXPIRES_MINUTES,
+    ) -> SessionTable:
+        """
+        Registers a new session and evicts the oldest sessions of the user beyond the cap.
+
+        :param user: The user the session belongs to.
+        :param request: Optional FastAPI Request object, used to record the device.
+        :param expires_in_minutes: Lifetime of the session, matching its access token.
+        :return: The new session; its ``jti`` goes into the access token.
+        """
+        table = self.session_table
+        now = datetime.now(UTC)
+        device = request_event_context(request) if request is not None else {}
+        user_agent = device.get("user_agent")
+        new_session = table(
+            jti=uuid4().hex,
+            user_id=user.id,
+            created_at=now,
+            last_seen_at=now,
+            expires_at=now + timedelta(minutes=expires_in_minutes),
+            ip=device.get("ip"),
+            user_agent=user_agent[:255] if user_agent else None,
+        )
+        oldest = (
+            select(table.jti)
+            .where(table.user_id == user.id)
+            .order_by(table.created_at.desc(), table.jti.desc())
+            .offset(self.max_sessions)
+        )
+        async with self.session_maker() as session, session.begin():
+            session.add(new_session)
+            await session.flush()
+            evicted = await session.scalars(
+                delete(table).where(table.jti.in_(oldest)).returning(table.jti)
+            )
+            for jti in evicted:
+                self._forget(jti)
+        self._cache_status(new_session.jti, True)
+        return new_session
+
+    async def is_active(self, jti: str) -> bool:
+        """
+        Whether the session exists. Answered from the cache when possible.
+        """
+        cached = self._cache.get(jti)
+        if cached is not None and time.monotonic() - cached[1] < self.cache_ttl:
+            return cached[0]
+        table = self.session_table
+        async with self.session_maker() as session:
+            expires_at = await session.scalar(
+                select(table.expires_at).where(table.jti == jti)
+            )
+        active = expires_at is not None and _aware(expires_at) > datetime.now(UTC)
+        self._cache_status(jti, active)
+        return active
+
+    def touch(self, jti: str) -> None:
+        """
+        Records that the session was just used. Written to the database on the next flush.
+        """
+        self._last_seen[jti] = datetime.now(UTC)
+
+    async def list_sessions(self, user_id: UUID) -> list[SessionTable]:
+        """
+        Returns the sessions of a user, newest first, including buffered last-seen times.
+        """
+        table = self.session_table
+        async with self.session_maker() as session:
+            sessions = list(
+                await session.scalars(
+                    select(table)
+                    .where(table.user_id == user_id)
+                    .order_by(table.created_at.desc())
+                )
+            )
+        for user_session in sessions:
+            last_seen_at = self._last_seen.get(user_session.jti)
+            if last_seen_at is not None:
+                user_session.last_seen_at = last_seen_at
+        return sessions
+
+    async def revoke(self, user_id: UUID, jti: str) -> bool:
+        """
+        Deletes a session of a user.
+
+        :return: False if the user has no session with this ``jti``.
+        """
+        table = self.session_table
+        async with self.session_maker() as session, session.begin():
+            revoked = await session.scalar(
+                delete(table)
+                .where(table.jti == jti, table.user_id == user_id)
+                .returning(table.jti)
+            )
+        self._forget(jti)
+        return revoked is not None
+
+    async def revoke_all(self, user_id: UUID, *, keep: Optional[str] = None) -> int:
+        """
+        Deletes every session of a user, e.g. after a password change.
+
+        :param keep: Optional ``jti`` of a session to keep, typically the current one.
+        :return: The number of revoked sessions.
+        """
+        table = self.session_table
+        statement = delete(table).where(table.user_id == user_id)
+        if keep is not None:
+            statement = statement.where(table.jti != keep)
+        async with self.session_maker() as session, session.begin():
+            revoked = list(await session.scalars(statement.returning(table.jti)))
+        for jti in revoked:
+            self._forget(jti)
+        return len(revoked)
+
+    async def run_once(self) -> int:
+        return await self.flush()
+
+    async def stop(self) -> None:
+        await super().stop()
+        await self.flush()
+
+    async def flush(self) -> int:
+        """
+        Writes the buffered last-seen times and purges expired sessions.
+
+        :return: The number of sessions whose last-seen time was written.
+        """
+        last_seen, self._last_seen = self._last_seen, {}
+        table = self.session_table.__table__
+        async with self.session_maker() as session, session.begin():
+            if last_seen:
+                await session.execute(
+                    update(table)
+                    .where(table.c.jti == bindparam("b_jti"))
+                    .values(last_seen_at=bindparam("b_last_seen_at")),
+                    [
+                        {"b_jti": jti, "b_last_seen_at": last_seen_at}
+                        for jti, last_seen_at in last_seen.items()
+                    ],
+                )
+            await session.execute(
+                delete(table).where(table.c.expires_at < datetime.now(UTC))
+            )
+        return len(last_seen)
+
+    def _cache_status(self, jti: str, active: bool) -> None:
+        self._cache[jti] = (active, time.monotonic())
+        self._cache.move_to_end(jti)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def _forget(self, jti: str) -> None:
+        self._cache.pop(jti, None)
+        self._last_seen.pop(jti, None)
+        if self.token_cache is not None:
+            self.token_cache.invalidate_session(jti)
+
+
+def _aware(value: datetime) -> datetime:
+    # SQLite returns naive datetimes even for timezone-aware columns.
+    return value if value.tzinfo is not None else value.replace(tzinfo=UTC)
@@ -1,11 +1,14 @@
+import asyncio
 from logging.config import fileConfig
 
-from sqlalchemy import engine_from_config
-from sqlalchemy import pool
+from sqlalchemy import Connection, pool
 
 from alembic import context
-from user_service.src.models.base import Base
-from user_service.src.models.user import UserTable
+from user_service.src.core.config import settings
+from user_service.src.db.engine import create_db_engine
+from user_service.src.migrations.operations import lock_timeout
+from user_service.src.migrations.runner import advisory_lock
+from user_service.src.models import Base
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -16,16 +19,9 @@ config = context.config
 if config.config_file_name is not None:
     fileConfig(config.config_file_name)
 
-# add your model's MetaData object here
-# for 'autogenerate' support
-# from myapp import mymodel
-# target_metadata = mymodel.Base.metadata
-target_metadata = None
-
-# other values from the config, defined by the needs of env.py,
-# can be acquired:
-# my_important_option = config.get_main_option("my_important_option")
-# ... etc.
+# The models register every table on Base.metadata, so autogenerate compares against all of
+# them, including their functional indexes.
+target_metadata = Base.metadata
 
 
 def run_migrations_offline() -> None:
@@ -40,9 +36,8 @@ def run_migrations_offline() -> None:
     script output.
 
     """
-    url = config.get_main_option("sqlalchemy.url")
     context.configure(
-        url=url,
+        url=settings.ASYNC_DB_URI,
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
@@ -52,24 +47,48 @@ def run_migrations_offline() -> None:
         context.run_migrations()
 
 
-def run_migrations_online() -> None:
-    """Run migrations in 'online' mode.
+def do_run_migrations(connection: Connection) -> None:
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        # Online index builds and backfills commit on their own, so each revision
+        # runs in its own transaction.
+        transaction_per_migration=True,
+    )
+
+    with lock_timeout(connection), context.begin_transaction():
+        context.run_migrations()
+
 
-    In this scenario we need to create an Engine
-    and associate a connection with the context.
+async def run_async_migrations() -> None:
+    """Run migrations with the application's async engine.
+
+    The advisory lock keeps concurrent invocations from
+    migrating at the same time.
 
     """
-    connectable = engine_from_config(
-        config.get_section(config.config_ini_section, {}),
-        prefix="sqlalchemy.",
-        poolclass=pool.NullPool,
-    )
+    connectable = create_db_engine(poolclass=pool.NullPool)
+
+    async with connectable.connect() as connection:
+        async with advisory_lock(connection):
+            await connection.run_sync(do_run_migrations)
 
-    with connectable.connect() as connection:
-        context.configure(connection=connection, target_metadata=target_metadata)
+    await connectable.dispose()
 
-        with context.begin_transaction():
-            context.run_migrations()
+
+def run_migrations_online() -> None:
+    """Run migrations in 'online' mode.
+
+    ``upgrade_database`` passes its own connection, already
+    holding the advisory lock; the alembic command line
+    creates one.
+
+    """
+    connection = config.attributes.get("connection")
+    if connection is None:
+        asyncio.run(run_async_migrations())
+    else:
+        do_run_migrations(connection)
 
 
 if context.is_offline_mode():
@@ -0,0 +1,204 @@
+import logging
+import time
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional, Sequence, Union
+import sqlalchemy as sa
+from alembic import op
+from user_service.src.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def is_postgresql() -> bool:
+    return op.get_bind().dialect.name == "postgresql"
+
+
+@contextmanager
+def lock_timeout(
+    connection: sa.Connection, milliseconds: int = settings.MIGRATION_LOCK_TIMEOUT_MS
+) -> Iterator[None]:
+    """
+    Makes DDL on the connection give up instead of queueing for a lock, on PostgreSQL.
+
+    An ``ALTER TABLE`` waiting behind a long transaction blocks every query queued after it,
+    so a migration that cannot get its lock quickly must fail and be retried rather than
+    stall the service. Run the migrations inside the block: the setting is committed right
+    away, so it survives their commits, and is reset on exit, so a pooled connection goes
+    back to the application with the server default.
+    """
+    if connection.dialect.name != "postgresql":
+        yield
+        return
+    connection.exec_driver_sql(f"SET lock_timeout = {int(milliseconds)}")
+    connection.commit()
+    try:
+        yield
+    finally:
+        connection.rollback()
+        connection.exec_driver_sql("RESET lock_timeout")
+        connection.commit()
+
+
+def create_index_concurrently(
+    index_name: str,
+    table_name: str,
+    columns: Sequence[Union[str, sa.TextClause]],
+    *,
+    unique: bool = False,
+    **kw: Any,
+) -> None:
+    """
+    Creates an index without blocking writes to the table.
+
+    On PostgreSQL the index is built with ``CREATE INDEX CONCURRENTLY`` outside of the
+    migration transaction. A concurrent build that failed leaves an invalid index behind,
+    so one is dropped and rebuilt, and a valid one is kept, which makes the migration safe
+    to rerun. Other databases create the index normally. Extra keyword arguments, such as
+    ``postgresql_where``, are passed to ``op.create_index``.
+    """
+    if not is_postgresql():
+        op.create_index(index_name, table_name, columns, unique=unique, **kw)
+        return
+    with op.get_context().autocommit_block():
+        if op.get_context().as_sql:
+            op.create_index(
+                index_name,
+                table_name,
+                columns,
+                unique=unique,
+                postgresql_concurrently=True,
+                **kw,
+            )
+            return
+        valid = op.get_bind().scalar(
+            sa.text(
+                "SELECT i.indisvalid FROM pg_index i "
+                "JOIN pg_class c ON c.oid = i.indexrelid WHERE c.relname = :name"
+            ),
+            {"name": index_name},
+        )
+        if valid:
+            return
+        if valid is not None:
+            op.drop_index(
+                index_name, table_name=table_name, postgresql_concurrently=True
+            )
+        op.create_index(
+            index_name,
+            table_name,
+            columns,
+            unique=unique,
+            postgresql_concurrently=True,
+            **kw,
+        )
+
+
+def drop_index_concurrently(index_name: str, table_name: str) -> None:
+    """
+    Drops an index without blocking writes to the table, on PostgreSQL.
+    """
+    if not is_postgresql():
+        op.drop_index(index_name, table_name=table_name)
+        return
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            index_name,
+            table_name=table_name,
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def backfill(
+    table_name: str,
+    assignments: str,
+    where: str,
+    *,
+    key: str = "id",
+    batch_size: int = settings.MIGRATION_BACKFILL_BATCH_SIZE,
+    pause: float = settings.MIGRATION_BACKFILL_PAUSE_SECONDS,
+) -> int:
+    """
+    Updates the rows matching ``where`` in batches of ``batch_size`` rows.
+
+    On PostgreSQL every batch is committed on its own, outside of the migration transaction,
+    so row locks are held for one batch only, and the backfill sleeps ``pause`` seconds
+    between batches to leave room for the application's writes. The assignments must make
+    ``where`` false for the updated rows, otherwise the backfill never ends.
+
+    :param table_name: The table to update.
+    :param assignments: The SQL ``SET`` clause, e.g. ``"email = lower(email)"``.
+    :param where: The SQL condition selecting the rows that still need the update.
+    :param key: The primary key column used to select a batch.
+    :param batch_size: Maximum number of rows updated per statement.
+    :param pause: Seconds to wait between batches.
+    :return: The number of updated rows.
+    """
+    if op.get_context().as_sql:
+        # Offline scripts cannot loop on row counts; emit the update in one statement.
+        op.execute(f"UPDATE {table_name} SET {assignments} WHERE {where}")
+        return 0
+    statement = sa.text(
+        f"UPDATE {table_name} SET {assignments} WHERE {key} IN "
+        f"(SELECT {key} FROM {table_name} WHERE {where} LIMIT :batch_size)"
+    )
+    if not is_postgresql():
+        return _backfill_batches(statement, batch_size, 0)
+    with op.get_context().autocommit_block():
+        return _backfill_batches(statement, batch_size, pause)
+
+
+def add_column_expand(table_name: str, column: sa.Column) -> None:
+    """
+    Adds a column in the expand phase of an expand/contract change.
+
+    The column must be nullable or have a server default, so adding it only changes the
+    catalog instead of rewriting the table. Make it required with ``set_not_null_contract``
+    once the application writes it and the existing rows have been backfilled.
+    """
+    if not column.nullable and column.server_default is None:
+        raise ValueError(
+            f"Column {column.name} must be nullable or have a server default to be added online"
+        )
+    with op.batch_alter_table(table_name) as batch_op:
+        batch_op.add_column(column)
+
+
+def set_not_null_contract(
+    table_name: str, column_name: str, constraint_name: Optional[str] = None
+) -> None:
+    """
+    Makes a column NOT NULL in the contract phase of an expand/contract change.
+
+    ``SET NOT NULL`` scans the whole table under an exclusive lock. On PostgreSQL a
+    ``NOT VALID`` check constraint is added and validated first, which scans the table
+    without blocking writes and lets ``SET NOT NULL`` skip its own scan.
+    """
+    if not is_postgresql():
+        with op.batch_alter_table(table_name) as batch_op:
+            batch_op.alter_column(column_name, nullable=False)
+        return
+    constraint_name = constraint_name or f"ck_{table_name}_{column_name}_not_null"
+    # Every step commits on its own, so no lock outlives the statement that took it.
+    with op.get_context().autocommit_block():
+        op.execute(
+            f"ALTER TABLE {table_name} ADD CONSTRAINT {constraint_name} "
+            f"CHECK ({column_name} IS NOT NULL) NOT VALID"
+        )
+        op.execute(f"ALTER TABLE {table_name} VALIDATE CONSTRAINT {constraint_name}")
+        op.alter_column(table_name, column_name, nullable=False)
+        op.drop_constraint(constraint_name, table_name, type_="check")
+
+
+def _backfill_batches(statement: sa.TextClause, batch_size: int, pause: float) -> int:
+    connection = op.get_bind()
+    total = 0
+    while True:
+        updated = connection.execute(statement, {"batch_size": batch_size}).rowcount
+        total += updated
+        if updated < batch_size:
+            break
+        logger.info("Backfilled %d rows", total)
+        if pause:
+            time.sleep(pause)
+    return total
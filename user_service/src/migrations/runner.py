@@ -0,0 +1,78 @@
+import asyncio
+import sys
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import AsyncIterator, Optional
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import Connection, text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+from user_service.src.db.engine import create_db_engine
+
+MIGRATIONS_PATH = Path(__file__).parent
+
+# Key of the PostgreSQL advisory lock held while migrating.
+MIGRATION_LOCK_KEY = 0x75736572
+
+
+def get_alembic_config() -> Config:
+    """
+    Alembic configuration for running migrations from code. Logging is left untouched.
+    """
+    config = Config()
+    config.set_main_option("script_location", str(MIGRATIONS_PATH))
+    return config
+
+
+@asynccontextmanager
+async def advisory_lock(
+    connection: AsyncConnection, key: int = MIGRATION_LOCK_KEY
+) -> AsyncIterator[None]:
+    """
+    Holds a session-level advisory lock on PostgreSQL, so one process migrates at a time.
+
+    The lock is taken on the connection the migrations run on and survives their commits.
+    Processes started together wait for the first one, then find the database up to date.
+    """
+    if connection.dialect.name != "postgresql":
+        yield
+        return
+    await connection.execute(text("SELECT pg_advisory_lock(:key)"), {"key": key})
+    await connection.commit()
+    try:
+        yield
+    finally:
+        await connection.rollback()
+        await connection.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": key})
+        await connection.commit()
+
+
+async def upgrade_database(
+    engine: Optional[AsyncEngine] = None, revision: str = "head"
+) -> None:
+    """
+    Upgrades the database to ``revision`` under the migration advisory lock.
+
+    :param engine: The engine to migrate with. Defaults to a new engine for the configured
+        database, disposed of afterwards.
+    :param revision: The target revision.
+    """
+    owns_engine = engine is None
+    engine = engine or create_db_engine()
+    try:
+        async with engine.connect() as connection:
+            async with advisory_lock(connection):
+                await connection.run_sync(_upgrade, revision)
+    finally:
+        if owns_engine:
+            await engine.dispose()
+
+
+def _upgrade(connection: Connection, revision: str) -> None:
+    config = get_alembic_config()
+    config.attributes["connection"] = connection
+    command.upgrade(config, revision)
+
+
+if __name__ == "__main__":
+    asyncio.run(upgrade_database(revision=sys.argv[1] if len(sys.argv) > 1 else "head"))
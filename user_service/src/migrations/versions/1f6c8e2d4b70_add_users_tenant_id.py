@@ -0,0 +1,47 @@
+"""add users.tenant_id
+
+Revision ID: 1f6c8e2d4b70
+Revises: e5a07f3b8c19
+Create Date: 2026-10-19 16:40:18.205733
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from user_service.src.migrations.operations import (
+    create_index_concurrently,
+    drop_index_concurrently,
+)
+
+# revision identifiers, used by Alembic.
+revision: str = "1f6c8e2d4b70"
+down_revision: Union[str, None] = "e5a07f3b8c19"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Existing users move to the default tenant; with a constant server default the column
+    # is added without rewriting the table on PostgreSQL 11+.
+    with op.batch_alter_table("users") as batch_op:
+        batch_op.add_column(
+            sa.Column(
+                "tenant_id",
+                sa.String(length=64),
+                server_default="default",
+                nullable=False,
+            )
+        )
+    create_index_concurrently(
+        "ix_users_tenant_id_email", "users", ["tenant_id", "email"], unique=True
+    )
+    drop_index_concurrently("ix_users_email", "users")
+
+
+def downgrade() -> None:
+    create_index_concurrently("ix_users_email", "users", ["email"], unique=True)
+    drop_index_concurrently("ix_users_tenant_id_email", "users")
+    with op.batch_alter_table("users") as batch_op:
+        batch_op.drop_column("tenant_id")
@@ -0,0 +1,54 @@
+"""drop audit_log default partition
+
+Revision ID: 3e8a5c7b1f96
+Revises: b7f1d3e9a245
+Create Date: 2026-10-19 22:05:31.604117
+
+"""
+
+from datetime import datetime, UTC
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "3e8a5c7b1f96"
+down_revision: Union[str, None] = "b7f1d3e9a245"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # AuditLog creates a monthly partition before writing to a month, which fails once
+    # the default partition holds rows of that month. Move its rows into monthly
+    # partitions and drop it; rows of a month without a partition are then rejected
+    # instead of silently blocking the partition.
+    if op.get_context().dialect.name != "postgresql":
+        return
+    bind = op.get_bind()
+    if bind.scalar(sa.text("SELECT to_regclass('audit_log_default')")) is None:
+        return
+    op.execute("ALTER TABLE audit_log DETACH PARTITION audit_log_default")
+    months = bind.execute(
+        sa.text(
+            "SELECT DISTINCT extract(year FROM ts AT TIME ZONE 'UTC')::int, "
+            "extract(month FROM ts AT TIME ZONE 'UTC')::int FROM audit_log_default"
+        )
+    )
+    # Same naming and bounds as AuditLog._ensure_partitions.
+    for year, month in months.all():
+        start = datetime(year, month, 1, tzinfo=UTC)
+        end = datetime(year + month // 12, month % 12 + 1, 1, tzinfo=UTC)
+        op.execute(
+            f"CREATE TABLE IF NOT EXISTS audit_log_y{year}m{month:02d} "
+            f"PARTITION OF audit_log "
+            f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+        )
+    op.execute("INSERT INTO audit_log SELECT * FROM audit_log_default")
+    op.drop_table("audit_log_default")
+
+
+def downgrade() -> None:
+    if op.get_context().dialect.name == "postgresql":
+        op.execute("CREATE TABLE audit_log_default PARTITION OF audit_log DEFAULT")
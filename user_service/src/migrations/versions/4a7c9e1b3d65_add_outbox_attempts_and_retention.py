@@ -0,0 +1,63 @@
+"""add outbox attempts and retention index
+
+Revision ID: 4a7c9e1b3d65
+Revises: 8e2b6d4f1a53
+Create Date: 2026-10-20 11:03:52.268410
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from user_service.src.migrations.operations import (
+    add_column_expand,
+    create_index_concurrently,
+    drop_index_concurrently,
+    is_postgresql,
+)
+
+# revision identifiers, used by Alembic.
+revision: str = "4a7c9e1b3d65"
+down_revision: Union[str, None] = "8e2b6d4f1a53"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEX = "ix_outbox_pending"
+REPLACEMENT = "ix_outbox_pending_new"
+PENDING = "dispatched_at IS NULL"
+NOT_FAILED = "dispatched_at IS NULL AND failed_at IS NULL"
+
+
+def upgrade() -> None:
+    add_column_expand(
+        "outbox",
+        sa.Column("attempts", sa.Integer(), server_default="0", nullable=False),
+    )
+    add_column_expand(
+        "outbox", sa.Column("failed_at", sa.DateTime(timezone=True), nullable=True)
+    )
+    # Events that failed for good leave the pending index, which only holds the backlog.
+    _replace_pending_index(NOT_FAILED)
+    create_index_concurrently("ix_outbox_dispatched_at", "outbox", ["dispatched_at"])
+
+
+def downgrade() -> None:
+    drop_index_concurrently("ix_outbox_dispatched_at", "outbox")
+    _replace_pending_index(PENDING)
+    # Plain DROP COLUMNs; a batch copy of the table would lose the partial index on SQLite.
+    op.drop_column("outbox", "failed_at")
+    op.drop_column("outbox", "attempts")
+
+
+def _replace_pending_index(where: str) -> None:
+    if not is_postgresql():
+        op.drop_index(INDEX, table_name="outbox")
+        op.create_index(INDEX, "outbox", ["id"], sqlite_where=sa.text(where))
+        return
+    # Build the replacement next to the old index, so the dispatcher never scans the table.
+    create_index_concurrently(
+        REPLACEMENT, "outbox", ["id"], postgresql_where=sa.text(where)
+    )
+    drop_index_concurrently(INDEX, "outbox")
+    op.execute(f"ALTER INDEX {REPLACEMENT} RENAME TO {INDEX}")
@@ -0,0 +1,49 @@
+"""exclude deleted users from the unique email index
+
+Revision ID: 6c4e2a8f0d17
+Revises: 3e8a5c7b1f96
+Create Date: 2026-10-19 22:41:18.093542
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from user_service.src.migrations.operations import (
+    create_index_concurrently,
+    drop_index_concurrently,
+    is_postgresql,
+)
+
+# revision identifiers, used by Alembic.
+revision: str = "6c4e2a8f0d17"
+down_revision: Union[str, None] = "3e8a5c7b1f96"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEX = "ix_users_tenant_id_lower_email"
+REPLACEMENT = "ix_users_tenant_id_lower_email_new"
+COLUMNS = ["tenant_id", sa.text("lower(email)")]
+NOT_DELETED = "deleted_at IS NULL"
+
+
+def upgrade() -> None:
+    _replace_index(postgresql_where=sa.text(NOT_DELETED))
+
+
+def downgrade() -> None:
+    # Fails if a deleted user's email was registered again; archive or purge them first.
+    _replace_index()
+
+
+def _replace_index(**where: sa.TextClause) -> None:
+    if not is_postgresql():
+        op.drop_index(INDEX, table_name="users")
+        sqlite_where = where.get("postgresql_where")
+        op.create_index(INDEX, "users", COLUMNS, unique=True, sqlite_where=sqlite_where)
+        return
+    # Build the replacement next to the old index, so emails stay unique throughout.
+    create_index_concurrently(REPLACEMENT, "users", COLUMNS, unique=True, **where)
+    drop_index_concurrently(INDEX, "users")
+    op.execute(f"ALTER INDEX {REPLACEMENT} RENAME TO {INDEX}")
@@ -0,0 +1,72 @@
+"""index users on lower(email)
+
+Revision ID: 7d3b5a9e0c42
+Revises: 1f6c8e2d4b70
+Create Date: 2026-10-19 17:58:44.610927
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from user_service.src.migrations.operations import (
+    backfill,
+    create_index_concurrently,
+    drop_index_concurrently,
+)
+
+# revision identifiers, used by Alembic.
+revision: str = "7d3b5a9e0c42"
+down_revision: Union[str, None] = "1f6c8e2d4b70"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _check_duplicate_emails() -> None:
+    """
+    Fails before any row is touched when some emails only differ by case or whitespace.
+
+    Normalizing them would make the backfill violate the existing unique index halfway
+    through, so the accounts have to be merged or renamed by hand first.
+    """
+    if op.get_context().as_sql:
+        return
+    duplicates = op.get_bind().execute(
+        sa.text(
+            "SELECT tenant_id, lower(trim(email)) AS email, count(*) AS count "
+            "FROM users GROUP BY tenant_id, lower(trim(email)) HAVING count(*) > 1 "
+            "ORDER BY tenant_id, email"
+        )
+    )
+    listed = [
+        f"{row.email} ({row.count} users in tenant {row.tenant_id})"
+        for row in duplicates
+    ]
+    if listed:
+        raise RuntimeError(
+            "Cannot index users on lower(email): these emails are used by several users "
+            "once lowercased and trimmed, merge or rename them first: "
+            + ", ".join(listed)
+        )
+
+
+def upgrade() -> None:
+    # Emails were stored lowercased by the API already; normalize anything written around it
+    # so the unique index can be built.
+    _check_duplicate_emails()
+    backfill("users", "email = lower(trim(email))", "email <> lower(trim(email))")
+    create_index_concurrently(
+        "ix_users_tenant_id_lower_email",
+        "users",
+        ["tenant_id", sa.text("lower(email)")],
+        unique=True,
+    )
+    drop_index_concurrently("ix_users_tenant_id_email", "users")
+
+
+def downgrade() -> None:
+    create_index_concurrently(
+        "ix_users_tenant_id_email", "users", ["tenant_id", "email"], unique=True
+    )
+    drop_index_concurrently("ix_users_tenant_id_lower_email", "users")
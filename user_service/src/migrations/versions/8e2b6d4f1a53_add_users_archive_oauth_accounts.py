@@ -0,0 +1,58 @@
+"""add users_archive_oauth_accounts
+
+Revision ID: 8e2b6d4f1a53
+Revises: 6c4e2a8f0d17
+Create Date: 2026-10-20 10:12:37.481906
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+from user_service.src.migrations.operations import is_postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "8e2b6d4f1a53"
+down_revision: Union[str, None] = "6c4e2a8f0d17"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "users_archive_oauth_accounts",
+        sa.Column("user_id", postgresql.UUID(), nullable=False),
+        sa.Column("oauth_name", sa.String(length=100), nullable=False),
+        sa.Column("account_id", sa.String(length=320), nullable=False),
+        sa.PrimaryKeyConstraint("user_id", "oauth_name", "account_id"),
+    )
+    op.create_index(
+        "ix_users_archive_oauth_accounts_oauth_name_account_id",
+        "users_archive_oauth_accounts",
+        ["oauth_name", "account_id"],
+        unique=False,
+    )
+    # The table is new, so nothing else writes it yet: copy the keys of the users archived
+    # so far in one statement.
+    if is_postgresql():
+        accounts = "json_array_elements(users_archive.oauth_accounts) AS account"
+        oauth_name, account_id = "account->>'oauth_name'", "account->>'account_id'"
+    else:
+        accounts = "json_each(users_archive.oauth_accounts) AS account"
+        oauth_name = "json_extract(account.value, '$.oauth_name')"
+        account_id = "json_extract(account.value, '$.account_id')"
+    op.execute(
+        "INSERT INTO users_archive_oauth_accounts (user_id, oauth_name, account_id) "
+        f"SELECT users_archive.id, {oauth_name}, {account_id} "
+        f"FROM users_archive, {accounts}"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_users_archive_oauth_accounts_oauth_name_account_id",
+        table_name="users_archive_oauth_accounts",
+    )
+    op.drop_table("users_archive_oauth_accounts")
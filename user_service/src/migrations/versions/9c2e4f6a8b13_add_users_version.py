@@ -0,0 +1,34 @@
+"""add users.version
+
+Revision ID: 9c2e4f6a8b13
+Revises: 7d3b5a9e0c42
+Create Date: 2026-10-19 19:12:41.530218
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from user_service.src.migrations.operations import add_column_expand
+
+# revision identifiers, used by Alembic.
+revision: str = "9c2e4f6a8b13"
+down_revision: Union[str, None] = "7d3b5a9e0c42"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The constant server default starts every existing user at version 1 without
+    # rewriting the table.
+    add_column_expand(
+        "users",
+        sa.Column("version", sa.Integer(), server_default="1", nullable=False),
+    )
+
+
+def downgrade() -> None:
+    # A plain DROP COLUMN; a batch copy of the table would lose the expression index on
+    # SQLite.
+    op.drop_column("users", "version")
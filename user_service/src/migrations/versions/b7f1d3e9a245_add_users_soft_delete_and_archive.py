@@ -0,0 +1,77 @@
+"""add users soft delete and archive
+
+Revision ID: b7f1d3e9a245
+Revises: 9c2e4f6a8b13
+Create Date: 2026-10-19 20:41:07.218554
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+from user_service.src.migrations.operations import (
+    add_column_expand,
+    backfill,
+    create_index_concurrently,
+    drop_index_concurrently,
+)
+
+# revision identifiers, used by Alembic.
+revision: str = "b7f1d3e9a245"
+down_revision: Union[str, None] = "9c2e4f6a8b13"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ARCHIVABLE = "NOT is_active OR deleted_at IS NOT NULL"
+
+
+def upgrade() -> None:
+    add_column_expand(
+        "users", sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True)
+    )
+    add_column_expand(
+        "users", sa.Column("deleted_at", sa.DateTime(timezone=True), nullable=True)
+    )
+    # Existing users start their archival clock now rather than being archived at once.
+    backfill("users", "updated_at = CURRENT_TIMESTAMP", "updated_at IS NULL")
+    create_index_concurrently(
+        "ix_users_archivable_updated_at",
+        "users",
+        ["updated_at"],
+        postgresql_where=sa.text(ARCHIVABLE),
+        sqlite_where=sa.text(ARCHIVABLE),
+    )
+    op.create_table(
+        "users_archive",
+        sa.Column("id", postgresql.UUID(), nullable=False),
+        sa.Column("tenant_id", sa.String(length=64), nullable=False),
+        sa.Column("email", sa.String(length=100), nullable=False),
+        sa.Column("hashed_password", sa.String(length=1024), nullable=False),
+        sa.Column("is_active", sa.Boolean(), nullable=False),
+        sa.Column("is_superuser", sa.Boolean(), nullable=False),
+        sa.Column("is_verified", sa.Boolean(), nullable=False),
+        sa.Column("version", sa.Integer(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("deleted_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("archived_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("oauth_accounts", sa.JSON(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_users_archive_tenant_id_lower_email",
+        "users_archive",
+        ["tenant_id", sa.text("lower(email)")],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_users_archive_tenant_id_lower_email", table_name="users_archive")
+    op.drop_table("users_archive")
+    drop_index_concurrently("ix_users_archivable_updated_at", "users")
+    # Plain DROP COLUMNs; a batch copy of the table would lose the expression index on
+    # SQLite.
+    op.drop_column("users", "deleted_at")
+    op.drop_column("users", "updated_at")
@@ -0,0 +1,46 @@
+"""create audit_log
+
+Revision ID: c4d92b7e1a36
+Revises: a83e6d41c5f2
+Create Date: 2026-10-19 13:47:52.916204
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "c4d92b7e1a36"
+down_revision: Union[str, None] = "a83e6d41c5f2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "audit_log",
+        sa.Column("id", postgresql.UUID(), nullable=False),
+        sa.Column("ts", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("event_type", sa.String(length=100), nullable=False),
+        sa.Column("user_id", postgresql.UUID(), nullable=True),
+        sa.Column("email", sa.String(length=100), nullable=True),
+        sa.Column("ip", sa.String(length=45), nullable=True),
+        sa.Column("user_agent", sa.String(length=255), nullable=True),
+        sa.PrimaryKeyConstraint("id", "ts"),
+        postgresql_partition_by="RANGE (ts)",
+    )
+    op.create_index(
+        "ix_audit_log_user_id_ts", "audit_log", ["user_id", "ts"], unique=False
+    )
+    if op.get_context().dialect.name == "postgresql":
+        # Monthly partitions are created by AuditLog on first write; the default partition
+        # only catches rows written before that, e.g. by another tool.
+        op.execute("CREATE TABLE audit_log_default PARTITION OF audit_log DEFAULT")
+
+
+def downgrade() -> None:
+    op.drop_index("ix_audit_log_user_id_ts", table_name="audit_log")
+    op.drop_table("audit_log")
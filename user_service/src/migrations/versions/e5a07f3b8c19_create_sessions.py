@@ -0,0 +1,49 @@
+"""create sessions
+
+Revision ID: e5a07f3b8c19
+Revises: c4d92b7e1a36
+Create Date: 2026-10-19 15:22:09.374651
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "e5a07f3b8c19"
+down_revision: Union[str, None] = "c4d92b7e1a36"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "sessions",
+        sa.Column("jti", sa.String(length=64), nullable=False),
+        sa.Column("user_id", postgresql.UUID(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("last_seen_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("ip", sa.String(length=45), nullable=True),
+        sa.Column("user_agent", sa.String(length=255), nullable=True),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="cascade"),
+        sa.PrimaryKeyConstraint("jti"),
+    )
+    op.create_index(
+        "ix_sessions_user_id_created_at",
+        "sessions",
+        ["user_id", "created_at"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_sessions_expires_at"), "sessions", ["expires_at"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_sessions_expires_at"), table_name="sessions")
+    op.drop_index("ix_sessions_user_id_created_at", table_name="sessions")
+    op.drop_table("sessions")
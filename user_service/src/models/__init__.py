@@ -1,8 +1,28 @@
 from user_service.src.models.user import UserTable, OAuthAccountTable
+from user_service.src.models.archive import (
+    UserArchiveTable,
+    UserArchiveOAuthAccountTable,
+)
+from user_service.src.models.outbox import OutboxTable
+from user_service.src.models.audit import AuditLogTable
+from user_service.src.models.session import SessionTable
 from user_service.src.models.base import Base
+from user_service.src.models.snapshot import (
+    UserSnapshot,
+    UserCredentials,
+    UserIdentity,
+)
 
 __all__ = [
     "UserTable",
     "OAuthAccountTable",
+    "UserArchiveTable",
+    "UserArchiveOAuthAccountTable",
+    "OutboxTable",
+    "AuditLogTable",
+    "SessionTable",
     "Base",
+    "UserSnapshot",
+    "UserCredentials",
+    "UserIdentity",
 ]
@@ -0,0 +1,59 @@
+from datetime import datetime, UTC
+from typing import Any, Optional
+
+from sqlalchemy import Boolean, DateTime, Index, Integer, JSON, String, func
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base
+
+
+# fmt: off
+class UserArchiveTable(Base):
+
+    # Cold storage for users moved out of "users" by the archiver. The OAuth accounts of a
+    # user are kept with it as JSON, so restoring a user is one row in each direction; only
+    # their keys are copied to "users_archive_oauth_accounts", to find a user by account.
+    __tablename__ = "users_archive"
+
+    id: Mapped[UUID] = mapped_column(UUID, primary_key=True)
+    tenant_id: Mapped[str] = mapped_column(String(64), nullable=False)
+    email: Mapped[str] = mapped_column(String(100), nullable=False)
+    hashed_password: Mapped[str] = mapped_column(String(1024), nullable=False)
+    is_active: Mapped[bool] = mapped_column(Boolean, nullable=False)
+    is_superuser: Mapped[bool] = mapped_column(Boolean, nullable=False)
+    is_verified: Mapped[bool] = mapped_column(Boolean, nullable=False)
+    version: Mapped[int] = mapped_column(Integer, nullable=False)
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    deleted_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    archived_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=lambda: datetime.now(UTC))
+    oauth_accounts: Mapped[list[dict[str, Any]]] = mapped_column(JSON, nullable=False, default=list)
+# fmt: on
+
+# Not unique: a deleted user keeps its row after the email was registered again.
+Index(
+    "ix_users_archive_tenant_id_lower_email",
+    UserArchiveTable.tenant_id,
+    func.lower(UserArchiveTable.email),
+)
+
+
+# fmt: off
+class UserArchiveOAuthAccountTable(Base):
+
+    # The provider account IDs of the archived users, so an OAuth login restores its user
+    # with one indexed lookup even when the provider email has changed since.
+    __tablename__ = "users_archive_oauth_accounts"
+    __table_args__ = (
+        # Not unique: an account can be linked again once its deleted user was archived.
+        Index(
+            "ix_users_archive_oauth_accounts_oauth_name_account_id",
+            "oauth_name",
+            "account_id",
+        ),
+    )
+
+    user_id: Mapped[UUID] = mapped_column(UUID, primary_key=True)
+    oauth_name: Mapped[str] = mapped_column(String(100), primary_key=True)
+    account_id: Mapped[str] = mapped_column(String(320), primary_key=True)
+# fmt: on
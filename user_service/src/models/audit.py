@@ -0,0 +1,30 @@
+import uuid
+from datetime import datetime, UTC
+from typing import Optional
+
+from sqlalchemy import Boolean, DateTime, Index, String
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base
+
+
+# fmt: off
+class AuditLogTable(Base):
+
+    # Range partitioned by ts on PostgreSQL, so the primary key must include ts. user_id has
+    # no foreign key: failed logins for unknown emails are logged and history outlives users.
+    __tablename__ = "audit_log"
+    __table_args__ = (
+        Index("ix_audit_log_user_id_ts", "user_id", "ts"),
+        {"postgresql_partition_by": "RANGE (ts)"},
+    )
+
+    id: Mapped[UUID] = mapped_column(UUID, primary_key=True, default=uuid.uuid4)
+    ts: Mapped[datetime] = mapped_column(DateTime(timezone=True), primary_key=True, default=lambda: datetime.now(UTC))
+    event_type: Mapped[str] = mapped_column(String(100), nullable=False)
+    user_id: Mapped[Optional[UUID]] = mapped_column(UUID, nullable=True)
+    email: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
+    ip: Mapped[Optional[str]] = mapped_column(String(45), nullable=True)
+    user_agent: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+# fmt: on
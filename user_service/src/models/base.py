@@ -20,5 +20,8 @@ class BaseOAuthAccountTable(Base):
     @declared_attr
     def user_id(self) -> Mapped[UUID]:
         return mapped_column(
-            UUID, ForeignKey("users.id", ondelete="cascade"), nullable=False
+            UUID,
+            ForeignKey("users.id", ondelete="cascade"),
+            index=True,
+            nullable=False,
         )
@@ -0,0 +1,34 @@
+import uuid
+from datetime import datetime, UTC
+from typing import Any, Optional
+
+from sqlalchemy import BigInteger, DateTime, Index, Integer, JSON, String, text
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base
+
+
+# fmt: off
+class OutboxTable(Base):
+
+    __tablename__ = "outbox"
+    __table_args__ = (
+        Index(
+            "ix_outbox_pending",
+            "id",
+            postgresql_where=text("dispatched_at IS NULL AND failed_at IS NULL"),
+            sqlite_where=text("dispatched_at IS NULL AND failed_at IS NULL"),
+        ),
+        Index("ix_outbox_dispatched_at", "dispatched_at"),
+    )
+
+    id: Mapped[int] = mapped_column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True, autoincrement=True)
+    event_id: Mapped[UUID] = mapped_column(UUID, unique=True, nullable=False, default=uuid.uuid4)
+    event_type: Mapped[str] = mapped_column(String(100), nullable=False)
+    payload: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=lambda: datetime.now(UTC))
+    dispatched_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    failed_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+# fmt: on
@@ -0,0 +1,107 @@
+from dataclasses import asdict, dataclass, fields
+from typing import Any, NamedTuple, Sequence
+from uuid import UUID
+from sqlalchemy.orm import InstrumentedAttribute
+from user_service.src.models.user import UserTable
+from user_service.src.schemes import User
+
+
+@dataclass(frozen=True, slots=True)
+class UserSnapshot:
+    """
+    Immutable, detached copy of the user columns the hot paths need.
+
+    Snapshots are built straight from ``select(*UserSnapshot.columns())`` rows, so loading one
+    skips the identity map, attribute instrumentation and session state of a ``UserTable``.
+    They are not bound to a session, which makes them safe to cache and to hand to other
+    tasks. Load a ``UserTable`` instead to change the user.
+    """
+
+    id: UUID
+    email: str
+    hashed_password: str
+    is_active: bool
+    is_superuser: bool
+    is_verified: bool
+
+    @classmethod
+    def columns(
+        cls, user_table: type[UserTable] = UserTable
+    ) -> tuple[InstrumentedAttribute, ...]:
+        """
+        The columns to select for ``from_row``, in field order.
+        """
+        return tuple(getattr(user_table, name) for name in SNAPSHOT_FIELDS)
+
+    @classmethod
+    def from_row(cls, row: Sequence[Any]) -> "UserSnapshot":
+        return cls(*row)
+
+    @classmethod
+    def from_table(cls, user: UserTable) -> "UserSnapshot":
+        return cls(*(getattr(user, name) for name in SNAPSHOT_FIELDS))
+
+    @classmethod
+    def from_user(cls, user: User, hashed_password: str) -> "UserSnapshot":
+        return cls(
+            id=user.id,
+            email=user.email,
+            hashed_password=hashed_password,
+            is_active=user.is_active,
+            is_superuser=user.is_superuser,
+            is_verified=user.is_verified,
+        )
+
+    def to_table(self) -> UserTable:
+        """
+        Builds a transient ``UserTable`` for code that expects an entity. It carries no
+        ``version``, so load the user instead to change it.
+        """
+        return UserTable(**asdict(self))
+
+    def to_user(self) -> User:
+        return User.model_validate(self)
+
+
+SNAPSHOT_FIELDS = tuple(field.name for field in fields(UserSnapshot))
+
+
+class UserCredentials(NamedTuple):
+    """
+    Projection of the columns needed to check a login and issue its token.
+    """
+
+    id: UUID
+    email: str
+    hashed_password: str
+    is_active: bool
+
+    @classmethod
+    def columns(
+        cls, user_table: type[UserTable] = UserTable
+    ) -> tuple[InstrumentedAttribute, ...]:
+        return tuple(getattr(user_table, name) for name in cls._fields)
+
+    @classmethod
+    def from_row(cls, row: Sequence[Any]) -> "UserCredentials":
+        return cls._make(row)
+
+
+class UserIdentity(NamedTuple):
+    """
+    Projection of the columns needed to tell who a token belongs to and whether they are active.
+    """
+
+    id: UUID
+    email: str
+    is_active: bool
+
+    @classmethod
+    def columns(
+        cls, user_table: type[UserTable] = UserTable
+    ) -> tuple[InstrumentedAttribute, ...]:
+        return tuple(getattr(user_table, name) for name in cls._fields)
+
+    @classmethod
+    def from_row(cls, row: Sequence[Any]) -> "UserIdentity":
+        return cls._make(row)
@@ -1,7 +1,8 @@
+from datetime import datetime, UTC
 from typing import Optional
 
-from sqlalchemy import Integer, String, Boolean
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import DateTime, Integer, String, Boolean, Index, func, text
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import BaseUserTable, BaseOAuthAccountTable
 
@@ -11,20 +12,62 @@ class UserTable(BaseUserTable):
 
     __tablename__ = "users"
 
-    email: Mapped[str] = mapped_column(String(100), unique=True, index=True, nullable=False)
+    tenant_id: Mapped[str] = mapped_column(String(64), nullable=False, default="default", server_default="default")
+    email: Mapped[str] = mapped_column(String(100), nullable=False)
     hashed_password: Mapped[str] = mapped_column(String(1024), nullable=False)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
     is_superuser: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     is_verified: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    version: Mapped[int] = mapped_column(Integer, nullable=False, default=1, server_default="1")
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True, default=lambda: datetime.now(UTC), onupdate=lambda: datetime.now(UTC))
+    deleted_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    oauth_accounts: Mapped[list["OAuthAccountTable"]] = relationship(
+        lazy="raise", cascade="all, delete-orphan", passive_deletes=True
+    )
+
+    # Every UPDATE is guarded by "AND version = :version" and bumps the version, so writing
+    # a stale copy of the row fails with StaleDataError instead of losing a concurrent write.
+    __mapper_args__ = {"version_id_col": version}
 # fmt: on
 
+# Case-insensitive uniqueness, and the index behind lookups by email. Soft-deleted users
+# are left out, so their email can be registered again right away.
+Index(
+    "ix_users_tenant_id_lower_email",
+    UserTable.tenant_id,
+    func.lower(UserTable.email),
+    unique=True,
+    postgresql_where=text("deleted_at IS NULL"),
+    sqlite_where=text("deleted_at IS NULL"),
+)
+
+# Deactivated and soft-deleted users by the time of their last change, the rows the
+# archiver moves out. Active users are left out, which keeps the index small.
+Index(
+    "ix_users_archivable_updated_at",
+    UserTable.updated_at,
+    postgresql_where=text("NOT is_active OR deleted_at IS NOT NULL"),
+    sqlite_where=text("NOT is_active OR deleted_at IS NOT NULL"),
+)
+
 
 class OAuthAccountTable(BaseOAuthAccountTable):
     __tablename__ = "oauth_accounts"
+    __table_args__ = (
+        Index(
+            "ix_oauth_accounts_oauth_name_account_id",
+            "oauth_name",
+            "account_id",
+            unique=True,
+        ),
+    )
 
-    oauth_name: Mapped[str] = mapped_column(String(100), index=True, nullable=False)
+    oauth_name: Mapped[str] = mapped_column(String(100), nullable=False)
     access_token: Mapped[str] = mapped_column(String(1024), nullable=False)
-    expires_at: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    expires_at: Mapped[Optional[int]] = mapped_column(
+        Integer, index=True, nullable=True
+    )
     refresh_token: Mapped[Optional[str]] = mapped_column(String(1024), nullable=True)
-    account_id: Mapped[str] = mapped_column(String(320), index=True, nullable=False)
+    account_id: Mapped[str] = mapped_column(String(320), nullable=False)
     account_email: Mapped[str] = mapped_column(String(100), nullable=False)
@@ -1,6 +1,20 @@
 from user_service.src.schemes.base import model_validate, model_dump
-from user_service.src.schemes.user import UC, UU, U, UserCreate, UserUpdate, User
+from user_service.src.schemes.user import (
+    UC,
+    UU,
+    U,
+    UserCreate,
+    UserUpdate,
+    UserSelfUpdate,
+    User,
+    UserBulkUpdate,
+    UserBulkUpdateResponse,
+)
 from user_service.src.schemes.common import ErrorModel
+from user_service.src.schemes.audit import AuditLogEntry
+from user_service.src.schemes.session import Session
+from user_service.src.schemes.introspection import IntrospectionResponse
+from user_service.src.schemes.oauth import OAuthAuthorizeResponse
 
 __all__ = [
     "model_dump",
@@ -9,7 +23,14 @@ __all__ = [
     "UC",
     "UU",
     "ErrorModel",
+    "AuditLogEntry",
+    "Session",
+    "IntrospectionResponse",
+    "OAuthAuthorizeResponse",
     "UserCreate",
     "UserUpdate",
+    "UserSelfUpdate",
     "User",
+    "UserBulkUpdate",
+    "UserBulkUpdateResponse",
 ]
@@ -1,5 +1,6 @@
 from typing import Any
 from pydantic import BaseModel, field_validator
+from user_service.src.core.emails import normalize_email
 
 
 def model_dump(
@@ -24,11 +25,13 @@ class BaseUserModel(BaseModel):
         return model_dump(
             model=self,
             exclude_unset=True,
+            exclude_none=True,
             exclude={
                 "id",
                 "is_active",
                 "is_superuser",
                 "is_verified",
+                "current_password",
             },
         )
 
@@ -36,7 +39,8 @@ class BaseUserModel(BaseModel):
         return model_dump(
             model=self,
             exclude_unset=True,
-            exclude={"id"},
+            exclude_none=True,
+            exclude={"id", "current_password"},
         )
 
     @field_validator(
@@ -46,4 +50,4 @@ class BaseUserModel(BaseModel):
     )
     @classmethod
     def normalize_email(cls, value):
-        return value.lower()
+        return normalize_email(value) if isinstance(value, str) else value
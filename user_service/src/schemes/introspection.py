@@ -0,0 +1,12 @@
+from typing import Optional, Union
+from pydantic import BaseModel
+
+
+class IntrospectionResponse(BaseModel):
+    active: bool
+    sub: Optional[str] = None
+    email: Optional[str] = None
+    aud: Optional[Union[str, list[str]]] = None
+    exp: Optional[int] = None
+    iat: Optional[int] = None
+    token_type: Optional[str] = None
@@ -0,0 +1,5 @@
+from pydantic import BaseModel
+
+
+class OAuthAuthorizeResponse(BaseModel):
+    authorization_url: str
@@ -0,0 +1,15 @@
+from datetime import datetime
+from typing import Optional
+from pydantic import BaseModel, ConfigDict
+
+
+class Session(BaseModel):
+    jti: str
+    created_at: datetime
+    last_seen_at: datetime
+    expires_at: datetime
+    ip: Optional[str] = None
+    user_agent: Optional[str] = None
+    current: bool = False
+
+    model_config = ConfigDict(from_attributes=True)
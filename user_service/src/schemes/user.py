@@ -1,6 +1,6 @@
 from typing import TypeVar, Optional
 from uuid import UUID
-from pydantic import ConfigDict, EmailStr
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
 from user_service.src.schemes.base import BaseUserModel
 
 
@@ -25,9 +25,22 @@ class UserCreate(BaseUserModel):
 class UserUpdate(BaseUserModel):
     email: Optional[EmailStr] = None
     password: Optional[str] = None
-    is_active: Optional[bool] = True
-    is_superuser: Optional[bool] = False
-    is_verified: Optional[bool] = False
+    is_active: Optional[bool] = None
+    is_superuser: Optional[bool] = None
+    is_verified: Optional[bool] = None
+
+
+class UserSelfUpdate(UserUpdate):
+    current_password: Optional[str] = None
+
+
+class UserBulkUpdate(BaseModel):
+    ids: list[UUID] = Field(min_length=1, max_length=1000)
+    is_active: bool
+
+
+class UserBulkUpdateResponse(BaseModel):
+    updated: list[UUID]
 
 
 U = TypeVar("U", bound=User)
@@ -0,0 +1,148 @@
+from datetime import datetime, timedelta, UTC
+from typing import Any
+from uuid import UUID
+from sqlalchemy import and_, delete, insert, not_, or_, select, Row
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from user_service.src.core.config import settings
+from user_service.src.models import (
+    OAuthAccountTable,
+    UserArchiveOAuthAccountTable,
+    UserArchiveTable,
+    UserTable,
+)
+from user_service.src.workers.base import PeriodicWorker
+
+
+class UserArchiver(PeriodicWorker):
+    """
+    Background task that moves deactivated and deleted users out of the user table.
+
+    Every ``interval`` seconds the archiver walks the partial ``updated_at`` index of the
+    users that are deactivated or soft-deleted, in batches of ``batch_size``, and moves the
+    users deactivated for ``inactive_after_days`` or deleted for ``deleted_after_days`` to
+    the archive table with their OAuth accounts. Each batch is locked with
+    ``FOR UPDATE SKIP LOCKED`` and committed on its own, so several service instances can
+    run the archiver side by side and no transaction holds more than one batch of locks.
+    ``SQLAlchemyUserDatabase`` restores archived users on demand, so the user table and
+    its email index only hold the users that are still in use.
+
+    :param session_maker: The factory used to open a session per batch.
+    :param user_table: The SQLAlchemy model representing the user table.
+    :param oauth_account_table: The SQLAlchemy model representing the OAuth account table.
+    :param archive_table: The SQLAlchemy model representing the archive table.
+    :param archive_oauth_account_table: The SQLAlchemy model holding the OAuth account keys
+        of the archived users.
+    :param interval: Seconds to wait between runs.
+    :param batch_size: Maximum number of users moved per transaction.
+    :param inactive_after_days: Archive users deactivated at least this many days ago.
+    :param deleted_after_days: Archive users deleted at least this many days ago.
+    """
+
+    def __init__(
+        self,
+        session_maker: async_sessionmaker[AsyncSession],
+        user_table: type[UserTable] = UserTable,
+        oauth_account_table: type[OAuthAccountTable] = OAuthAccountTable,
+        archive_table: type[UserArchiveTable] = UserArchiveTable,
+        archive_oauth_account_table: type[
+            UserArchiveOAuthAccountTable
+        ] = UserArchiveOAuthAccountTable,
+        *,
+        interval: float = settings.USER_ARCHIVE_INTERVAL_SECONDS,
+        batch_size: int = settings.USER_ARCHIVE_BATCH_SIZE,
+        inactive_after_days: int = settings.USER_ARCHIVE_INACTIVE_AFTER_DAYS,
+        deleted_after_days: int = settings.USER_ARCHIVE_DELETED_AFTER_DAYS,
+    ):
+        super().__init__(interval)
+        self.session_maker = session_maker
+        self.user_table = user_table
+        self.oauth_account_table = oauth_account_table
+        self.archive_table = archive_table
+        self.archive_oauth_account_table = archive_oauth_account_table
+        self.batch_size = batch_size
+        self.inactive_after = timedelta(days=inactive_after_days)
+        self.deleted_after = timedelta(days=deleted_after_days)
+
+    async def run_once(self) -> int:
+        """
+        Archives every user that is due, batch by batch.
+
+        :return: The number of archived users.
+        """
+        now = datetime.now(UTC)
+        archived = 0
+        while True:
+            async with self.session_maker() as session, session.begin():
+                users = await self._scan(session, now)
+                if not users:
+                    break
+                await self._archive(session, users)
+            archived += len(users)
+            if len(users) < self.batch_size:
+                break
+        return archived
+
+    async def _scan(self, session: AsyncSession, now: datetime) -> list[Row]:
+        table = self.user_table
+        inactive_before = now - self.inactive_after
+        deleted_before = now - self.deleted_after
+        statement = (
+            select(table.__table__)
+            .where(or_(not_(table.is_active), table.deleted_at.is_not(None)))
+            .where(table.updated_at < max(inactive_before, deleted_before))
+            .where(
+                or_(
+                    and_(
+                        table.deleted_at.is_not(None),
+                        table.updated_at < deleted_before,
+                    ),
+                    table.updated_at < inactive_before,
+                )
+            )
+            .order_by(table.updated_at, table.id)
+            .limit(self.batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        return list(await session.execute(statement))
+
+    async def _archive(self, session: AsyncSession, users: list[Row]) -> None:
+        oauth_table = self.oauth_account_table
+        user_ids = [user.id for user in users]
+        accounts: dict[UUID, list[dict[str, Any]]] = {}
+        for account in await session.execute(
+            select(oauth_table.__table__).where(oauth_table.user_id.in_(user_ids))
+        ):
+            accounts.setdefault(account.user_id, []).append(_dump_account(account))
+        await session.execute(
+            insert(self.archive_table),
+            [
+                {**user._asdict(), "oauth_accounts": accounts.get(user.id, [])}
+                for user in users
+            ],
+        )
+        keys = [
+            {
+                "user_id": user_id,
+                "oauth_name": account["oauth_name"],
+                "account_id": account["account_id"],
+            }
+            for user_id, user_accounts in accounts.items()
+            for account in user_accounts
+        ]
+        if keys:
+            await session.execute(insert(self.archive_oauth_account_table), keys)
+        # Deleted explicitly: SQLite only cascades with foreign keys enabled.
+        await session.execute(
+            delete(oauth_table).where(oauth_table.user_id.in_(user_ids))
+        )
+        await session.execute(
+            delete(self.user_table).where(self.user_table.id.in_(user_ids))
+        )
+
+
+def _dump_account(account: Row) -> dict[str, Any]:
+    return {
+        key: str(value) if isinstance(value, UUID) else value
+        for key, value in account._asdict().items()
+        if key != "user_id"
+    }
@@ -0,0 +1,44 @@
+import asyncio
+import logging
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class PeriodicWorker:
+    """
+    Base class for background tasks that call ``run_once`` every ``interval`` seconds.
+
+    Errors are logged and the next run goes ahead as scheduled, so a transient database or
+    network failure never stops the worker.
+
+    :param interval: Seconds to wait between runs.
+    """
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._task: Optional[asyncio.Task] = None
+
+    async def run_once(self) -> int:
+        raise NotImplementedError()
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.run_once()
+            except Exception:
+                logger.exception("%s run failed", type(self).__name__)
+            await asyncio.sleep(self.interval)
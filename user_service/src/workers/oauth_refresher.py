@@ -0,0 +1,170 @@
+import asyncio
+import logging
+import time
+from typing import Any, Mapping, Optional
+from uuid import UUID
+import httpx
+from sqlalchemy import bindparam, select, update, tuple_, Row
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from user_service.src.core.config import settings
+from user_service.src.core.exceptions import OAuthProviderError
+from user_service.src.core.interfaces import BaseOAuthProvider
+from user_service.src.models import OAuthAccountTable
+from user_service.src.workers.base import PeriodicWorker
+
+logger = logging.getLogger(__name__)
+
+
+class OAuthTokenRefresher(PeriodicWorker):
+    """
+    Background task that refreshes OAuth access tokens before they expire.
+
+    Every ``interval`` seconds the refresher walks the ``expires_at`` index for accounts
+    expiring within ``refresh_margin`` seconds, in keyset-paginated batches of
+    ``batch_size``. The tokens of a batch are refreshed outside any transaction,
+    concurrently, at most ``concurrency`` requests at a time, with exponential backoff
+    between retries. They are written back with one bulk UPDATE that only applies while the
+    account still holds the refresh token that was used, so when several service instances
+    happen to refresh the same account, or the user logs in again meanwhile, the stale
+    result is dropped instead of overwriting the newer one.
+
+    A refresh the provider rejects as ``invalid_grant`` is not retried: the refresh token is
+    cleared, and the account is skipped until the next OAuth login stores a new one.
+
+    :param session_maker: The factory used to open a session per batch.
+    :param oauth_providers: The configured providers, by name. Accounts of other providers are skipped.
+    :param oauth_account_table: The SQLAlchemy model representing the OAuth account table.
+    :param interval: Seconds to wait between scans.
+    :param refresh_margin: Refresh tokens that expire within this many seconds.
+    :param batch_size: Maximum number of accounts refreshed at once.
+    :param concurrency: Maximum number of concurrent requests to providers.
+    :param max_retries: Retries per account after the first failed attempt.
+    :param backoff: Delay before the first retry, doubled on every further retry.
+    """
+
+    def __init__(
+        self,
+        session_maker: async_sessionmaker[AsyncSession],
+        oauth_providers: Mapping[str, BaseOAuthProvider],
+        oauth_account_table: type[OAuthAccountTable] = OAuthAccountTable,
+        *,
+        interval: float = settings.OAUTH_REFRESH_INTERVAL_SECONDS,
+        refresh_margin: int = settings.OAUTH_REFRESH_MARGIN_SECONDS,
+        batch_size: int = settings.OAUTH_REFRESH_BATCH_SIZE,
+        concurrency: int = settings.OAUTH_REFRESH_CONCURRENCY,
+        max_retries: int = settings.OAUTH_REFRESH_MAX_RETRIES,
+        backoff: float = settings.OAUTH_REFRESH_BACKOFF_SECONDS,
+    ):
+        super().__init__(interval)
+        self.session_maker = session_maker
+        self.oauth_providers = oauth_providers
+        self.oauth_account_table = oauth_account_table
+        self.refresh_margin = refresh_margin
+        self.batch_size = batch_size
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self._semaphore = asyncio.Semaphore(concurrency)
+
+    async def run_once(self) -> int:
+        """
+        Refreshes every account that is due, batch by batch.
+
+        :return: The number of refreshed accounts.
+        """
+        deadline = int(time.time()) + self.refresh_margin
+        cursor: Optional[tuple[int, UUID]] = None
+        refreshed = 0
+        while True:
+            async with self.session_maker() as session:
+                accounts = await self._scan(session, deadline, cursor)
+            if not accounts:
+                break
+            results = await asyncio.gather(
+                *(self._refresh(account) for account in accounts)
+            )
+            updates = [r for r in results if r is not None and "b_access_token" in r]
+            revoked = [
+                r for r in results if r is not None and "b_access_token" not in r
+            ]
+            await self._write(updates, revoked)
+            refreshed += len(updates)
+            if len(accounts) < self.batch_size:
+                break
+            cursor = (accounts[-1].expires_at, accounts[-1].id)
+        return refreshed
+
+    async def _scan(
+        self,
+        session: AsyncSession,
+        deadline: int,
+        cursor: Optional[tuple[int, UUID]],
+    ) -> list[Row]:
+        table = self.oauth_account_table
+        statement = (
+            select(table.id, table.oauth_name, table.refresh_token, table.expires_at)
+            .where(table.expires_at <= deadline)
+            .where(table.refresh_token.is_not(None))
+            .where(table.oauth_name.in_(list(self.oauth_providers)))
+            .order_by(table.expires_at, table.id)
+            .limit(self.batch_size)
+        )
+        if cursor is not None:
+            statement = statement.where(tuple_(table.expires_at, table.id) > cursor)
+        return list(await session.execute(statement))
+
+    async def _write(
+        self, updates: list[dict[str, Any]], revoked: list[dict[str, Any]]
+    ) -> None:
+        if not updates and not revoked:
+            return
+        table = self.oauth_account_table.__table__
+        statement = update(table).where(
+            table.c.id == bindparam("b_id"),
+            table.c.refresh_token == bindparam("b_refresh_token"),
+        )
+        async with self.session_maker() as session, session.begin():
+            if updates:
+                await session.execute(
+                    statement.values(
+                        access_token=bindparam("b_access_token"),
+                        expires_at=bindparam("b_expires_at"),
+                        refresh_token=bindparam("b_new_refresh_token"),
+                    ),
+                    updates,
+                )
+            if revoked:
+                await session.execute(statement.values(refresh_token=None), revoked)
+
+    async def _refresh(self, account: Row) -> Optional[dict[str, Any]]:
+        oauth_provider = self.oauth_providers[account.oauth_name]
+        guard = {"b_id": account.id, "b_refresh_token": account.refresh_token}
+        async with self._semaphore:
+            for attempt in range(self.max_retries + 1):
+                try:
+                    token = await oauth_provider.refresh_token(account.refresh_token)
+                except (OAuthProviderError, httpx.HTTPError) as e:
+                    if isinstance(e, OAuthProviderError) and e.permanent:
+                        logger.warning(
+                            "Dropping the rejected refresh token of %s account %s",
+                            account.oauth_name,
+                            account.id,
+                        )
+                        return guard
+                    if attempt == self.max_retries:
+                        logger.warning(
+                            "Giving up refreshing %s account %s",
+                            account.oauth_name,
+                            account.id,
+                        )
+                        return None
+                    await asyncio.sleep(self.backoff * 2**attempt)
+                else:
+                    return {
+                        **guard,
+                        "b_access_token": token["access_token"],
+                        "b_expires_at": token.get("expires_at"),
+                        "b_new_refresh_token": token.get(
+                            "refresh_token", account.refresh_token
+                        ),
+                    }
+        return None
@@ -0,0 +1,154 @@
+import logging
+from datetime import datetime, timedelta, UTC
+from sqlalchemy import delete, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from user_service.src.core.config import settings
+from user_service.src.core.events import Event, EventBus
+from user_service.src.models import OutboxTable
+from user_service.src.workers.base import PeriodicWorker
+
+logger = logging.getLogger(__name__)
+
+
+class OutboxDispatcher(PeriodicWorker):
+    """
+    Background task that delivers the events written to the outbox.
+
+    Every ``interval`` seconds the dispatcher walks the pending events in batches of
+    ``batch_size``, runs their handlers through ``EventBus.dispatch`` and marks the events
+    whose handlers all succeeded as dispatched. Each batch is locked with
+    ``FOR UPDATE SKIP LOCKED`` and committed on its own, so several service instances can
+    drain the outbox side by side without delivering the same event twice, and a crash
+    only redelivers the batch in flight. The handlers run inside that transaction, so a
+    slow handler holds a pooled connection and the locks of its batch until it returns;
+    keep them short, or have them hand slow work off.
+
+    Failed events stay pending and are retried on the next run, so delivery is at least
+    once. An event that failed ``max_attempts`` runs is marked failed and left out of later
+    runs, so a handler that always fails cannot block the outbox. Dispatched events are
+    deleted once they are ``retention_days`` old.
+
+    :param session_maker: The factory used to open a session per batch.
+    :param event_bus: The bus whose handlers receive the events.
+    :param outbox_table: The SQLAlchemy model representing the outbox table.
+    :param interval: Seconds to wait between runs.
+    :param batch_size: Maximum number of events read or deleted at once.
+    :param max_attempts: Runs an event is dispatched in before it is marked failed.
+    :param retention_days: Delete dispatched events this many days after their dispatch.
+    """
+
+    def __init__(
+        self,
+        session_maker: async_sessionmaker[AsyncSession],
+        event_bus: EventBus,
+        outbox_table: type[OutboxTable] = OutboxTable,
+        *,
+        interval: float = settings.OUTBOX_DISPATCH_INTERVAL_SECONDS,
+        batch_size: int = settings.OUTBOX_DISPATCH_BATCH_SIZE,
+        max_attempts: int = settings.OUTBOX_MAX_ATTEMPTS,
+        retention_days: int = settings.OUTBOX_RETENTION_DAYS,
+    ):
+        super().__init__(interval)
+        self.session_maker = session_maker
+        self.event_bus = event_bus
+        self.outbox_table = outbox_table
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.retention = timedelta(days=retention_days)
+
+    async def run_once(self) -> int:
+        """
+        Dispatches every pending event, batch by batch, then prunes the old ones.
+
+        :return: The number of dispatched events.
+        """
+        table = self.outbox_table
+        cursor = 0
+        dispatched = 0
+        while True:
+            async with self.session_maker() as session, session.begin():
+                rows = list(
+                    await session.scalars(
+                        select(table)
+                        .where(table.dispatched_at.is_(None))
+                        .where(table.failed_at.is_(None))
+                        .where(table.id > cursor)
+                        .order_by(table.id)
+                        .limit(self.batch_size)
+                        .with_for_update(skip_locked=True)
+                    )
+                )
+                if not rows:
+                    break
+                delivered, failed = [], []
+                for row in rows:
+                    (delivered if await self._dispatch(row) else failed).append(row)
+                now = datetime.now(UTC)
+                if delivered:
+                    await session.execute(
+                        update(table)
+                        .where(table.id.in_([row.id for row in delivered]))
+                        .values(dispatched_at=now)
+                    )
+                if failed:
+                    await self._record_failures(session, failed, now)
+            dispatched += len(delivered)
+            if len(rows) < self.batch_size:
+                break
+            cursor = rows[-1].id
+        await self.prune()
+        return dispatched
+
+    async def prune(self) -> int:
+        """
+        Deletes the events dispatched more than ``retention_days`` ago, batch by batch.
+
+        :return: The number of deleted events.
+        """
+        table = self.outbox_table
+        cutoff = datetime.now(UTC) - self.retention
+        pruned = 0
+        while True:
+            async with self.session_maker() as session, session.begin():
+                result = await session.execute(
+                    delete(table).where(
+                        table.id.in_(
+                            select(table.id)
+                            .where(table.dispatched_at < cutoff)
+                            .limit(self.batch_size)
+                        )
+                    )
+                )
+            pruned += result.rowcount
+            if result.rowcount < self.batch_size:
+                return pruned
+
+    async def _record_failures(
+        self, session: AsyncSession, rows: list[OutboxTable], now: datetime
+    ) -> None:
+        table = self.outbox_table
+        given_up = [row for row in rows if row.attempts + 1 >= self.max_attempts]
+        await session.execute(
+            update(table)
+            .where(table.id.in_([row.id for row in rows]))
+            .values(attempts=table.attempts + 1)
+        )
+        for row in given_up:
+            logger.error(
+                "Giving up dispatching %s event %s after %d attempts",
+                row.event_type,
+                row.event_id,
+                self.max_attempts,
+            )
+        if given_up:
+            await session.execute(
+                update(table)
+                .where(table.id.in_([row.id for row in given_up]))
+                .values(failed_at=now)
+            )
+
+    async def _dispatch(self, row: OutboxTable) -> bool:
+        event = Event(
+            row.event_type, row.payload, id=row.event_id, created_at=row.created_at
+        )
+        return await self.event_bus.dispatch(event)
@@ -1,5 +1,6 @@
 import pytest
 from fastapi import status
+from user_service.src.core.admission import admission_limiters
 from user_service.src.core.exceptions import ErrorCode
 from user_service.tests.conftest import user_manager
 
@@ -12,6 +13,7 @@ class TestAuth:
             "user@example.com",
             "user_verified@example.com",
             "admin@example.com",
+            " User@Example.COM",
         ],
     )
     async def test_login(self, client, email, user_manager):
@@ -49,6 +51,25 @@ class TestAuth:
         assert data == {"detail": ErrorCode.LOGIN_BAD_CREDENTIALS}
         assert user_manager.on_after_login.called is False
 
+    @pytest.mark.parametrize(
+        "email, password",
+        [
+            ("unknown@example.com", "secret123"),
+            ("user@example.com", "invalid_password"),
+            ("user_inactive@example.com", "secret123"),
+        ],
+    )
+    async def test_login_failure_hook(
+        self, client, email, password, user_manager, mocker
+    ):
+        mocker.spy(user_manager, "on_after_login_failure")
+        response = await client.post(
+            "/login", data={"username": email, "password": password}
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert user_manager.on_after_login_failure.call_count == 1
+        assert user_manager.on_after_login_failure.call_args.args[0] == email
+
     async def test_missing_body(self, client, user_manager):
         response = await client.post("/login")
         assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
@@ -63,3 +84,16 @@ class TestAuth:
         response = await client.post("/login", data={"username": "user@example.com"})
         assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
         assert user_manager.on_after_login.called is False
+
+    async def test_login_overloaded(self, client, user_manager, monkeypatch):
+        limiter = admission_limiters["login"]
+        monkeypatch.setattr(limiter, "concurrency", 0)
+        monkeypatch.setattr(limiter, "max_queue", 0)
+        response = await client.post(
+            "/login", data={"username": "user@example.com", "password": "secret123"}
+        )
+        assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+        assert response.headers["Retry-After"] == str(limiter.retry_after)
+        assert response.json() == {"detail": ErrorCode.SERVICE_OVERLOADED}
+        assert user_manager.on_after_login.called is False
+        assert limiter.metrics.shed >= 1
@@ -0,0 +1,109 @@
+from typing import Annotated, Any
+import pytest
+from fastapi import Depends, FastAPI, status
+from httpx import AsyncClient, ASGITransport
+from user_service.src.api.dependencies import (
+    current_token_claims,
+    current_user,
+    current_active_user,
+    current_superuser,
+)
+from user_service.src.core.jwt_token import JWTTokenService, get_jwt_token_service
+from user_service.src.db.base import get_user_manager
+
+
+@pytest.fixture
+def jwt_token_service() -> JWTTokenService:
+    return JWTTokenService()
+
+
+@pytest.fixture
+async def dependencies_client(get_test_user_manager, jwt_token_service):
+    app = FastAPI()
+
+    @app.get("/claims")
+    async def claims(
+        claims: Annotated[dict[str, Any], Depends(current_token_claims)],
+    ):
+        return {"sub": claims["sub"]}
+
+    @app.get("/me")
+    async def me(
+        user: Annotated[Any, Depends(current_user)],
+        active_user: Annotated[Any, Depends(current_active_user)],
+    ):
+        return {"id": str(user.id), "same": user is active_user}
+
+    @app.get("/admin")
+    async def admin(user: Annotated[Any, Depends(current_superuser)]):
+        return {"id": str(user.id)}
+
+    app.dependency_overrides[get_user_manager] = get_test_user_manager
+    app.dependency_overrides[get_jwt_token_service] = lambda: jwt_token_service
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://localhost:80/"
+    ) as client:
+        yield client
+
+
+async def auth_headers(jwt_token_service, user) -> dict[str, str]:
+    token = await jwt_token_service.write_token(user)
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.mark.router
+class TestCurrentUser:
+    async def test_missing_token(self, dependencies_client):
+        response = await dependencies_client.get("/me")
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        assert response.headers["www-authenticate"] == "Bearer"
+
+    async def test_invalid_token(self, dependencies_client):
+        response = await dependencies_client.get(
+            "/me", headers={"Authorization": "Bearer invalid"}
+        )
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    async def test_current_user(
+        self, dependencies_client, jwt_token_service, user, user_manager, mocker
+    ):
+        read_claims = mocker.spy(jwt_token_service, "read_claims")
+        get_snapshot_by_id = mocker.spy(user_manager, "get_snapshot_by_id")
+        response = await dependencies_client.get(
+            "/me", headers=await auth_headers(jwt_token_service, user)
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {"id": str(user.id), "same": True}
+        assert read_claims.call_count == 1
+        assert get_snapshot_by_id.call_count == 1
+
+    async def test_claims_only(
+        self, dependencies_client, jwt_token_service, user, user_manager, mocker
+    ):
+        get_snapshot_by_id = mocker.spy(user_manager, "get_snapshot_by_id")
+        response = await dependencies_client.get(
+            "/claims", headers=await auth_headers(jwt_token_service, user)
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {"sub": str(user.id)}
+        assert get_snapshot_by_id.call_count == 0
+
+    async def test_inactive_user(
+        self, dependencies_client, jwt_token_service, user_inactive
+    ):
+        response = await dependencies_client.get(
+            "/me", headers=await auth_headers(jwt_token_service, user_inactive)
+        )
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    async def test_superuser(self, dependencies_client, jwt_token_service, admin):
+        response = await dependencies_client.get(
+            "/admin", headers=await auth_headers(jwt_token_service, admin)
+        )
+        assert response.status_code == status.HTTP_200_OK
+
+    async def test_not_superuser(self, dependencies_client, jwt_token_service, user):
+        response = await dependencies_client.get(
+            "/admin", headers=await auth_headers(jwt_token_service, user)
+        )
+        assert response.status_code == status.HTTP_403_FORBIDDEN
@@ -0,0 +1,87 @@
+import pytest
+from fastapi import status
+from user_service.main import app
+from user_service.src.core.cache import (
+    TokenIntrospectionCache,
+    get_introspection_cache,
+)
+from user_service.src.core.config import settings
+from user_service.src.core.jwt_token import JWTTokenService
+from user_service.src.schemes import UserUpdate
+
+
+@pytest.fixture
+def token_cache():
+    token_cache = TokenIntrospectionCache()
+    app.dependency_overrides[get_introspection_cache] = lambda: token_cache
+    yield token_cache
+    app.dependency_overrides.pop(get_introspection_cache)
+
+
+@pytest.mark.router
+class TestIntrospect:
+    async def test_introspect(self, client, token_cache, user):
+        token = await JWTTokenService().write_token(user)
+        response = await client.post("/introspect", data={"token": token})
+        data = response.json()
+        assert response.status_code == status.HTTP_200_OK
+        assert data["active"] is True
+        assert data["sub"] == str(user.id)
+        assert data["email"] == user.email
+        assert data["token_type"] == "Bearer"
+        assert data["exp"] > data["iat"]
+
+    async def test_introspect_invalid_token(self, client, token_cache):
+        response = await client.post("/introspect", data={"token": "invalid"})
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {"active": False}
+
+    async def test_introspect_inactive_user(self, client, token_cache, user_inactive):
+        token = await JWTTokenService().write_token(user_inactive)
+        response = await client.post("/introspect", data={"token": token})
+        assert response.json() == {"active": False}
+
+    async def test_missing_token(self, client, token_cache):
+        response = await client.post("/introspect")
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    async def test_introspect_cached(
+        self, client, token_cache, user, user_manager, mocker
+    ):
+        token = await JWTTokenService().write_token(user)
+        get_identity_by_id = mocker.spy(user_manager, "get_identity_by_id")
+
+        first = await client.post("/introspect", data={"token": token})
+        second = await client.post("/introspect", data={"token": token})
+        assert first.json() == second.json()
+        assert get_identity_by_id.call_count == 1
+
+    async def test_introspect_cached_per_tenant(
+        self, client, token_cache, user, user_manager, mocker
+    ):
+        token = await JWTTokenService().write_token(user)
+        get_identity_by_id = mocker.spy(user_manager, "get_identity_by_id")
+
+        await client.post("/introspect", data={"token": token})
+        await client.post(
+            "/introspect", data={"token": token}, headers={"X-Tenant-ID": "other"}
+        )
+        assert get_identity_by_id.call_count == 2
+        assert token_cache.get(token, "other") is not None
+        assert token_cache.get(token) is None
+
+    async def test_introspect_invalidated_on_update(
+        self, client, token_cache, user, user_manager, mocker, monkeypatch
+    ):
+        token = await JWTTokenService().write_token(user)
+        await client.post("/introspect", data={"token": token})
+        assert token_cache.get(token, settings.DEFAULT_TENANT_ID) is not None
+
+        user_manager.token_cache = token_cache
+        # An update that changes nothing keeps the cached result.
+        await user_manager.update_user(user, UserUpdate(email=user.email))
+        assert token_cache.get(token, settings.DEFAULT_TENANT_ID) is not None
+
+        monkeypatch.setattr(user, "is_verified", user.is_verified)
+        await user_manager.update_user(user, UserUpdate(is_verified=True), safe=False)
+        assert token_cache.get(token, settings.DEFAULT_TENANT_ID) is None
@@ -0,0 +1,57 @@
+import jwt
+import pytest
+from fastapi import status
+from user_service.src.core.config import settings
+from user_service.src.core.jwt_token import JWTTokenService
+
+
+@pytest.mark.router
+class TestJWKS:
+    async def test_jwks(self, client, user):
+        response = await client.get("/.well-known/jwks.json")
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["etag"].startswith('"')
+        assert response.headers["cache-control"] == (
+            f"public, max-age={settings.JWKS_CACHE_MAX_AGE_SECONDS}"
+        )
+
+        keys = response.json()["keys"]
+        assert len(keys) == 1
+        assert keys[0]["kty"] == "RSA"
+        assert keys[0]["alg"] == settings.JWT_ALGORITHM
+        assert keys[0]["use"] == "sig"
+
+        token = await JWTTokenService().write_token(user)
+        assert jwt.get_unverified_header(token)["kid"] == keys[0]["kid"]
+
+    async def test_jwks_verifies_token(self, client, user):
+        response = await client.get("/.well-known/jwks.json")
+        jwk_set = jwt.PyJWKSet.from_dict(response.json())
+        token = await JWTTokenService().write_token(user)
+
+        signing_key = jwk_set[jwt.get_unverified_header(token)["kid"]]
+        decoded_jwt = jwt.decode(
+            token,
+            key=signing_key.key,
+            audience=settings.JWT_AUDIENCE,
+            algorithms=[settings.JWT_ALGORITHM],
+        )
+        assert decoded_jwt["sub"] == str(user.id)
+
+    async def test_jwks_not_modified(self, client):
+        response = await client.get("/.well-known/jwks.json")
+        etag = response.headers["etag"]
+
+        response = await client.get(
+            "/.well-known/jwks.json", headers={"If-None-Match": etag}
+        )
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response.headers["etag"] == etag
+        assert response.content == b""
+
+    async def test_jwks_modified(self, client):
+        response = await client.get(
+            "/.well-known/jwks.json", headers={"If-None-Match": '"outdated"'}
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["keys"]
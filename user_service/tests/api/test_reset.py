@@ -0,0 +1,94 @@
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+from user_service.src.core.exceptions import ErrorCode, UserUpdateConflict
+from user_service.src.core.security import verify_password
+
+
+@pytest.fixture
+def reset_user_manager(user_manager, mocker, monkeypatch, user):
+    # The user fixtures are session scoped; restore the password after each test.
+    monkeypatch.setattr(user, "hashed_password", user.hashed_password)
+    mocker.spy(user_manager, "on_after_forgot_password")
+    mocker.spy(user_manager, "on_after_reset_password")
+    return user_manager
+
+
+async def forgot_password(client: AsyncClient, user_manager, email: str) -> str:
+    response = await client.post("/forgot-password", json={"email": email})
+    assert response.status_code == status.HTTP_202_ACCEPTED
+    return user_manager.on_after_forgot_password.call_args.args[1]
+
+
+@pytest.mark.router
+class TestForgotPassword:
+    async def test_unknown_email(self, client, reset_user_manager):
+        response = await client.post(
+            "/forgot-password", json={"email": "unknown@example.com"}
+        )
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        assert reset_user_manager.on_after_forgot_password.called is False
+
+    async def test_inactive_user(self, client, reset_user_manager, user_inactive):
+        response = await client.post(
+            "/forgot-password", json={"email": user_inactive.email}
+        )
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        assert reset_user_manager.on_after_forgot_password.called is False
+
+
+@pytest.mark.router
+class TestResetPassword:
+    async def test_reset_password(self, client, reset_user_manager, user):
+        token = await forgot_password(client, reset_user_manager, user.email)
+        response = await client.post(
+            "/reset-password", json={"token": token, "password": "newsecret123"}
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert verify_password("newsecret123", user.hashed_password)
+        assert reset_user_manager.on_after_reset_password.called is True
+
+    async def test_token_is_single_use(self, client, reset_user_manager, user):
+        token = await forgot_password(client, reset_user_manager, user.email)
+        await client.post(
+            "/reset-password", json={"token": token, "password": "newsecret123"}
+        )
+        response = await client.post(
+            "/reset-password", json={"token": token, "password": "othersecret123"}
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.json()["detail"] == ErrorCode.RESET_PASSWORD_BAD_TOKEN
+        assert verify_password("newsecret123", user.hashed_password)
+
+    async def test_update_conflict(self, client, reset_user_manager, user, mocker):
+        token = await forgot_password(client, reset_user_manager, user.email)
+        mocker.patch.object(
+            reset_user_manager.user_db, "update_user", side_effect=UserUpdateConflict
+        )
+        response = await client.post(
+            "/reset-password", json={"token": token, "password": "newsecret123"}
+        )
+        assert response.status_code == status.HTTP_409_CONFLICT
+        assert response.json()["detail"] == ErrorCode.UPDATE_USER_CONFLICT
+        assert reset_user_manager.on_after_reset_password.called is False
+
+    async def test_invalid_token(self, client, reset_user_manager):
+        response = await client.post(
+            "/reset-password", json={"token": "foo", "password": "newsecret123"}
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.json()["detail"] == ErrorCode.RESET_PASSWORD_BAD_TOKEN
+
+    async def test_invalid_password(self, client, reset_user_manager, user):
+        token = await forgot_password(client, reset_user_manager, user.email)
+        response = await client.post(
+            "/reset-password", json={"token": token, "password": "short"}
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.json() == {
+            "detail": {
+                "error_code": ErrorCode.RESET_PASSWORD_INVALID_PASSWORD,
+                "message": "Password must be at least 8 characters long.",
+            }
+        }
+        assert reset_user_manager.on_after_reset_password.called is False
@@ -0,0 +1,90 @@
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+from user_service.src.core.exceptions import ErrorCode, UserUpdateConflict
+from user_service.src.core.security import encode_jwt
+from user_service.src.db.manager import VERIFY_TOKEN_AUDIENCE
+
+
+@pytest.fixture
+def verify_user_manager(user_manager, mocker, monkeypatch, user):
+    # The user fixtures are session scoped; restore the flag after each test.
+    monkeypatch.setattr(user, "is_verified", False)
+    mocker.spy(user_manager, "on_after_request_verify")
+    mocker.spy(user_manager, "on_after_verify")
+    return user_manager
+
+
+async def request_token(client: AsyncClient, user_manager, email: str) -> str:
+    response = await client.post("/request-verify-token", json={"email": email})
+    assert response.status_code == status.HTTP_202_ACCEPTED
+    return user_manager.on_after_request_verify.call_args.args[1]
+
+
+@pytest.mark.router
+class TestRequestVerifyToken:
+    async def test_unknown_email(self, client, verify_user_manager):
+        response = await client.post(
+            "/request-verify-token", json={"email": "unknown@example.com"}
+        )
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        assert verify_user_manager.on_after_request_verify.called is False
+
+    @pytest.mark.parametrize(
+        "email", ["user_verified@example.com", "user_inactive@example.com"]
+    )
+    async def test_not_issued(self, client, verify_user_manager, email):
+        response = await client.post("/request-verify-token", json={"email": email})
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        assert verify_user_manager.on_after_request_verify.called is False
+
+    async def test_issued(self, client, verify_user_manager, user):
+        token = await request_token(client, verify_user_manager, user.email)
+        assert isinstance(token, str)
+
+
+@pytest.mark.router
+class TestVerify:
+    async def test_verify(self, client, verify_user_manager, user):
+        token = await request_token(client, verify_user_manager, user.email)
+        response = await client.post("/verify", json={"token": token})
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["is_verified"] is True
+        assert verify_user_manager.on_after_verify.called is True
+
+        response = await client.post("/verify", json={"token": token})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.json()["detail"] == ErrorCode.VERIFY_USER_ALREADY_VERIFIED
+
+    async def test_update_conflict(self, client, verify_user_manager, user, mocker):
+        token = await request_token(client, verify_user_manager, user.email)
+        mocker.patch.object(
+            verify_user_manager.user_db, "update_user", side_effect=UserUpdateConflict
+        )
+        response = await client.post("/verify", json={"token": token})
+        assert response.status_code == status.HTTP_409_CONFLICT
+        assert response.json()["detail"] == ErrorCode.UPDATE_USER_CONFLICT
+        assert verify_user_manager.on_after_verify.called is False
+
+    async def test_invalid_token(self, client, verify_user_manager):
+        response = await client.post("/verify", json={"token": "foo"})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.json()["detail"] == ErrorCode.VERIFY_USER_BAD_TOKEN
+
+    async def test_email_changed(self, client, verify_user_manager, user):
+        token = encode_jwt(
+            {
+                "sub": str(user.id),
+                "email": "previous@example.com",
+                "aud": VERIFY_TOKEN_AUDIENCE,
+            }
+        )
+        response = await client.post("/verify", json={"token": token})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.json()["detail"] == ErrorCode.VERIFY_USER_BAD_TOKEN
+
+    async def test_wrong_audience(self, client, verify_user_manager, user):
+        token = encode_jwt({"sub": str(user.id), "email": user.email})
+        response = await client.post("/verify", json={"token": token})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert verify_user_manager.on_after_verify.called is False
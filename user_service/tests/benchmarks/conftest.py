@@ -0,0 +1,145 @@
+import asyncio
+import statistics
+import time
+import tracemalloc
+from typing import Any, Awaitable, Callable
+import pytest
+
+
+class Benchmark:
+    """
+    Minimal timing helper for the benchmark tests.
+
+    Results are printed (visible with ``pytest -s``) and attached to the test report as user
+    properties, so ``--junitxml`` output can be compared between runs. Timings are only
+    recorded, never asserted, as they depend on the machine. Benchmarks are deselected by
+    default; run them with ``pytest -m benchmark``.
+    """
+
+    def __init__(self, node: pytest.Item):
+        self.node = node
+        self.results: dict[str, float] = {}
+
+    async def __call__(
+        self,
+        name: str,
+        func: Callable[[], Awaitable[Any]],
+        iterations: int = 1000,
+        warmup: int = 100,
+    ) -> float:
+        for _ in range(warmup):
+            await func()
+        started = time.perf_counter()
+        for _ in range(iterations):
+            await func()
+        per_call_us = (time.perf_counter() - started) / iterations * 1_000_000
+        self.results[name] = per_call_us
+        self.node.user_properties.append((name, round(per_call_us, 2)))
+        print(f"\n{self.node.name}: {name} {per_call_us:.2f} us/op")
+        return per_call_us
+
+    async def load(
+        self,
+        name: str,
+        func: Callable[[int], Awaitable[Any]],
+        concurrency: int = 20,
+        iterations: int = 50,
+    ) -> dict[str, float]:
+        """
+        Runs ``func`` from ``concurrency`` tasks, ``iterations`` times each, and records the
+        throughput and the median and 99th percentile latency.
+
+        ``func`` receives the number of the call, so it can spread calls over keys.
+        """
+        latencies: list[float] = []
+
+        async def task(offset: int) -> None:
+            for i in range(iterations):
+                call_started = time.perf_counter()
+                await func(offset * iterations + i)
+                latencies.append(time.perf_counter() - call_started)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(task(offset) for offset in range(concurrency)))
+        elapsed = time.perf_counter() - started
+        percentiles = statistics.quantiles(latencies, n=100)
+        results = {
+            f"{name} ops/s": len(latencies) / elapsed,
+            f"{name} p50 us": percentiles[49] * 1_000_000,
+            f"{name} p99 us": percentiles[98] * 1_000_000,
+        }
+        for key, value in results.items():
+            self.results[key] = value
+            self.node.user_properties.append((key, round(value, 2)))
+            print(f"\n{self.node.name}: {key} {value:.2f}")
+        return results
+
+
+@pytest.fixture
+def benchmark(request) -> Benchmark:
+    return Benchmark(request.node)
+
+
+async def asgi_get(app, path: str, headers: list[tuple[bytes, bytes]] = ()) -> int:
+    """
+    Calls an ASGI app directly, without an HTTP client, and returns the status code.
+    """
+    status_code = 0
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        nonlocal status_code
+        if message["type"] == "http.response.start":
+            status_code = message["status"]
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": list(headers),
+        "client": ("127.0.0.1", 12345),
+        "server": ("localhost", 80),
+    }
+    await app(scope, receive, send)
+    return status_code
+
+
+async def allocated(func: Callable[[], Awaitable[Any]]) -> tuple[int, Any]:
+    """
+    Bytes still allocated after ``func`` returned, i.e. the memory its result holds on to.
+    """
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = await func()
+        return tracemalloc.get_traced_memory()[0] - before, result
+    finally:
+        tracemalloc.stop()
+
+
+async def peak_allocated(
+    func: Callable[[], Awaitable[Any]], iterations: int = 200
+) -> int:
+    """
+    Average peak of the memory allocated while ``func`` runs.
+    """
+    await func()
+    total = 0
+    tracemalloc.start()
+    try:
+        for _ in range(iterations):
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+            await func()
+            total += tracemalloc.get_traced_memory()[1] - before
+    finally:
+        tracemalloc.stop()
+    return total // iterations
@@ -0,0 +1,49 @@
+import pytest
+from user_service.tests.benchmarks.conftest import Benchmark
+from user_service.tests.conformance.conftest import (  # noqa: F401
+    UserDatabaseFactory,
+    user_db_factory,
+)
+
+USERS = 200
+
+
+@pytest.mark.benchmark
+async def test_user_database_load(
+    user_db_factory: UserDatabaseFactory, benchmark: Benchmark
+):
+    """
+    Standard numbers for every backend of the conformance suite, reported side by side
+    with ``--junitxml``. Each call opens its own database, like a request does.
+    """
+    user_db = user_db_factory(None)
+    user_ids = []
+    for i in range(USERS):
+        user = await user_db.create_user(
+            {"email": f"user{i}@example.com", "hashed_password": "$2b$password"}
+        )
+        user_ids.append(user.id)
+
+    async def get_by_email(i: int):
+        email = f"user{i % USERS}@example.com"
+        assert await user_db_factory(None).get_credentials_by_email(email) is not None
+
+    async def get_by_id(i: int):
+        assert await user_db_factory(None).get_snapshot_by_id(user_ids[i % USERS])
+
+    async def create(i: int):
+        await user_db_factory(None).create_user(
+            {"email": f"load{i}@example.com", "hashed_password": "$2b$password"}
+        )
+
+    async def update(i: int):
+        db = user_db_factory(None)
+        user = await db.get_user_by_id(user_ids[i % USERS])
+        await db.update_user(user, {"is_verified": i % 2 == 0})
+
+    await benchmark.load("credentials by email", get_by_email)
+    await benchmark.load("snapshot by id", get_by_id)
+    await benchmark.load("create", create, concurrency=10, iterations=20)
+    await benchmark.load("update", update, concurrency=10, iterations=20)
+
+    assert benchmark.results["credentials by email ops/s"] > 0
@@ -0,0 +1,82 @@
+from typing import Annotated, AsyncGenerator
+import pytest
+from fastapi import Depends, FastAPI
+from user_service.src.core.jwt_token import JWTTokenService, get_jwt_token_service
+from sqlalchemy.ext.asyncio import AsyncSession
+from user_service.src.db.base import (
+    async_session_maker,
+    get_async_session,
+    get_db,
+    get_user_manager,
+)
+from user_service.src.db.session import LazyAsyncSession
+from user_service.src.db import SQLAlchemyUserDatabase, UserManager
+from user_service.tests.benchmarks.conftest import asgi_get
+
+
+async def get_user_manager_chain(
+    user_db: Annotated[SQLAlchemyUserDatabase, Depends(get_db)]
+) -> AsyncGenerator[UserManager, None]:
+    yield UserManager(user_db)
+
+
+async def get_lazy_session() -> AsyncGenerator[LazyAsyncSession, None]:
+    async with LazyAsyncSession(async_session_maker) as session:
+        yield session
+
+
+async def get_jwt_token_service_per_request():
+    return JWTTokenService()
+
+
+@pytest.fixture(scope="module")
+def app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/chain")
+    async def chain(
+        user_manager: Annotated[UserManager, Depends(get_user_manager_chain)],
+        token_service: Annotated[
+            JWTTokenService, Depends(get_jwt_token_service_per_request)
+        ],
+    ):
+        return None
+
+    @app.get("/flat")
+    async def flat(
+        user_manager: Annotated[UserManager, Depends(get_user_manager)],
+        token_service: Annotated[JWTTokenService, Depends(get_jwt_token_service)],
+    ):
+        return None
+
+    @app.get("/eager")
+    async def eager(
+        session: Annotated[AsyncSession, Depends(get_async_session)],
+    ):
+        return None
+
+    @app.get("/lazy")
+    async def lazy(
+        session: Annotated[LazyAsyncSession, Depends(get_lazy_session)],
+    ):
+        return None
+
+    return app
+
+
+@pytest.mark.benchmark
+async def test_user_manager_dependency_overhead(app, benchmark):
+    assert await asgi_get(app, "/chain") == 200
+    assert await asgi_get(app, "/flat") == 200
+
+    await benchmark("chain", lambda: asgi_get(app, "/chain"), 2000)
+    await benchmark("flat", lambda: asgi_get(app, "/flat"), 2000)
+
+
+@pytest.mark.benchmark
+async def test_session_overhead_without_queries(app, benchmark):
+    assert await asgi_get(app, "/eager") == 200
+    assert await asgi_get(app, "/lazy") == 200
+
+    await benchmark("eager", lambda: asgi_get(app, "/eager"), 2000)
+    await benchmark("lazy", lambda: asgi_get(app, "/lazy"), 2000)
@@ -0,0 +1,78 @@
+import asyncio
+import time
+import pytest
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from user_service.src.db import SQLAlchemyUserDatabase
+from user_service.src.models import Base, UserTable
+from user_service.tests.benchmarks.conftest import peak_allocated
+
+USERS = 100
+CONCURRENCY = 50
+LOOKUPS_PER_TASK = 40
+
+
+@pytest.fixture
+async def session_maker(tmp_path):
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'projections.db'}", pool_size=CONCURRENCY
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_maker = async_sessionmaker(engine, expire_on_commit=False)
+    async with session_maker() as session:
+        session.add_all(
+            UserTable(email=f"user{i}@example.com", hashed_password="$2b$password")
+            for i in range(USERS)
+        )
+        await session.commit()
+    yield session_maker
+    await engine.dispose()
+
+
+async def lookups_per_second(session_maker, method: str) -> float:
+    """
+    Runs ``CONCURRENCY`` tasks that each look up users by email with a session per lookup,
+    like concurrent logins, and returns the overall throughput.
+    """
+
+    async def task(offset: int) -> None:
+        for i in range(LOOKUPS_PER_TASK):
+            async with session_maker() as session:
+                user_db = SQLAlchemyUserDatabase(session, UserTable)
+                email = f"user{(offset + i) % USERS}@example.com"
+                assert await getattr(user_db, method)(email) is not None
+
+    started = time.perf_counter()
+    await asyncio.gather(*(task(offset) for offset in range(CONCURRENCY)))
+    return CONCURRENCY * LOOKUPS_PER_TASK / (time.perf_counter() - started)
+
+
+@pytest.mark.benchmark
+async def test_credentials_projection(session_maker, request):
+    async with session_maker() as session:
+        user_db = SQLAlchemyUserDatabase(session, UserTable)
+
+        async def get_entity():
+            session.expunge_all()
+            return await user_db.get_user_by_email("user0@example.com")
+
+        async def get_credentials():
+            return await user_db.get_credentials_by_email("user0@example.com")
+
+        entity_peak = await peak_allocated(get_entity)
+        credentials_peak = await peak_allocated(get_credentials)
+
+    await lookups_per_second(session_maker, "get_credentials_by_email")
+    results = {
+        "entity qps": await lookups_per_second(session_maker, "get_user_by_email"),
+        "credentials qps": await lookups_per_second(
+            session_maker, "get_credentials_by_email"
+        ),
+        "entity peak bytes/lookup": entity_peak,
+        "credentials peak bytes/lookup": credentials_peak,
+    }
+    for name, value in results.items():
+        request.node.user_properties.append((name, round(value)))
+        print(f"\n{request.node.name}: {name} {value:.0f}")
+    # Throughput on SQLite is bound by aiosqlite's thread hop, so only allocations are checked.
+    assert credentials_peak < entity_peak
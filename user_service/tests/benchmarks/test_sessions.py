@@ -0,0 +1,51 @@
+from typing import Annotated, Any
+import pytest
+from fastapi import Depends, FastAPI
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from user_service.src.api.dependencies import current_token_claims
+from user_service.src.core.jwt_token import jwt_token_service
+from user_service.src.db.base import get_session_registry
+from user_service.src.db.sessions import SessionRegistry
+from user_service.src.models import Base, UserTable
+from user_service.tests.benchmarks.conftest import asgi_get
+
+
+@pytest.fixture
+async def session_registry(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'sessions.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_maker = async_sessionmaker(engine, expire_on_commit=False)
+    async with session_maker() as session:
+        user = UserTable(email="bench@example.com", hashed_password="$2b$password")
+        session.add(user)
+        await session.commit()
+    yield SessionRegistry(session_maker), user
+    await engine.dispose()
+
+
+@pytest.mark.benchmark
+async def test_session_tracking_overhead(session_registry, benchmark):
+    registry, user = session_registry
+    user_session = await registry.create(user)
+    token = await jwt_token_service.write_token(user, user_session.jti)
+    headers = [(b"authorization", f"Bearer {token}".encode())]
+
+    app = FastAPI()
+
+    @app.get("/claims")
+    async def claims(
+        claims: Annotated[dict[str, Any], Depends(current_token_claims)],
+    ):
+        return None
+
+    app.dependency_overrides[get_session_registry] = lambda: None
+    assert await asgi_get(app, "/claims", headers) == 200
+    await benchmark("untracked", lambda: asgi_get(app, "/claims", headers), 2000)
+
+    app.dependency_overrides[get_session_registry] = lambda: registry
+    assert await asgi_get(app, "/claims", headers) == 200
+    await benchmark("tracked", lambda: asgi_get(app, "/claims", headers), 2000)
+    # Cached status check plus a coalesced in-memory touch: one buffered write in total.
+    assert len(registry._last_seen) == 1
+    assert await registry.flush() == 1
@@ -0,0 +1,78 @@
+import pytest
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from user_service.src.db import SQLAlchemyUserDatabase
+from user_service.src.models import Base, UserTable
+from user_service.tests.benchmarks.conftest import allocated, peak_allocated
+
+CACHED_USERS = 1000
+
+
+@pytest.fixture
+async def user_db(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'snapshot.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_maker = async_sessionmaker(engine, expire_on_commit=False)
+    async with session_maker() as session:
+        session.add_all(
+            UserTable(email=f"user{i}@example.com", hashed_password="$2b$password")
+            for i in range(CACHED_USERS)
+        )
+        await session.commit()
+    async with session_maker() as session:
+        yield SQLAlchemyUserDatabase(session, UserTable)
+    await engine.dispose()
+
+
+@pytest.mark.benchmark
+async def test_snapshot_lookup(user_db, benchmark, request):
+    user = await user_db.get_user_by_email("user0@example.com")
+
+    async def get_entity():
+        user_db.session.expunge_all()
+        return await user_db.get_user_by_id(user.id)
+
+    async def get_snapshot():
+        return await user_db.get_snapshot_by_id(user.id)
+
+    # Dominated by the aiosqlite round trip, so only reported.
+    await benchmark("entity", get_entity, 2000)
+    await benchmark("snapshot", get_snapshot, 2000)
+
+    entity_peak = await peak_allocated(get_entity)
+    snapshot_peak = await peak_allocated(get_snapshot)
+    for name, size in (("entity", entity_peak), ("snapshot", snapshot_peak)):
+        request.node.user_properties.append((f"{name} peak bytes/lookup", size))
+        print(f"\n{request.node.name}: {name} {size} peak bytes/lookup")
+    assert snapshot_peak < entity_peak
+
+
+@pytest.mark.benchmark
+async def test_snapshot_cache_memory(user_db, request):
+    users = [
+        await user_db.get_user_by_email(f"user{i}@example.com")
+        for i in range(CACHED_USERS)
+    ]
+    ids = [user.id for user in users]
+    user_db.session.expunge_all()
+    del users
+
+    async def cache_entities():
+        cache = {}
+        for user_id in ids:
+            cache[user_id] = await user_db.get_user_by_id(user_id)
+            user_db.session.expunge(cache[user_id])
+        return cache
+
+    async def cache_snapshots():
+        return {user_id: await user_db.get_snapshot_by_id(user_id) for user_id in ids}
+
+    entity_bytes, entities = await allocated(cache_entities)
+    snapshot_bytes, snapshots = await allocated(cache_snapshots)
+    for name, size in (("entity", entity_bytes), ("snapshot", snapshot_bytes)):
+        request.node.user_properties.append(
+            (f"{name} bytes/entry", size // CACHED_USERS)
+        )
+        print(f"\n{request.node.name}: {name} {size // CACHED_USERS} bytes/entry")
+    assert len(entities) == len(snapshots) == CACHED_USERS
+    assert snapshot_bytes < entity_bytes
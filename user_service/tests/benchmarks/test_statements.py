@@ -0,0 +1,36 @@
+import pytest
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import Session
+from user_service.src.db.database import lookup_statement
+from user_service.src.models import Base, UserTable, UserCredentials
+
+EMAIL = "user@example.com"
+
+
+@pytest.fixture
+def session():
+    # In-memory SQLite answers in microseconds, so the timings are mostly Python overhead.
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(UserTable(email=EMAIL, hashed_password="$2b$password"))
+        session.commit()
+        yield session
+    engine.dispose()
+
+
+@pytest.mark.benchmark
+async def test_cached_lookup_statements(session, benchmark):
+    async def rebuilt():
+        statement = select(*UserCredentials.columns(UserTable)).where(
+            func.lower(UserTable.email) == EMAIL
+        )
+        return session.execute(statement).first()
+
+    async def cached():
+        statement = lookup_statement(UserTable, UserCredentials, "email", False)
+        return session.execute(statement, {"email": EMAIL}).first()
+
+    assert await rebuilt() == await cached()
+    await benchmark("rebuilt", rebuilt, 5000)
+    await benchmark("cached", cached, 5000)
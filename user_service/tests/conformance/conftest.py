@@ -0,0 +1,75 @@
+from contextlib import AsyncExitStack
+from typing import AsyncGenerator, Callable, Optional
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from user_service.src.core.interfaces import BaseTokenService, BaseUserDatabase
+from user_service.src.core.jwt_token import JWTTokenService
+from user_service.src.db import SQLAlchemyUserDatabase, UserManager
+from user_service.src.db.engine import create_db_engine
+from user_service.src.db.memory import InMemoryUserDatabase, InMemoryUserStore
+from user_service.src.models import Base, UserTable, OAuthAccountTable
+
+UserDatabaseFactory = Callable[[Optional[str]], BaseUserDatabase]
+
+USER_DATABASE_BACKENDS = ["sqlalchemy", "sqlite-wal", "memory"]
+TOKEN_SERVICES = ["jwt"]
+
+
+@pytest_asyncio.fixture(loop_scope="function", params=USER_DATABASE_BACKENDS)
+async def user_db_factory(
+    request, tmp_path
+) -> AsyncGenerator[UserDatabaseFactory, None]:
+    """
+    Opens databases of a backend, optionally scoped to a tenant, over one shared storage.
+
+    Every call returns an independent database, with its own session for the SQL backends,
+    so tests can run concurrent operations against the same data. A new backend only needs
+    a branch here to run the whole suite, including ``tests/benchmarks/test_backends.py``.
+    """
+    if request.param == "memory":
+        store = InMemoryUserStore(tmp_path / "users.snapshot")
+        yield lambda tenant_id=None: InMemoryUserDatabase(store, tenant_id)
+        return
+
+    url = f"sqlite+aiosqlite:///{tmp_path / 'users.db'}"
+    if request.param == "sqlite-wal":
+        engine = create_db_engine(url, echo=False)
+    else:
+        engine = create_async_engine(url)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_maker = async_sessionmaker(engine, expire_on_commit=False)
+
+    async with AsyncExitStack() as sessions:
+
+        def open_db(tenant_id: Optional[str] = None) -> SQLAlchemyUserDatabase:
+            session = session_maker()
+            sessions.push_async_callback(session.close)
+            return SQLAlchemyUserDatabase(
+                session, UserTable, OAuthAccountTable, tenant_id=tenant_id
+            )
+
+        yield open_db
+
+    await engine.dispose()
+
+
+@pytest.fixture
+def user_db(user_db_factory: UserDatabaseFactory) -> BaseUserDatabase:
+    return user_db_factory(None)
+
+
+@pytest.fixture
+def user_manager_factory(
+    user_db_factory: UserDatabaseFactory,
+) -> Callable[[], UserManager]:
+    """
+    Builds a user manager per request, like ``get_user_manager``.
+    """
+    return lambda: UserManager(user_db_factory(None))
+
+
+@pytest.fixture(params=TOKEN_SERVICES)
+def token_service(request) -> BaseTokenService:
+    return JWTTokenService()
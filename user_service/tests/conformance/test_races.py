@@ -0,0 +1,190 @@
+import asyncio
+from user_service.src.core.exceptions import (
+    InvalidCurrentPassword,
+    InvalidResetPasswordToken,
+    UserAlreadyExists,
+)
+from user_service.src.core.security import verify_password
+from user_service.src.schemes import UserCreate, UserUpdate
+from user_service.tests.conformance.conftest import UserDatabaseFactory
+from user_service.tests.conformance.test_user_database import (
+    OAUTH_ACCOUNT_DICT,
+    USER_CREATE_DICT,
+)
+
+CONCURRENCY = 10
+
+
+def split_results(results: list) -> tuple[list, list]:
+    errors = [result for result in results if isinstance(result, BaseException)]
+    return [result for result in results if result not in errors], errors
+
+
+async def test_concurrent_create_same_email(user_db_factory: UserDatabaseFactory):
+    results = await asyncio.gather(
+        *(
+            user_db_factory(None).create_user(
+                {**USER_CREATE_DICT, "email": f"{' ' * i}Create@example.com"}
+            )
+            for i in range(CONCURRENCY)
+        ),
+        return_exceptions=True,
+    )
+
+    created, errors = split_results(results)
+    assert len(created) == 1
+    assert all(isinstance(error, UserAlreadyExists) for error in errors)
+    user = await user_db_factory(None).get_user_by_email("create@example.com")
+    assert user.id == created[0].id
+
+
+async def test_concurrent_email_change(user_db_factory: UserDatabaseFactory):
+    users = []
+    for i in range(CONCURRENCY):
+        users.append(
+            await user_db_factory(None).create_user(
+                {**USER_CREATE_DICT, "email": f"user{i}@example.com"}
+            )
+        )
+    # Update each user through the database that loaded it.
+    user_dbs = [user_db_factory(None) for _ in users]
+    loaded = [await db.get_user_by_id(user.id) for db, user in zip(user_dbs, users)]
+
+    results = await asyncio.gather(
+        *(
+            db.update_user(user, {"email": "target@example.com"})
+            for db, user in zip(user_dbs, loaded)
+        ),
+        return_exceptions=True,
+    )
+
+    updated, errors = split_results(results)
+    assert len(updated) == 1
+    assert all(isinstance(error, UserAlreadyExists) for error in errors)
+    owner = await user_db_factory(None).get_user_by_email("target@example.com")
+    assert owner.id == updated[0].id
+
+
+async def test_concurrent_oauth_link(user_db_factory: UserDatabaseFactory):
+    user_ids = []
+    for i in range(CONCURRENCY):
+        user = await user_db_factory(None).create_user(
+            {**USER_CREATE_DICT, "email": f"user{i}@example.com"}
+        )
+        user_ids.append(user.id)
+    user_dbs = [user_db_factory(None) for _ in user_ids]
+    loaded = [await db.get_user_by_id(id) for db, id in zip(user_dbs, user_ids)]
+
+    owners = await asyncio.gather(
+        *(
+            db.upsert_oauth_account(user, OAUTH_ACCOUNT_DICT)
+            for db, user in zip(user_dbs, loaded)
+        )
+    )
+
+    # Whoever won, every caller sees the same single owner.
+    owner_ids = {owner.id for owner in owners}
+    assert len(owner_ids) == 1
+    owner = await user_db_factory(None).get_by_oauth_account("service1", "user_oauth1")
+    assert {owner.id} == owner_ids
+    assert len(owner.oauth_accounts) == 1
+
+
+async def test_concurrent_registration(user_manager_factory):
+    """
+    Registrations racing past the manager's email check still create a single user.
+    """
+    results = await asyncio.gather(
+        *(
+            user_manager_factory().create_user(
+                UserCreate(email="race@example.com", password="Password1!")
+            )
+            for _ in range(CONCURRENCY)
+        ),
+        return_exceptions=True,
+    )
+
+    created, errors = split_results(results)
+    assert len(created) == 1
+    assert all(isinstance(error, UserAlreadyExists) for error in errors)
+
+
+async def test_stale_update_keeps_concurrent_change(user_manager_factory):
+    """
+    A password change made from a copy loaded before an email change keeps the new email.
+    """
+    user = await user_manager_factory().create_user(
+        UserCreate(email="stale@example.com", password="Password1!")
+    )
+    first, second = user_manager_factory(), user_manager_factory()
+    first_copy = await first.get_user_by_id(user.id)
+    second_copy = await second.get_user_by_id(user.id)
+
+    await first.update_user(first_copy, UserUpdate(email="fresh@example.com"))
+    updated = await second.update_user(
+        second_copy, UserUpdate(password="NewPassword1!")
+    )
+
+    assert updated.email == "fresh@example.com"
+    assert verify_password("NewPassword1!", updated.hashed_password)
+    assert updated.version == 3
+
+
+async def test_concurrent_reset_password_same_token(user_manager_factory):
+    """
+    A reset token spent by one of several concurrent requests is rejected for the others.
+    """
+    manager = user_manager_factory()
+    user = await manager.create_user(
+        UserCreate(email="reset@example.com", password="Password1!")
+    )
+    tokens = []
+
+    async def on_after_forgot_password(user, token, request=None):
+        tokens.append(token)
+
+    manager.on_after_forgot_password = on_after_forgot_password
+    await manager.forgot_password(user)
+
+    results = await asyncio.gather(
+        *(
+            user_manager_factory().reset_password(tokens[0], f"NewPassword{i}!")
+            for i in range(CONCURRENCY)
+        ),
+        return_exceptions=True,
+    )
+
+    reset, errors = split_results(results)
+    assert len(reset) == 1
+    assert all(isinstance(error, InvalidResetPasswordToken) for error in errors)
+    user = await user_manager_factory().get_user_by_id(user.id)
+    assert user.hashed_password == reset[0].hashed_password
+
+
+async def test_concurrent_password_change(user_manager_factory):
+    """
+    Once one request changed the password, the current password of the others is wrong.
+    """
+    user = await user_manager_factory().create_user(
+        UserCreate(email="change@example.com", password="Password1!")
+    )
+    managers = [user_manager_factory() for _ in range(CONCURRENCY)]
+    copies = [await manager.get_user_by_id(user.id) for manager in managers]
+
+    results = await asyncio.gather(
+        *(
+            manager.update_user(
+                copy,
+                UserUpdate(password=f"NewPassword{i}!"),
+                current_password="Password1!",
+            )
+            for i, (manager, copy) in enumerate(zip(managers, copies))
+        ),
+        return_exceptions=True,
+    )
+
+    updated, errors = split_results(results)
+    assert len(updated) == 1
+    assert all(isinstance(error, InvalidCurrentPassword) for error in errors)
+    user = await user_manager_factory().get_user_by_id(user.id)
+    assert user.hashed_password == updated[0].hashed_password
@@ -0,0 +1,53 @@
+import pytest
+import pytest_asyncio
+from user_service.src.core.interfaces import BaseTokenService
+from user_service.src.models import UserSnapshot
+from user_service.src.schemes import UserCreate
+
+
+@pytest_asyncio.fixture(loop_scope="function")
+async def user(user_manager_factory):
+    return await user_manager_factory().create_user(
+        UserCreate(email="token@example.com", password="Password1!")
+    )
+
+
+async def test_round_trip(token_service: BaseTokenService, user_manager_factory, user):
+    token = await token_service.write_token(user)
+
+    claims = await token_service.read_claims(token)
+    assert claims["sub"] == str(user.id)
+    snapshot = await token_service.read_token(token, user_manager_factory())
+    assert snapshot == UserSnapshot.from_table(user)
+
+
+@pytest.mark.parametrize("token", [None, "", "invalid"])
+async def test_invalid_token(
+    token_service: BaseTokenService, user_manager_factory, token
+):
+    assert await token_service.read_claims(token) is None
+    assert await token_service.read_token(token, user_manager_factory()) is None
+
+
+async def test_tampered_token(
+    token_service: BaseTokenService, user_manager_factory, user
+):
+    token = await token_service.write_token(user)
+    header, payload, signature = token.split(".")
+    tampered = f"{header}.{payload}.{signature[::-1]}"
+
+    assert await token_service.read_claims(tampered) is None
+    assert await token_service.read_token(tampered, user_manager_factory()) is None
+
+
+async def test_deleted_user(
+    token_service: BaseTokenService, user_manager_factory, user
+):
+    token = await token_service.write_token(user)
+    user_manager = user_manager_factory()
+    await user_manager.user_db.delete_user(
+        await user_manager.user_db.get_user_by_id(user.id)
+    )
+
+    assert await token_service.read_claims(token) is not None
+    assert await token_service.read_token(token, user_manager_factory()) is None
@@ -0,0 +1,205 @@
+import pytest
+from user_service.src.core.exceptions import UserAlreadyExists
+from user_service.src.core.interfaces import BaseUserDatabase
+from user_service.src.models import UserSnapshot
+from user_service.tests.conformance.conftest import UserDatabaseFactory
+
+USER_CREATE_DICT = {
+    "email": "create@example.com",
+    "hashed_password": "$2b$password123456789",
+}
+OAUTH_ACCOUNT_DICT = {
+    "oauth_name": "service1",
+    "access_token": "TOKEN",
+    "expires_at": 1579000751,
+    "account_id": "user_oauth1",
+    "account_email": "oauth@example.com",
+}
+
+
+async def test_queries(user_db: BaseUserDatabase):
+    # Create
+    user = await user_db.create_user(USER_CREATE_DICT)
+    assert user.id is not None
+    assert user.email == "create@example.com"
+    assert user.tenant_id == "default"
+    assert user.is_active is True
+    assert user.is_superuser is False
+    assert user.is_verified is False
+
+    # Get
+    assert (await user_db.get_user_by_id(user.id)).id == user.id
+    assert (await user_db.get_user_by_email("create@example.com")).id == user.id
+    assert await user_db.get_user_by_email("missing@example.com") is None
+
+    # Update
+    updated_user = await user_db.update_user(
+        user, {"email": "Update@Example.com", "is_verified": True}
+    )
+    assert updated_user.id == user.id
+    assert updated_user.email == "update@example.com"
+    assert updated_user.is_verified is True
+    assert (await user_db.get_user_by_email("update@example.com")).id == user.id
+    assert await user_db.get_user_by_email("create@example.com") is None
+
+    # Delete
+    await user_db.delete_user(updated_user)
+    assert await user_db.get_user_by_id(user.id) is None
+    assert await user_db.get_user_by_email("update@example.com") is None
+
+
+async def test_create_existing_user(user_db: BaseUserDatabase):
+    await user_db.create_user(USER_CREATE_DICT)
+
+    with pytest.raises(UserAlreadyExists):
+        await user_db.create_user({**USER_CREATE_DICT, "email": "CREATE@example.com"})
+
+
+async def test_update_to_existing_email(user_db: BaseUserDatabase):
+    await user_db.create_user(USER_CREATE_DICT)
+    user = await user_db.create_user({**USER_CREATE_DICT, "email": "other@example.com"})
+
+    with pytest.raises(UserAlreadyExists):
+        await user_db.update_user(user, {"email": "create@example.com"})
+
+
+async def test_queries_oauth(user_db: BaseUserDatabase):
+    user = await user_db.create_user(USER_CREATE_DICT)
+    user_id = user.id
+
+    # Link
+    linked_user = await user_db.upsert_oauth_account(user, OAUTH_ACCOUNT_DICT)
+    assert linked_user.id == user_id
+    assert [a.access_token for a in linked_user.oauth_accounts] == ["TOKEN"]
+
+    # Refresh tokens
+    refreshed_user = await user_db.upsert_oauth_account(
+        linked_user, {**OAUTH_ACCOUNT_DICT, "access_token": "NEW_TOKEN"}
+    )
+    assert [a.access_token for a in refreshed_user.oauth_accounts] == ["NEW_TOKEN"]
+
+    # Update
+    await user_db.update_oauth_account(
+        refreshed_user, refreshed_user.oauth_accounts[0], {"access_token": "UPDATED"}
+    )
+
+    # Get_By_Oauth_Account
+    oauth_user = await user_db.get_by_oauth_account("service1", "user_oauth1")
+    assert oauth_user.id == user_id
+    assert oauth_user.oauth_accounts[0].access_token == "UPDATED"
+    assert await user_db.get_by_oauth_account("service1", "unknown") is None
+
+    # Linked to another user
+    other_user = await user_db.create_user(
+        {**USER_CREATE_DICT, "email": "other@example.com"}
+    )
+    owner = await user_db.upsert_oauth_account(other_user, OAUTH_ACCOUNT_DICT)
+    assert owner.id == user_id
+    assert owner.oauth_accounts[0].access_token == "UPDATED"
+
+    # Delete cascades
+    await user_db.delete_user(owner)
+    assert await user_db.get_by_oauth_account("service1", "user_oauth1") is None
+
+
+async def test_tenant_scoping(user_db_factory: UserDatabaseFactory):
+    tenant_a = user_db_factory("a")
+    tenant_b = user_db_factory("b")
+
+    # The same email can register once per tenant
+    user_a = await tenant_a.create_user(USER_CREATE_DICT)
+    user_b = await tenant_b.create_user(USER_CREATE_DICT)
+    user_a_id, user_b_id = user_a.id, user_b.id
+    assert user_a.tenant_id == "a"
+    assert user_b.tenant_id == "b"
+
+    # Lookups only see the tenant's users
+    assert (await tenant_a.get_user_by_email("create@example.com")).id == user_a_id
+    assert (await tenant_b.get_user_by_email("create@example.com")).id == user_b_id
+    assert await tenant_a.get_user_by_id(user_b_id) is None
+    assert await tenant_b.get_user_by_id(user_a_id) is None
+    assert await tenant_a.get_snapshot_by_id(user_b_id) is None
+    assert await tenant_a.get_identity_by_id(user_b_id) is None
+
+    # An account linked in another tenant is not visible
+    linked = await tenant_a.upsert_oauth_account(user_a, OAUTH_ACCOUNT_DICT)
+    assert linked.id == user_a_id
+    assert await tenant_b.get_by_oauth_account("service1", "user_oauth1") is None
+    assert await tenant_b.upsert_oauth_account(user_b, OAUTH_ACCOUNT_DICT) is None
+
+    with pytest.raises(UserAlreadyExists):
+        await tenant_a.create_user(USER_CREATE_DICT)
+
+
+async def test_email_lookup_is_case_insensitive(user_db: BaseUserDatabase):
+    user = await user_db.create_user(
+        {**USER_CREATE_DICT, "email": " Mixed@Example.com"}
+    )
+    assert user.email == "mixed@example.com"
+    assert (await user_db.get_user_by_email("MIXED@example.COM")).id == user.id
+    assert (await user_db.get_snapshot_by_email("MIXED@example.COM")).id == user.id
+    assert (await user_db.get_credentials_by_email("MIXED@example.COM")).id == user.id
+
+
+async def test_snapshots_and_projections(user_db: BaseUserDatabase):
+    user = await user_db.create_user(USER_CREATE_DICT)
+    snapshot = UserSnapshot.from_table(user)
+
+    assert await user_db.get_snapshot_by_id(user.id) == snapshot
+    assert await user_db.get_snapshot_by_email("Create@example.com") == snapshot
+    assert await user_db.get_credentials_by_email("create@example.com") == (
+        user.id,
+        "create@example.com",
+        "$2b$password123456789",
+        True,
+    )
+    assert await user_db.get_identity_by_id(user.id) == (
+        user.id,
+        "create@example.com",
+        True,
+    )
+    assert await user_db.get_snapshot_by_email("missing@example.com") is None
+    assert await user_db.get_credentials_by_email("missing@example.com") is None
+
+
+async def test_bulk_update_users(user_db_factory: UserDatabaseFactory):
+    tenant_a = user_db_factory("a")
+    user = await tenant_a.create_user(USER_CREATE_DICT)
+    inactive = await tenant_a.create_user(
+        {**USER_CREATE_DICT, "email": "inactive@example.com", "is_active": False}
+    )
+    other_tenant = await user_db_factory("b").create_user(USER_CREATE_DICT)
+    user_id, inactive_id, other_id = user.id, inactive.id, other_tenant.id
+
+    updated = await user_db_factory("a").bulk_update_users(
+        [user_id, inactive_id, other_id], {"is_active": False}
+    )
+
+    # Only the users of the tenant whose value changes are written.
+    assert updated == [(user_id, "create@example.com", False)]
+    reader = user_db_factory("a")
+    assert (await reader.get_identity_by_id(user_id)).is_active is False
+    assert (await user_db_factory("b").get_identity_by_id(other_id)).is_active is True
+    assert (await reader.get_user_by_id(user_id)).version == 2
+    assert (await reader.get_user_by_id(inactive_id)).version == 1
+
+
+async def test_soft_delete(user_db_factory: UserDatabaseFactory):
+    user_db = user_db_factory(None)
+    user = await user_db.create_user(USER_CREATE_DICT)
+    await user_db.upsert_oauth_account(user, OAUTH_ACCOUNT_DICT)
+    user_id = user.id
+    await user_db.delete_user(user)
+
+    reader = user_db_factory(None)
+    assert await reader.get_snapshot_by_id(user_id) is None
+    assert await reader.get_identity_by_id(user_id) is None
+    assert await reader.get_credentials_by_email("create@example.com") is None
+    assert await reader.get_by_oauth_account("service1", "user_oauth1") is None
+    assert await reader.bulk_update_users([user_id], {"is_active": False}) == []
+    # The email is free for a new user right away.
+    recreated = await reader.create_user(USER_CREATE_DICT)
+    assert recreated.id != user_id
+    assert (await reader.get_credentials_by_email("create@example.com")).id == (
+        recreated.id
+    )
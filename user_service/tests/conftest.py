@@ -11,6 +11,7 @@ from user_service.src.core.interfaces import BaseUserDatabase
 from user_service.src.core.security import hash_password
 from user_service.src.core.typing import StringType
 from user_service.src.db import UserManager
+from user_service.src.models import UserSnapshot, UserCredentials, UserIdentity
 
 
 @pydantic.dataclasses.dataclass
@@ -20,6 +21,7 @@ class FakeUserTable:
     is_active: bool = True
     is_superuser: bool = False
     is_verified: bool = False
+    version: int = 1
     id: UUID = Field(default_factory=uuid4)
 
 
@@ -65,7 +67,12 @@ def mock_user_db(
             return FakeUserTable(**create_dict)
 
         async def update_user(
-            self, update_user: FakeUserTable, updated_dict: dict[str, Any]
+            self,
+            update_user: FakeUserTable,
+            updated_dict: dict[str, Any],
+            *,
+            emit_event: bool = True,
+            expected_version: Optional[int] = None,
         ) -> FakeUserTable:
             for k, v in updated_dict.items():
                 setattr(update_user, k, v)
@@ -84,6 +91,32 @@ def mock_user_db(
             if user_id == admin.id:
                 return admin
 
+        async def get_snapshot_by_id(self, user_id: UUID) -> Optional[UserSnapshot]:
+            found = await self.get_user_by_id(user_id)
+            return UserSnapshot.from_table(found) if found else None
+
+        async def get_snapshot_by_email(
+            self, email: StringType
+        ) -> Optional[UserSnapshot]:
+            found = await self.get_user_by_email(email)
+            return UserSnapshot.from_table(found) if found else None
+
+        async def get_credentials_by_email(
+            self, email: StringType
+        ) -> Optional[UserCredentials]:
+            found = await self.get_user_by_email(email)
+            if not found:
+                return None
+            return UserCredentials(
+                found.id, found.email, found.hashed_password, found.is_active
+            )
+
+        async def get_identity_by_id(self, user_id: UUID) -> Optional[UserIdentity]:
+            found = await self.get_user_by_id(user_id)
+            return (
+                UserIdentity(found.id, found.email, found.is_active) if found else None
+            )
+
     return MockUserDatabase()
 
 
@@ -0,0 +1,96 @@
+from urllib.parse import parse_qs
+import httpx
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from user_service.src.core.oauth import OAuth2Provider, oauth_providers
+from user_service.src.models import Base
+
+
+class FakeOAuthServer:
+    """
+    Stand-in OAuth2 provider served through an httpx mock transport.
+
+    :attr failures: Number of upcoming token requests that fail with 503.
+    """
+
+    def __init__(self):
+        self.accounts = {
+            "code-alice": {"sub": "alice", "email": "Alice@Example.com"},
+            "code-bob": {"sub": "bob", "email": "bob@example.com"},
+            "code-no-email": {"sub": "anonymous"},
+        }
+        self.issued: dict[str, dict] = {}
+        self.token_requests: list[dict] = []
+        self.failures = 0
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/token":
+            return self._token(parse_qs(request.content.decode()))
+        if request.url.path == "/userinfo":
+            access_token = request.headers["Authorization"].removeprefix("Bearer ")
+            return httpx.Response(200, json=self.issued[access_token])
+        return httpx.Response(404)
+
+    def _token(self, form: dict[str, list[str]]) -> httpx.Response:
+        self.token_requests.append(form)
+        if self.failures:
+            self.failures -= 1
+            return httpx.Response(503)
+
+        if form["grant_type"] == ["refresh_token"]:
+            refresh_token = form["refresh_token"][0]
+            if not refresh_token.startswith("refresh-"):
+                return httpx.Response(400, json={"error": "invalid_grant"})
+            account = {"sub": refresh_token.removeprefix("refresh-")}
+        else:
+            account = self.accounts.get(form.get("code", [""])[0])
+            if account is None:
+                return httpx.Response(400, json={"error": "invalid_grant"})
+
+        access_token = f"access-{account['sub']}-{len(self.token_requests)}"
+        self.issued[access_token] = account
+        return httpx.Response(
+            200,
+            json={
+                "access_token": access_token,
+                "refresh_token": f"refresh-{account['sub']}",
+                "expires_in": 3600,
+            },
+        )
+
+
+@pytest.fixture
+def fake_oauth_server() -> FakeOAuthServer:
+    return FakeOAuthServer()
+
+
+@pytest.fixture
+def oauth_provider(fake_oauth_server):
+    oauth_provider = OAuth2Provider(
+        name="fake",
+        client_id="client",
+        client_secret="secret",
+        authorize_endpoint="https://provider.local/authorize",
+        access_token_endpoint="https://provider.local/token",
+        userinfo_endpoint="https://provider.local/userinfo",
+        scopes=["email"],
+        transport=httpx.MockTransport(fake_oauth_server),
+    )
+    oauth_providers["fake"] = oauth_provider
+    yield oauth_provider
+    del oauth_providers["fake"]
+
+
+@pytest_asyncio.fixture(scope="function")
+async def engine(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'users.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+def session_maker(engine):
+    return async_sessionmaker(engine, expire_on_commit=False)
@@ -0,0 +1,272 @@
+from datetime import datetime, timedelta, UTC
+import pytest
+from sqlalchemy import event, select, update
+from user_service.src.core.exceptions import UserAlreadyExists
+from user_service.src.db import SQLAlchemyUserDatabase, UserManager
+from user_service.src.models import (
+    UserTable,
+    OAuthAccountTable,
+    UserArchiveTable,
+    UserArchiveOAuthAccountTable,
+)
+from user_service.src.schemes import UserCreate
+from user_service.src.workers.archiver import UserArchiver
+
+OAUTH_ACCOUNT = {
+    "oauth_name": "fake",
+    "access_token": "access",
+    "expires_at": 1_000,
+    "refresh_token": "refresh",
+    "account_id": "account",
+    "account_email": "archived@example.com",
+}
+
+
+@pytest.fixture
+def archiver(session_maker) -> UserArchiver:
+    return UserArchiver(
+        session_maker, batch_size=2, inactive_after_days=180, deleted_after_days=30
+    )
+
+
+def user_db(session, tenant_id=None) -> SQLAlchemyUserDatabase:
+    return SQLAlchemyUserDatabase(
+        session,
+        UserTable,
+        OAuthAccountTable,
+        tenant_id=tenant_id,
+        archive_table=UserArchiveTable,
+        archive_oauth_account_table=UserArchiveOAuthAccountTable,
+    )
+
+
+async def create_user(session_maker, email: str, days_ago: int = 0, **values):
+    async with session_maker() as session:
+        user = await user_db(session).create_user(
+            {"email": email, "hashed_password": "hash", **values}
+        )
+        await session.execute(
+            update(UserTable)
+            .where(UserTable.id == user.id)
+            .values(updated_at=datetime.now(UTC) - timedelta(days=days_ago))
+        )
+        await session.commit()
+        return user
+
+
+async def emails(session_maker, table) -> set[str]:
+    async with session_maker() as session:
+        return set(await session.scalars(select(table.email)))
+
+
+class TestUserArchiver:
+    async def test_archives_due_users(self, session_maker, archiver):
+        await create_user(session_maker, "active@example.com", days_ago=365)
+        await create_user(
+            session_maker, "inactive@example.com", days_ago=200, is_active=False
+        )
+        await create_user(
+            session_maker, "recent@example.com", days_ago=100, is_active=False
+        )
+        deleted = await create_user(session_maker, "deleted@example.com")
+        async with session_maker() as session:
+            await user_db(session).delete_user(deleted)
+            await session.execute(
+                update(UserTable)
+                .where(UserTable.id == deleted.id)
+                .values(updated_at=datetime.now(UTC) - timedelta(days=31))
+            )
+            await session.commit()
+
+        assert await archiver.run_once() == 2
+        assert await emails(session_maker, UserTable) == {
+            "active@example.com",
+            "recent@example.com",
+        }
+        assert await emails(session_maker, UserArchiveTable) == {
+            "inactive@example.com",
+            "deleted@example.com",
+        }
+        assert await archiver.run_once() == 0
+
+    async def test_archives_in_batches(self, session_maker, archiver):
+        for i in range(5):
+            await create_user(
+                session_maker, f"user{i}@example.com", days_ago=200, is_active=False
+            )
+        assert await archiver.run_once() == 5
+        assert await emails(session_maker, UserTable) == set()
+
+    async def test_restore_on_lookup(self, session_maker, archiver):
+        user = await create_user(
+            session_maker, "archived@example.com", days_ago=200, is_active=False
+        )
+        async with session_maker() as session:
+            await user_db(session).upsert_oauth_account(user, OAUTH_ACCOUNT)
+        await archiver.run_once()
+        async with session_maker() as session:
+            assert await session.scalar(select(OAuthAccountTable.id)) is None
+
+        async with session_maker() as session:
+            db = user_db(session)
+            credentials = await db.get_credentials_by_email("Archived@Example.com")
+            assert credentials.id == user.id
+            assert credentials.is_active is False
+            restored = await db.get_by_oauth_account("fake", "account")
+            assert restored.id == user.id
+            assert restored.version == user.version
+        assert await emails(session_maker, UserArchiveTable) == set()
+
+    async def test_oauth_login_restores_by_account(self, session_maker, archiver):
+        user = await create_user(
+            session_maker, "archived@example.com", days_ago=200, is_active=False
+        )
+        async with session_maker() as session:
+            await user_db(session).upsert_oauth_account(user, OAUTH_ACCOUNT)
+        await archiver.run_once()
+
+        # The provider reports another email now, so only the account ID finds the user.
+        async with session_maker() as session:
+            linked = await UserManager(user_db(session)).oauth_callback(
+                "fake", "access", "account", "renamed@example.com"
+            )
+        assert linked.id == user.id
+        assert await emails(session_maker, UserTable) == {"archived@example.com"}
+        assert await emails(session_maker, UserArchiveTable) == set()
+        async with session_maker() as session:
+            assert await session.scalar(select(UserArchiveOAuthAccountTable)) is None
+
+    async def test_restore_by_id(self, session_maker, archiver):
+        user = await create_user(
+            session_maker, "archived@example.com", days_ago=200, is_active=False
+        )
+        await archiver.run_once()
+        async with session_maker() as session:
+            restored = await user_db(session).get_user_by_id(user.id)
+        assert restored.email == "archived@example.com"
+        # A restored user starts its archival clock again.
+        assert restored.updated_at.replace(tzinfo=UTC) > datetime.now(UTC) - timedelta(
+            minutes=1
+        )
+        assert await archiver.run_once() == 0
+
+    async def test_restore_inside_caller_transaction(self, session_maker, archiver):
+        user = await create_user(
+            session_maker, "archived@example.com", days_ago=200, is_active=False
+        )
+        other = await create_user(session_maker, "other@example.com")
+        await archiver.run_once()
+        async with session_maker() as session, session.begin():
+            await session.execute(
+                update(UserTable)
+                .where(UserTable.id == other.id)
+                .values(is_verified=True)
+            )
+            restored = await user_db(session).get_user_by_id(user.id)
+            assert restored.id == user.id
+            # Neither committed nor rolled back the caller's pending work.
+            assert session.in_transaction()
+            await session.rollback()
+        assert await emails(session_maker, UserArchiveTable) == {"archived@example.com"}
+        async with session_maker() as session:
+            assert (
+                await user_db(session).get_user_by_id(other.id)
+            ).is_verified is False
+
+    async def test_failed_restore_keeps_caller_transaction(
+        self, session_maker, archiver
+    ):
+        user = await create_user(
+            session_maker, "archived@example.com", days_ago=200, is_active=False
+        )
+        other = await create_user(session_maker, "other@example.com")
+        await archiver.run_once()
+        await create_user(session_maker, "archived@example.com")
+        async with session_maker() as session, session.begin():
+            await session.execute(
+                update(UserTable)
+                .where(UserTable.id == other.id)
+                .values(is_verified=True)
+            )
+            # The email was registered again, so the restore is rolled back alone.
+            assert await user_db(session).get_user_by_id(user.id) is None
+        assert await emails(session_maker, UserArchiveTable) == {"archived@example.com"}
+        async with session_maker() as session:
+            assert (await user_db(session).get_user_by_id(other.id)).is_verified is True
+
+    async def test_bulk_update_restores(self, session_maker, archiver):
+        user = await create_user(
+            session_maker, "archived@example.com", days_ago=200, is_active=False
+        )
+        await archiver.run_once()
+        async with session_maker() as session:
+            updated = await user_db(session).bulk_update_users(
+                [user.id], {"is_active": True}
+            )
+        assert [identity.id for identity in updated] == [user.id]
+        assert await emails(session_maker, UserArchiveTable) == set()
+
+    async def test_miss_does_not_write(self, session_maker, archiver):
+        async with session_maker() as session:
+            db = user_db(session)
+            statements = []
+
+            def record(conn, cursor, statement, *args):
+                statements.append(statement)
+
+            bind = session.get_bind()
+            event.listen(bind, "before_cursor_execute", record)
+            try:
+                assert await db.get_user_by_email("missing@example.com") is None
+            finally:
+                event.remove(bind, "before_cursor_execute", record)
+        assert any("users_archive" in s for s in statements)
+        assert not any(s.lstrip().upper().startswith("DELETE") for s in statements)
+
+    async def test_restore_is_tenant_scoped(self, session_maker, archiver):
+        await create_user(
+            session_maker,
+            "archived@example.com",
+            days_ago=200,
+            is_active=False,
+            tenant_id="a",
+        )
+        await archiver.run_once()
+        async with session_maker() as session:
+            assert (
+                await user_db(session, "b").get_user_by_email("archived@example.com")
+                is None
+            )
+            assert await user_db(session, "a").get_snapshot_by_email(
+                "archived@example.com"
+            )
+
+    async def test_registration_restores_archived_user(self, session_maker, archiver):
+        await create_user(
+            session_maker, "archived@example.com", days_ago=200, is_active=False
+        )
+        await archiver.run_once()
+        async with session_maker() as session:
+            with pytest.raises(UserAlreadyExists):
+                await UserManager(user_db(session)).create_user(
+                    UserCreate(email="archived@example.com", password="Password1!")
+                )
+        assert await emails(session_maker, UserTable) == {"archived@example.com"}
+
+    async def test_deleted_user_is_not_restored(self, session_maker, archiver):
+        user = await create_user(session_maker, "deleted@example.com", days_ago=40)
+        async with session_maker() as session:
+            db = user_db(session)
+            await db.delete_user(user)
+            # The email is free right away, even before the user is archived.
+            new_user = await db.create_user(
+                {"email": "deleted@example.com", "hashed_password": "hash"}
+            )
+        assert new_user.id != user.id
+        archiver.deleted_after = timedelta(0)
+        assert await archiver.run_once() == 1
+
+        async with session_maker() as session:
+            found = await user_db(session).get_user_by_email("deleted@example.com")
+        assert found.id == new_user.id
+        assert await emails(session_maker, UserArchiveTable) == {"deleted@example.com"}
@@ -0,0 +1,127 @@
+import asyncio
+from datetime import datetime, timedelta, UTC
+from uuid import uuid4
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.exc import IntegrityError
+from user_service.src.core.events import Event, EventBus, USER_LOGIN_FAILED
+from user_service.src.db.audit import AuditLog
+from user_service.src.models import AuditLogTable
+
+
+@pytest.fixture
+def audit_log(session_maker) -> AuditLog:
+    return AuditLog(session_maker, batch_size=3, interval=60, max_buffer=5)
+
+
+async def count_rows(session_maker) -> int:
+    async with session_maker() as session:
+        return await session.scalar(select(func.count()).select_from(AuditLogTable))
+
+
+class TestAuditLog:
+    async def test_record_is_buffered(self, session_maker, audit_log):
+        audit_log.record("user.logged_in", user_id=uuid4())
+        assert await count_rows(session_maker) == 0
+        assert await audit_log.flush() == 1
+        assert await count_rows(session_maker) == 1
+
+    async def test_flush_on_batch_size(self, session_maker, audit_log):
+        for _ in range(3):
+            audit_log.record("user.logged_in", user_id=uuid4())
+        await audit_log._flush_task
+        assert await count_rows(session_maker) == 3
+        assert audit_log.metrics.flushes == 1
+
+    async def test_flush_on_stop(self, session_maker, audit_log):
+        audit_log.start()
+        audit_log.record("user.logged_in", user_id=uuid4())
+        await audit_log.stop()
+        assert await count_rows(session_maker) == 1
+
+    async def test_failed_flush_keeps_records(self, session_maker, audit_log):
+        audit_log.record("user.logged_in", user_id=uuid4())
+        audit_log.session_maker = None
+        with pytest.raises(TypeError):
+            await audit_log.flush()
+        audit_log.session_maker = session_maker
+        assert await audit_log.flush() == 1
+
+    async def test_failed_flush_recreates_partition(self, audit_log, monkeypatch):
+        requested = []
+
+        async def ensure_partitions(session, rows):
+            months = {(row["ts"].year, row["ts"].month) for row in rows}
+            requested.append(months - audit_log._partitions)
+            return requested[-1]
+
+        monkeypatch.setattr(audit_log, "_ensure_partitions", ensure_partitions)
+        now = datetime.now(UTC)
+        record_id, last_month = uuid4(), now - timedelta(days=40)
+        audit_log.record("user.logged_in", id=record_id, ts=last_month)
+        await audit_log.flush()
+        # The duplicate fails the insert after the partition of this month was created.
+        audit_log.record("user.logged_in", id=record_id, ts=last_month)
+        audit_log.record("user.logged_in", ts=now)
+        with pytest.raises(IntegrityError):
+            await audit_log.flush()
+        audit_log._buffer.clear()
+
+        audit_log.record("user.logged_in", ts=now)
+        assert await audit_log.flush() == 1
+        month = (now.year, now.month)
+        assert requested[1:] == [{month}, {month}]
+        assert month in audit_log._partitions
+
+    async def test_full_buffer_drops_oldest(self, audit_log):
+        audit_log.batch_size = 100
+        for i in range(7):
+            audit_log.record("user.logged_in", email=f"user{i}@example.com")
+        assert [row["email"] for row in audit_log._buffer][0] == "user2@example.com"
+        assert audit_log.metrics.dropped == 2
+
+    async def test_long_values_are_truncated(self, audit_log):
+        user_id = uuid4()
+        audit_log.record(
+            "user.login_failed",
+            user_id=user_id,
+            email="a" * 200 + "@example.com",
+            user_agent="b" * 300,
+        )
+        await audit_log.flush()
+        (record,) = await audit_log.get_recent(user_id)
+        assert record.email == "a" * 100
+        assert record.user_agent == "b" * 255
+
+    async def test_get_recent(self, audit_log):
+        user_id = uuid4()
+        now = datetime.now(UTC)
+        for minutes in range(4):
+            audit_log.record(
+                "user.logged_in", user_id=user_id, ts=now - timedelta(minutes=minutes)
+            )
+        audit_log.record("user.logged_in", user_id=uuid4(), ts=now)
+        await asyncio.sleep(0)
+        await audit_log.flush()
+
+        page = await audit_log.get_recent(user_id, limit=3)
+        assert [row.ts.replace(tzinfo=UTC) for row in page] == [
+            now - timedelta(minutes=minutes) for minutes in range(3)
+        ]
+        page = await audit_log.get_recent(user_id, limit=3, before=page[-1].ts)
+        assert len(page) == 1
+
+    async def test_records_bus_events(self, audit_log):
+        event_bus = EventBus()
+        audit_log.subscribe(event_bus)
+        user_id = uuid4()
+        event = Event(
+            USER_LOGIN_FAILED,
+            {"user_id": str(user_id), "email": "user@example.com", "ip": "127.0.0.1"},
+        )
+        assert await event_bus.dispatch(event) is True
+        await audit_log.flush()
+        (row,) = await audit_log.get_recent(user_id)
+        assert row.id == event.id
+        assert row.event_type == USER_LOGIN_FAILED
+        assert row.ip == "127.0.0.1"
@@ -0,0 +1,188 @@
+from urllib.parse import urlparse, parse_qs
+import pytest
+import pytest_asyncio
+import httpx
+from fastapi import status
+from httpx import AsyncClient, ASGITransport
+from user_service.main import app
+from user_service.src.core.exceptions import ErrorCode
+from user_service.src.core.jwt_token import JWTTokenService
+from user_service.src.db import SQLAlchemyUserDatabase, UserManager
+from user_service.src.db.base import get_user_manager
+from user_service.src.models import UserTable, OAuthAccountTable
+
+
+@pytest_asyncio.fixture(scope="function")
+async def user_manager(session_maker):
+    async with session_maker() as session:
+        yield UserManager(SQLAlchemyUserDatabase(session, UserTable, OAuthAccountTable))
+
+
+@pytest.fixture
+async def client(user_manager, oauth_provider):
+    app.dependency_overrides[get_user_manager] = lambda: user_manager
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://localhost:80/"
+    ) as client:
+        yield client
+    app.dependency_overrides.pop(get_user_manager)
+
+
+async def authorize_state(client, path: str = "/oauth/fake/authorize", **kwargs):
+    response = await client.get(path, **kwargs)
+    assert response.status_code == status.HTTP_200_OK
+    authorization_url = urlparse(response.json()["authorization_url"])
+    query = parse_qs(authorization_url.query)
+    assert authorization_url.netloc == "provider.local"
+    assert query["client_id"] == ["client"]
+    assert query["scope"] == ["email"]
+    return query["state"][0]
+
+
+def unreachable(request: httpx.Request) -> httpx.Response:
+    raise httpx.ConnectError("Connection refused", request=request)
+
+
+@pytest.mark.router
+class TestOAuth:
+    async def test_unknown_provider(self, client):
+        response = await client.get("/oauth/unknown/authorize")
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    async def test_callback_creates_user(self, client, user_manager):
+        state = await authorize_state(client)
+        response = await client.get(
+            "/oauth/fake/callback", params={"code": "code-alice", "state": state}
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["token_type"] == "bearer"
+
+        user = await user_manager.user_db.get_by_oauth_account("fake", "alice")
+        assert user.email == "alice@example.com"
+        assert user.oauth_accounts[0].refresh_token == "refresh-alice"
+        assert user.oauth_accounts[0].expires_at is not None
+
+    async def test_callback_existing_account_refreshes_token(
+        self, client, user_manager
+    ):
+        for _ in range(2):
+            state = await authorize_state(client)
+            response = await client.get(
+                "/oauth/fake/callback", params={"code": "code-alice", "state": state}
+            )
+            assert response.status_code == status.HTTP_200_OK
+
+        user = await user_manager.user_db.get_by_oauth_account("fake", "alice")
+        assert len(user.oauth_accounts) == 1
+        assert user.oauth_accounts[0].access_token == "access-alice-2"
+
+    async def test_callback_invalid_state(self, client):
+        response = await client.get(
+            "/oauth/fake/callback", params={"code": "code-alice", "state": "invalid"}
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.json() == {"detail": ErrorCode.OAUTH_INVALID_STATE}
+
+    async def test_callback_provider_error(self, client):
+        state = await authorize_state(client)
+        response = await client.get(
+            "/oauth/fake/callback", params={"code": "unknown", "state": state}
+        )
+        assert response.status_code == status.HTTP_502_BAD_GATEWAY
+
+    @pytest.mark.parametrize(
+        "respond",
+        [
+            pytest.param(unreachable, id="unreachable"),
+            pytest.param(
+                lambda request: httpx.Response(200, text="<html>Maintenance</html>"),
+                id="not-json",
+            ),
+        ],
+    )
+    async def test_callback_provider_failure(
+        self, client, oauth_provider, monkeypatch, respond
+    ):
+        monkeypatch.setattr(oauth_provider, "transport", httpx.MockTransport(respond))
+        state = await authorize_state(client)
+        response = await client.get(
+            "/oauth/fake/callback", params={"code": "code-alice", "state": state}
+        )
+        assert response.status_code == status.HTTP_502_BAD_GATEWAY
+        assert response.json() == {"detail": ErrorCode.OAUTH_PROVIDER_ERROR}
+
+    async def test_callback_no_email(self, client):
+        state = await authorize_state(client)
+        response = await client.get(
+            "/oauth/fake/callback", params={"code": "code-no-email", "state": state}
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.json() == {"detail": ErrorCode.OAUTH_NOT_AVAILABLE_EMAIL}
+
+    async def test_callback_existing_email(self, client, user_manager):
+        await user_manager.user_db.create_user(
+            {"email": "bob@example.com", "hashed_password": "$2b$password"}
+        )
+        state = await authorize_state(client)
+        response = await client.get(
+            "/oauth/fake/callback", params={"code": "code-bob", "state": state}
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.json() == {"detail": ErrorCode.OAUTH_USER_ALREADY_EXISTS}
+
+    async def test_associate(self, client, user_manager):
+        user = await user_manager.user_db.create_user(
+            {"email": "bob@example.com", "hashed_password": "$2b$password"}
+        )
+        token = await JWTTokenService().write_token(user)
+        headers = {"Authorization": f"Bearer {token}"}
+
+        state = await authorize_state(
+            client, "/oauth/fake/associate/authorize", headers=headers
+        )
+        response = await client.get(
+            "/oauth/fake/associate/callback",
+            params={"code": "code-bob", "state": state},
+            headers=headers,
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["id"] == str(user.id)
+
+        linked_user = await user_manager.user_db.get_by_oauth_account("fake", "bob")
+        assert linked_user.id == user.id
+
+    async def test_associate_linked_to_other_user(self, client, user_manager):
+        state = await authorize_state(client)
+        await client.get(
+            "/oauth/fake/callback", params={"code": "code-alice", "state": state}
+        )
+        user = await user_manager.user_db.create_user(
+            {"email": "bob@example.com", "hashed_password": "$2b$password"}
+        )
+        token = await JWTTokenService().write_token(user)
+        headers = {"Authorization": f"Bearer {token}"}
+
+        state = await authorize_state(
+            client, "/oauth/fake/associate/authorize", headers=headers
+        )
+        response = await client.get(
+            "/oauth/fake/associate/callback",
+            params={"code": "code-alice", "state": state},
+            headers=headers,
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.json() == {"detail": ErrorCode.OAUTH_ACCOUNT_ALREADY_LINKED}
+
+    async def test_associate_state_of_other_user(self, client, user_manager):
+        state = await authorize_state(client)
+        user = await user_manager.user_db.create_user(
+            {"email": "bob@example.com", "hashed_password": "$2b$password"}
+        )
+        token = await JWTTokenService().write_token(user)
+        response = await client.get(
+            "/oauth/fake/associate/callback",
+            params={"code": "code-bob", "state": state},
+            headers={"Authorization": f"Bearer {token}"},
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.json() == {"detail": ErrorCode.OAUTH_INVALID_STATE}
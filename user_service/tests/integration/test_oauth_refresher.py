@@ -0,0 +1,176 @@
+import asyncio
+import time
+import pytest
+from sqlalchemy import select, update
+from user_service.src.models import UserTable, OAuthAccountTable
+from user_service.src.workers.oauth_refresher import OAuthTokenRefresher
+
+
+@pytest.fixture
+async def user(session_maker) -> UserTable:
+    async with session_maker() as session:
+        user = UserTable(email="oauth@example.com", hashed_password="$2b$password")
+        session.add(user)
+        await session.commit()
+        return user
+
+
+@pytest.fixture
+def create_account(session_maker, user):
+    async def _create_account(account_id: str, expires_in: int, **kwargs):
+        async with session_maker() as session:
+            account = OAuthAccountTable(
+                **{
+                    "user_id": user.id,
+                    "oauth_name": "fake",
+                    "access_token": f"old-{account_id}",
+                    "expires_at": int(time.time()) + expires_in,
+                    "refresh_token": f"refresh-{account_id}",
+                    "account_id": account_id,
+                    "account_email": "oauth@example.com",
+                    **kwargs,
+                }
+            )
+            session.add(account)
+            await session.commit()
+            return account
+
+    return _create_account
+
+
+@pytest.fixture
+def refresher(session_maker, oauth_provider) -> OAuthTokenRefresher:
+    return OAuthTokenRefresher(
+        session_maker,
+        {"fake": oauth_provider},
+        refresh_margin=300,
+        batch_size=2,
+        concurrency=2,
+        max_retries=2,
+        backoff=0,
+    )
+
+
+async def access_tokens(session_maker) -> dict[str, str]:
+    async with session_maker() as session:
+        result = await session.execute(
+            select(OAuthAccountTable.account_id, OAuthAccountTable.access_token)
+        )
+        return dict(result.all())
+
+
+class TestOAuthTokenRefresher:
+    async def test_refresh_due_accounts(
+        self, refresher, create_account, session_maker, fake_oauth_server
+    ):
+        for account_id in ("a", "b", "c", "d", "e"):
+            await create_account(account_id, expires_in=60)
+        await create_account("later", expires_in=3600)
+        await create_account("no-refresh", expires_in=60, refresh_token=None)
+
+        assert await refresher.run_once() == 5
+        assert len(fake_oauth_server.token_requests) == 5
+
+        tokens = await access_tokens(session_maker)
+        assert tokens["later"] == "old-later"
+        assert tokens["no-refresh"] == "old-no-refresh"
+        for account_id in ("a", "b", "c", "d", "e"):
+            assert tokens[account_id].startswith(f"access-{account_id}-")
+
+        async with session_maker() as session:
+            expires_at = await session.scalar(
+                select(OAuthAccountTable.expires_at).where(
+                    OAuthAccountTable.account_id == "a"
+                )
+            )
+        assert expires_at > time.time() + 300
+
+    async def test_nothing_due(self, refresher, create_account, fake_oauth_server):
+        await create_account("later", expires_in=3600)
+        assert await refresher.run_once() == 0
+        assert fake_oauth_server.token_requests == []
+
+    async def test_retry(
+        self, refresher, create_account, session_maker, fake_oauth_server
+    ):
+        await create_account("a", expires_in=60)
+        fake_oauth_server.failures = 2
+
+        assert await refresher.run_once() == 1
+        assert len(fake_oauth_server.token_requests) == 3
+        assert (await access_tokens(session_maker))["a"].startswith("access-a-")
+
+    async def test_give_up(
+        self, oauth_provider, create_account, session_maker, fake_oauth_server
+    ):
+        refresher = OAuthTokenRefresher(
+            session_maker,
+            {"fake": oauth_provider},
+            concurrency=1,
+            max_retries=2,
+            backoff=0,
+        )
+        await create_account("a", expires_in=60)
+        await create_account("b", expires_in=120)
+        fake_oauth_server.failures = 3
+
+        assert await refresher.run_once() == 1
+        tokens = await access_tokens(session_maker)
+        assert tokens["a"] == "old-a"
+        assert tokens["b"].startswith("access-b-")
+
+    async def test_invalid_grant_not_retried(
+        self, refresher, create_account, session_maker, fake_oauth_server
+    ):
+        await create_account("a", expires_in=60, refresh_token="revoked-a")
+
+        assert await refresher.run_once() == 0
+        assert len(fake_oauth_server.token_requests) == 1
+        async with session_maker() as session:
+            refresh_token = await session.scalar(
+                select(OAuthAccountTable.refresh_token).where(
+                    OAuthAccountTable.account_id == "a"
+                )
+            )
+        assert refresh_token is None
+
+        assert await refresher.run_once() == 0
+        assert len(fake_oauth_server.token_requests) == 1
+
+    async def test_stale_refresh_dropped(
+        self, refresher, create_account, session_maker, oauth_provider
+    ):
+        account = await create_account("a", expires_in=60)
+        refresh_token = oauth_provider.refresh_token
+
+        async def relogin_then_refresh(token):
+            async with session_maker() as session:
+                await session.execute(
+                    update(OAuthAccountTable)
+                    .where(OAuthAccountTable.id == account.id)
+                    .values(access_token="relogin", refresh_token="refresh-relogin")
+                )
+                await session.commit()
+            return await refresh_token(token)
+
+        oauth_provider.refresh_token = relogin_then_refresh
+        assert await refresher.run_once() == 1
+        assert (await access_tokens(session_maker))["a"] == "relogin"
+
+    async def test_unknown_provider_skipped(
+        self, session_maker, create_account, fake_oauth_server
+    ):
+        await create_account("a", expires_in=60)
+        refresher = OAuthTokenRefresher(session_maker, {}, backoff=0)
+        assert await refresher.run_once() == 0
+
+    async def test_start_stop(self, refresher, create_account, session_maker):
+        await create_account("a", expires_in=60)
+        refresher.interval = 3600
+        refresher.start()
+        for _ in range(100):
+            if (await access_tokens(session_maker))["a"] != "old-a":
+                break
+            await asyncio.sleep(0.01)
+        await refresher.stop()
+        assert (await access_tokens(session_maker))["a"].startswith("access-a-")
@@ -0,0 +1,204 @@
+from datetime import datetime, timedelta, UTC
+import pytest
+from sqlalchemy import select, update
+from user_service.src.core.events import (
+    Event,
+    EventBus,
+    USER_REGISTERED,
+    USER_UPDATED,
+    USER_DELETED,
+)
+from user_service.src.db import SQLAlchemyUserDatabase, UserManager
+from user_service.src.models import UserTable, OAuthAccountTable, OutboxTable
+from user_service.src.schemes import UserCreate
+from user_service.src.workers.outbox import OutboxDispatcher
+
+
+@pytest.fixture
+def event_bus() -> EventBus:
+    return EventBus()
+
+
+@pytest.fixture
+def received(event_bus) -> list[Event]:
+    received = []
+
+    async def handler(event: Event):
+        received.append(event)
+
+    event_bus.subscribe("*", handler)
+    return received
+
+
+@pytest.fixture
+def dispatcher(session_maker, event_bus) -> OutboxDispatcher:
+    return OutboxDispatcher(session_maker, event_bus, batch_size=2)
+
+
+async def create_user(session_maker, event_bus, email: str) -> UserTable:
+    async with session_maker() as session:
+        user_manager = UserManager(
+            SQLAlchemyUserDatabase(session, UserTable, outbox_table=OutboxTable),
+            event_bus=event_bus,
+        )
+        return await user_manager.create_user(
+            UserCreate(email=email, password="Password1!")
+        )
+
+
+async def get_outbox(session_maker) -> list[OutboxTable]:
+    async with session_maker() as session:
+        return list(await session.scalars(select(OutboxTable).order_by(OutboxTable.id)))
+
+
+class TestOutbox:
+    async def test_create_user_writes_outbox(self, session_maker, event_bus):
+        user = await create_user(session_maker, event_bus, "outbox@example.com")
+        (row,) = await get_outbox(session_maker)
+        assert row.event_type == USER_REGISTERED
+        assert row.payload == {"user_id": str(user.id), "email": user.email}
+        assert row.dispatched_at is None
+        # Written to the outbox, so not published a second time through the queue.
+        assert event_bus.queue_depth == 0
+
+    async def test_dispatch(self, session_maker, event_bus, dispatcher, received):
+        for i in range(3):
+            await create_user(session_maker, event_bus, f"outbox{i}@example.com")
+        assert await dispatcher.run_once() == 3
+        assert [event.payload["email"] for event in received] == [
+            "outbox0@example.com",
+            "outbox1@example.com",
+            "outbox2@example.com",
+        ]
+        assert all(row.dispatched_at for row in await get_outbox(session_maker))
+        assert await dispatcher.run_once() == 0
+
+    async def test_failed_event_stays_pending(
+        self, session_maker, event_bus, dispatcher, received
+    ):
+        async def failing_handler(event: Event):
+            if event.payload["email"] == "outbox0@example.com":
+                raise RuntimeError()
+
+        event_bus.subscribe(USER_REGISTERED, failing_handler)
+        for i in range(3):
+            await create_user(session_maker, event_bus, f"outbox{i}@example.com")
+        assert await dispatcher.run_once() == 2
+        rows = await get_outbox(session_maker)
+        assert [row.dispatched_at is None for row in rows] == [True, False, False]
+
+        event_bus._handlers[USER_REGISTERED].remove(failing_handler)
+        assert await dispatcher.run_once() == 1
+        assert received[-1].id == rows[0].event_id
+
+    async def test_poison_event_is_given_up(self, session_maker, event_bus, received):
+        async def failing_handler(event: Event):
+            raise RuntimeError()
+
+        event_bus.subscribe(USER_REGISTERED, failing_handler)
+        dispatcher = OutboxDispatcher(session_maker, event_bus, max_attempts=2)
+        await create_user(session_maker, event_bus, "outbox@example.com")
+
+        for _ in range(3):
+            assert await dispatcher.run_once() == 0
+        (row,) = await get_outbox(session_maker)
+        assert row.attempts == 2
+        assert row.failed_at is not None
+        assert row.dispatched_at is None
+        # Skipped once given up, so the third run did not deliver it again.
+        assert len(received) == 2
+
+    async def test_dispatched_events_are_pruned(
+        self, session_maker, event_bus, dispatcher
+    ):
+        for i in range(3):
+            await create_user(session_maker, event_bus, f"outbox{i}@example.com")
+        assert await dispatcher.run_once() == 3
+        rows = await get_outbox(session_maker)
+        async with session_maker() as session:
+            await session.execute(
+                update(OutboxTable)
+                .where(OutboxTable.id.in_([rows[0].id, rows[1].id]))
+                .values(dispatched_at=datetime.now(UTC) - timedelta(days=8))
+            )
+            await session.commit()
+        await create_user(session_maker, event_bus, "pending@example.com")
+
+        assert await dispatcher.prune() == 2
+        assert [row.id for row in await get_outbox(session_maker)] == [
+            rows[2].id,
+            rows[2].id + 1,
+        ]
+
+    async def test_update_and_delete_write_outbox(self, session_maker, event_bus):
+        user = await create_user(session_maker, event_bus, "outbox@example.com")
+        async with session_maker() as session:
+            user_db = SQLAlchemyUserDatabase(
+                session, UserTable, outbox_table=OutboxTable
+            )
+            user = await user_db.get_user_by_id(user.id)
+            await user_db.update_user(user, {"is_verified": True})
+            await user_db.delete_user(user)
+        rows = await get_outbox(session_maker)
+        assert [row.event_type for row in rows] == [
+            USER_REGISTERED,
+            USER_UPDATED,
+            USER_DELETED,
+        ]
+        assert rows[1].payload["fields"] == ["is_verified"]
+
+    async def test_oauth_association_writes_outbox(self, session_maker, event_bus):
+        user = await create_user(session_maker, event_bus, "outbox@example.com")
+        async with session_maker() as session:
+            user_manager = UserManager(
+                SQLAlchemyUserDatabase(
+                    session, UserTable, OAuthAccountTable, outbox_table=OutboxTable
+                ),
+                event_bus=event_bus,
+            )
+            await user_manager.oauth_associate_callback(
+                user, "github", "access", "12345", "outbox@example.com"
+            )
+            # Logging in with the linked account only refreshes its tokens.
+            await user_manager.oauth_callback(
+                "github", "refreshed", "12345", "outbox@example.com"
+            )
+        rows = await get_outbox(session_maker)
+        assert [row.event_type for row in rows] == [USER_REGISTERED, USER_UPDATED]
+        assert rows[1].payload["fields"] == ["oauth_name"]
+        assert event_bus.queue_depth == 0
+
+    async def test_oauth_login_by_email_writes_outbox(self, session_maker, event_bus):
+        await create_user(session_maker, event_bus, "outbox@example.com")
+        async with session_maker() as session:
+            user_manager = UserManager(
+                SQLAlchemyUserDatabase(
+                    session, UserTable, OAuthAccountTable, outbox_table=OutboxTable
+                ),
+                event_bus=event_bus,
+            )
+            for access_token in ("access", "refreshed"):
+                await user_manager.oauth_callback(
+                    "github",
+                    access_token,
+                    "12345",
+                    "outbox@example.com",
+                    associate_by_email=True,
+                )
+        rows = await get_outbox(session_maker)
+        assert [row.event_type for row in rows] == [USER_REGISTERED, USER_UPDATED]
+        assert rows[1].payload["fields"] == ["oauth_name"]
+        assert event_bus.queue_depth == 0
+
+    async def test_internal_update_writes_no_outbox(self, session_maker, event_bus):
+        user = await create_user(session_maker, event_bus, "outbox@example.com")
+        async with session_maker() as session:
+            user_db = SQLAlchemyUserDatabase(
+                session, UserTable, outbox_table=OutboxTable
+            )
+            user = await user_db.get_user_by_id(user.id)
+            await user_db.update_user(
+                user, {"hashed_password": "$2b$rehashed"}, emit_event=False
+            )
+        rows = await get_outbox(session_maker)
+        assert [row.event_type for row in rows] == [USER_REGISTERED]
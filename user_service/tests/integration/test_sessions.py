@@ -0,0 +1,189 @@
+from datetime import UTC
+import pytest
+import pytest_asyncio
+from fastapi import status
+from httpx import AsyncClient, ASGITransport
+from user_service.main import app
+from user_service.src.core.cache import (
+    TokenIntrospectionCache,
+    get_introspection_cache,
+)
+from user_service.src.core.config import settings
+from user_service.src.core.security import hash_password
+from user_service.src.db import SQLAlchemyUserDatabase, UserManager
+from user_service.src.db.base import get_user_manager, get_session_registry
+from user_service.src.db.sessions import SessionRegistry
+from user_service.src.models import UserTable, SessionTable
+
+
+@pytest.fixture
+async def user(session_maker) -> UserTable:
+    async with session_maker() as session:
+        user = UserTable(
+            email="sessions@example.com", hashed_password=hash_password("secret123")
+        )
+        session.add(user)
+        await session.commit()
+        return user
+
+
+@pytest.fixture
+def session_registry(session_maker) -> SessionRegistry:
+    return SessionRegistry(session_maker, max_sessions=2, interval=60, cache_ttl=60)
+
+
+async def get_session(session_maker, jti: str):
+    async with session_maker() as session:
+        return await session.get(SessionTable, jti)
+
+
+class TestSessionRegistry:
+    async def test_create(self, session_maker, session_registry, user):
+        created = await session_registry.create(user)
+        stored = await get_session(session_maker, created.jti)
+        assert stored.user_id == user.id
+        assert await session_registry.is_active(created.jti) is True
+
+    async def test_cap_evicts_oldest(self, session_maker, session_registry, user):
+        first = await session_registry.create(user)
+        second = await session_registry.create(user)
+        third = await session_registry.create(user)
+        sessions = await session_registry.list_sessions(user.id)
+        assert [s.jti for s in sessions] == [third.jti, second.jti]
+        assert await session_registry.is_active(first.jti) is False
+
+    async def test_is_active_is_cached(self, session_maker, session_registry, user):
+        created = await session_registry.create(user)
+        async with session_maker() as session:
+            await session.delete(await session.get(SessionTable, created.jti))
+            await session.commit()
+        assert await session_registry.is_active(created.jti) is True
+        session_registry.cache_ttl = 0
+        assert await session_registry.is_active(created.jti) is False
+
+    async def test_expired_session(self, session_registry, user):
+        created = await session_registry.create(user, expires_in_minutes=-1)
+        session_registry._cache.clear()
+        assert await session_registry.is_active(created.jti) is False
+
+    async def test_revoke(self, session_registry, user):
+        created = await session_registry.create(user)
+        assert await session_registry.revoke(user.id, created.jti) is True
+        assert await session_registry.is_active(created.jti) is False
+        assert await session_registry.revoke(user.id, created.jti) is False
+
+    async def test_revoke_all(self, session_registry, user):
+        first = await session_registry.create(user)
+        second = await session_registry.create(user)
+        assert await session_registry.revoke_all(user.id, keep=second.jti) == 1
+        assert await session_registry.is_active(first.jti) is False
+        assert await session_registry.is_active(second.jti) is True
+        assert await session_registry.revoke_all(user.id) == 1
+
+    async def test_touch_is_coalesced(self, session_maker, session_registry, user):
+        created = await session_registry.create(user)
+        for _ in range(3):
+            session_registry.touch(created.jti)
+        touched_at = session_registry._last_seen[created.jti]
+        assert (await session_registry.list_sessions(user.id))[0].last_seen_at == (
+            touched_at
+        )
+        assert await session_registry.flush() == 1
+        stored = await get_session(session_maker, created.jti)
+        assert stored.last_seen_at.replace(tzinfo=UTC) == touched_at
+        assert await session_registry.flush() == 0
+
+    async def test_flush_purges_expired(self, session_maker, session_registry, user):
+        expired = await session_registry.create(user, expires_in_minutes=-1)
+        active = await session_registry.create(user)
+        await session_registry.flush()
+        assert await get_session(session_maker, expired.jti) is None
+        assert await get_session(session_maker, active.jti) is not None
+
+
+@pytest_asyncio.fixture(scope="function")
+async def client(session_maker, session_registry):
+    async def _get_user_manager():
+        async with session_maker() as session:
+            yield UserManager(SQLAlchemyUserDatabase(session, UserTable))
+
+    app.dependency_overrides[get_user_manager] = _get_user_manager
+    app.dependency_overrides[get_session_registry] = lambda: session_registry
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://localhost:80/"
+    ) as client:
+        yield client
+    app.dependency_overrides.pop(get_user_manager)
+    app.dependency_overrides.pop(get_session_registry)
+
+
+async def login(client: AsyncClient) -> dict[str, str]:
+    response = await client.post(
+        "/login",
+        data={"username": "sessions@example.com", "password": "secret123"},
+        headers={"User-Agent": "pytest"},
+    )
+    assert response.status_code == status.HTTP_200_OK
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+@pytest.mark.router
+class TestSessionsRouter:
+    async def test_list_sessions(self, client, user):
+        headers = await login(client)
+        await login(client)
+        response = await client.get("/sessions", headers=headers)
+        assert response.status_code == status.HTTP_200_OK
+        sessions = response.json()
+        assert len(sessions) == 2
+        assert [s["current"] for s in sessions] == [False, True]
+        assert sessions[0]["user_agent"] == "pytest"
+
+    async def test_revoked_token_is_rejected(self, client, user):
+        headers = await login(client)
+        other_headers = await login(client)
+        (current, other) = [
+            s["jti"]
+            for s in sorted(
+                (await client.get("/sessions", headers=headers)).json(),
+                key=lambda s: not s["current"],
+            )
+        ]
+        response = await client.delete(f"/sessions/{other}", headers=headers)
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+        response = await client.get("/sessions", headers=other_headers)
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+        response = await client.delete(f"/sessions/{other}", headers=headers)
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    async def test_revoked_token_is_inactive_in_introspection(
+        self, client, session_registry, user
+    ):
+        token_cache = TokenIntrospectionCache()
+        session_registry.token_cache = token_cache
+        app.dependency_overrides[get_introspection_cache] = lambda: token_cache
+        try:
+            headers = await login(client)
+            token = headers["Authorization"].removeprefix("Bearer ")
+            response = await client.post("/introspect", data={"token": token})
+            assert response.json()["active"] is True
+            assert token_cache.get(token, settings.DEFAULT_TENANT_ID) is not None
+
+            (jti,) = [
+                s["jti"]
+                for s in (await client.get("/sessions", headers=headers)).json()
+            ]
+            response = await client.delete(f"/sessions/{jti}", headers=headers)
+            assert response.status_code == status.HTTP_204_NO_CONTENT
+            assert token_cache.get(token, settings.DEFAULT_TENANT_ID) is None
+            response = await client.post("/introspect", data={"token": token})
+            assert response.json() == {"active": False}
+        finally:
+            app.dependency_overrides.pop(get_introspection_cache)
+
+    async def test_sessions_disabled(self, client, user):
+        headers = await login(client)
+        app.dependency_overrides[get_session_registry] = lambda: None
+        response = await client.get("/sessions", headers=headers)
+        assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -0,0 +1,228 @@
+import pytest
+import pytest_asyncio
+from fastapi import status
+from httpx import AsyncClient, ASGITransport
+from sqlalchemy import select
+from user_service.main import app
+from user_service.src.core.exceptions import ErrorCode
+from user_service.src.core.security import hash_password, verify_password
+from user_service.src.db import SQLAlchemyUserDatabase, UserManager
+from user_service.src.db.base import get_user_manager, get_session_registry
+from user_service.src.db.sessions import SessionRegistry
+from user_service.src.models import UserTable
+
+
+@pytest.fixture
+async def users(session_maker) -> dict[str, UserTable]:
+    async with session_maker() as session:
+        users = {
+            name: UserTable(
+                email=f"{name}@example.com",
+                hashed_password=hash_password("secret123"),
+                is_superuser=name == "admin",
+            )
+            for name in ("admin", "alice", "bob")
+        }
+        session.add_all(users.values())
+        await session.commit()
+        return users
+
+
+@pytest_asyncio.fixture(scope="function")
+async def client(session_maker):
+    async def _get_user_manager():
+        async with session_maker() as session:
+            yield UserManager(SQLAlchemyUserDatabase(session, UserTable))
+
+    app.dependency_overrides[get_user_manager] = _get_user_manager
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://localhost:80/"
+    ) as client:
+        yield client
+    app.dependency_overrides.pop(get_user_manager)
+
+
+async def login(client: AsyncClient, name: str) -> dict[str, str]:
+    response = await client.post(
+        "/login", data={"username": f"{name}@example.com", "password": "secret123"}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+async def get_stored(session_maker, name: str) -> UserTable:
+    async with session_maker() as session:
+        return await session.scalar(
+            select(UserTable).where(UserTable.email == f"{name}@example.com")
+        )
+
+
+@pytest.mark.router
+class TestCurrentUser:
+    async def test_get_me(self, client, users):
+        response = await client.get("/users/me", headers=await login(client, "alice"))
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["id"] == str(users["alice"].id)
+
+    async def test_unauthorized(self, client, users):
+        response = await client.get("/users/me")
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    async def test_patch_me_ignores_flags(self, client, session_maker, users):
+        response = await client.patch(
+            "/users/me",
+            json={
+                "password": "newsecret123",
+                "current_password": "secret123",
+                "is_superuser": True,
+            },
+            headers=await login(client, "alice"),
+        )
+        assert response.status_code == status.HTTP_200_OK
+        stored = await get_stored(session_maker, "alice")
+        assert stored.is_superuser is False
+        assert verify_password("newsecret123", stored.hashed_password)
+        assert stored.version == 2
+
+    async def test_patch_me_without_changes_skips_write(
+        self, client, session_maker, users
+    ):
+        response = await client.patch(
+            "/users/me",
+            json={"email": "Alice@Example.com", "password": None},
+            headers=await login(client, "alice"),
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert (await get_stored(session_maker, "alice")).version == 1
+
+    async def test_patch_me_existing_email(self, client, users):
+        response = await client.patch(
+            "/users/me",
+            json={"email": "bob@example.com", "current_password": "secret123"},
+            headers=await login(client, "alice"),
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.json()["detail"] == ErrorCode.UPDATE_USER_EMAIL_ALREADY_EXISTS
+
+    async def test_patch_me_same_password(self, client, users):
+        response = await client.patch(
+            "/users/me",
+            json={"password": "secret123", "current_password": "secret123"},
+            headers=await login(client, "alice"),
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert (
+            response.json()["detail"]["error_code"]
+            == ErrorCode.UPDATE_USER_INVALID_PASSWORD
+        )
+
+    @pytest.mark.parametrize(
+        "update",
+        [
+            {"password": "newsecret123"},
+            {"email": "alice2@example.com"},
+            {"password": "newsecret123", "current_password": "wrong"},
+            {"email": "alice2@example.com", "current_password": "wrong"},
+        ],
+    )
+    async def test_patch_me_requires_current_password(
+        self, client, session_maker, users, update
+    ):
+        response = await client.patch(
+            "/users/me", json=update, headers=await login(client, "alice")
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.json()["detail"] == ErrorCode.UPDATE_USER_BAD_CURRENT_PASSWORD
+        assert (await get_stored(session_maker, "alice")).version == 1
+
+    async def test_patch_me_password_revokes_other_sessions(
+        self, client, session_maker, users
+    ):
+        session_registry = SessionRegistry(session_maker)
+        app.dependency_overrides[get_session_registry] = lambda: session_registry
+        try:
+            headers = await login(client, "alice")
+            other_headers = await login(client, "alice")
+            response = await client.patch(
+                "/users/me",
+                json={"password": "newsecret123", "current_password": "secret123"},
+                headers=headers,
+            )
+            assert response.status_code == status.HTTP_200_OK
+            response = await client.get("/users/me", headers=other_headers)
+            assert response.status_code == status.HTTP_401_UNAUTHORIZED
+            response = await client.get("/users/me", headers=headers)
+            assert response.status_code == status.HTTP_200_OK
+        finally:
+            app.dependency_overrides.pop(get_session_registry)
+
+    async def test_delete_me(self, client, session_maker, users):
+        headers = await login(client, "alice")
+        response = await client.delete("/users/me", headers=headers)
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+        assert (await get_stored(session_maker, "alice")).deleted_at is not None
+        response = await client.get("/users/me", headers=headers)
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+@pytest.mark.router
+class TestAdmin:
+    async def test_requires_superuser(self, client, users):
+        headers = await login(client, "alice")
+        response = await client.get(f"/users/{users['bob'].id}", headers=headers)
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+        response = await client.patch(
+            "/users",
+            json={"ids": [str(users["bob"].id)], "is_active": False},
+            headers=headers,
+        )
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    async def test_get_user(self, client, users):
+        headers = await login(client, "admin")
+        response = await client.get(f"/users/{users['bob'].id}", headers=headers)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["email"] == "bob@example.com"
+
+    async def test_get_unknown_user(self, client, users):
+        headers = await login(client, "admin")
+        response = await client.get(
+            "/users/00000000-0000-0000-0000-000000000000", headers=headers
+        )
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    async def test_patch_user_sets_flags(self, client, session_maker, users):
+        headers = await login(client, "admin")
+        response = await client.patch(
+            f"/users/{users['bob'].id}", json={"is_verified": True}, headers=headers
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["is_verified"] is True
+        stored = await get_stored(session_maker, "bob")
+        assert (stored.is_verified, stored.is_active) == (True, True)
+
+    async def test_delete_user(self, client, session_maker, users):
+        headers = await login(client, "admin")
+        response = await client.delete(f"/users/{users['bob'].id}", headers=headers)
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+        assert (await get_stored(session_maker, "bob")).deleted_at is not None
+        response = await client.get(f"/users/{users['bob'].id}", headers=headers)
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    async def test_bulk_deactivate(self, client, session_maker, users):
+        headers = await login(client, "admin")
+        ids = [str(users["alice"].id), str(users["bob"].id)]
+
+        response = await client.patch(
+            "/users", json={"ids": ids, "is_active": False}, headers=headers
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert sorted(response.json()["updated"]) == sorted(ids)
+        assert (await get_stored(session_maker, "alice")).is_active is False
+
+        # Users that already have the value are not written again.
+        response = await client.patch(
+            "/users", json={"ids": ids, "is_active": False}, headers=headers
+        )
+        assert response.json()["updated"] == []
+        assert (await get_stored(session_maker, "bob")).version == 2
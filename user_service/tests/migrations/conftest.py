@@ -0,0 +1,46 @@
+from pathlib import Path
+import pytest
+from alembic.operations import Operations
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from sqlalchemy import Connection, create_engine
+
+MIGRATIONS_PATH = Path(__file__).parents[2] / "src" / "migrations"
+
+
+@pytest.fixture
+def script() -> ScriptDirectory:
+    return ScriptDirectory(str(MIGRATIONS_PATH))
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'migrations.db'}")
+    yield engine
+    engine.dispose()
+
+
+def run_migrations(
+    connection: Connection, script: ScriptDirectory, destination: str
+) -> None:
+    """
+    Upgrades or downgrades to ``destination`` the way ``env.py`` does, one transaction per
+    revision, so the autocommit blocks of online migrations work.
+    """
+
+    def steps(revision, context):
+        if destination == "base":
+            return script._downgrade_revs(destination, revision)
+        return script._upgrade_revs(destination, revision)
+
+    context = MigrationContext.configure(
+        connection,
+        opts={"script": script, "fn": steps, "transaction_per_migration": True},
+    )
+    with Operations.context(context), context.begin_transaction():
+        context.run_migrations()
+
+
+def migrate(engine, script: ScriptDirectory, destination: str) -> None:
+    with engine.connect() as connection:
+        run_migrations(connection, script, destination)
@@ -0,0 +1,110 @@
+import asyncio
+import os
+import threading
+import time
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+from user_service.src.migrations.operations import lock_timeout
+from user_service.src.migrations.runner import upgrade_database
+from user_service.tests.migrations.conftest import run_migrations
+
+DATABASE_URL = os.environ.get("MIGRATIONS_DATABASE_URL")
+SEED_USERS = int(os.environ.get("MIGRATIONS_SEED_USERS", 200_000))
+MAX_WRITE_STALL_SECONDS = 1.0
+
+pytestmark = pytest.mark.skipif(
+    DATABASE_URL is None,
+    reason="set MIGRATIONS_DATABASE_URL to a disposable PostgreSQL database",
+)
+
+
+class WriteProbe:
+    """
+    Writes to one user row in a loop from a separate thread and records the slowest write.
+
+    A write slower than usual while a migration runs is the time it spent waiting for a lock
+    taken by the migration, which is what the application would see.
+    """
+
+    def __init__(self, url: str, user_id: str):
+        self.url = url
+        self.user_id = user_id
+        self.max_latency = 0.0
+        self.writes = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=lambda: asyncio.run(self._run()))
+
+    def __enter__(self) -> "WriteProbe":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    async def _run(self) -> None:
+        engine = create_async_engine(self.url)
+        statement = text("UPDATE users SET is_active = true WHERE id = :id")
+        try:
+            while not self._stop.is_set():
+                started = time.perf_counter()
+                async with engine.begin() as connection:
+                    await connection.execute(statement, {"id": self.user_id})
+                self.max_latency = max(self.max_latency, time.perf_counter() - started)
+                self.writes += 1
+                await asyncio.sleep(0.005)
+        finally:
+            await engine.dispose()
+
+
+@pytest.fixture
+async def pg_engine(script):
+    engine = create_async_engine(DATABASE_URL)
+    async with engine.connect() as connection:
+        await connection.run_sync(run_migrations, script, "base")
+    yield engine
+    async with engine.connect() as connection:
+        await connection.run_sync(run_migrations, script, "base")
+    await engine.dispose()
+
+
+def upgrade_to(connection, script, revision: str) -> None:
+    with lock_timeout(connection):
+        run_migrations(connection, script, revision)
+
+
+async def test_lock_timeout_reset_on_pooled_connection(pg_engine):
+    async with pg_engine.connect() as connection:
+        default = await connection.scalar(text("SHOW lock_timeout"))
+    await upgrade_database(pg_engine)
+    async with pg_engine.connect() as connection:
+        assert await connection.scalar(text("SHOW lock_timeout")) == default
+
+
+async def test_migrations_do_not_block_writes(pg_engine, script, request):
+    revisions = [r.revision for r in reversed(list(script.walk_revisions()))]
+    async with pg_engine.connect() as connection:
+        await connection.run_sync(upgrade_to, script, revisions[0])
+        user_id = await connection.scalar(
+            text(
+                "INSERT INTO users "
+                "(id, email, hashed_password, is_active, is_superuser, is_verified) "
+                "SELECT gen_random_uuid(), 'User' || g || '@example.com', 'x', "
+                "true, false, false FROM generate_series(1, :count) g "
+                "RETURNING id"
+            ),
+            {"count": SEED_USERS},
+        )
+        await connection.commit()
+
+    stalls = {}
+    for revision in revisions[1:]:
+        with WriteProbe(DATABASE_URL, str(user_id)) as probe:
+            async with pg_engine.connect() as connection:
+                await connection.run_sync(upgrade_to, script, revision)
+        stalls[revision] = probe.max_latency
+        request.node.user_properties.append((revision, round(probe.max_latency, 4)))
+        print(f"\n{revision}: longest write {probe.max_latency * 1000:.1f} ms")
+
+    assert max(stalls.values()) < MAX_WRITE_STALL_SECONDS
@@ -0,0 +1,73 @@
+from contextlib import contextmanager
+import pytest
+import sqlalchemy as sa
+from alembic.operations import Operations
+from alembic.runtime.migration import MigrationContext
+from user_service.src.migrations.operations import (
+    add_column_expand,
+    backfill,
+    create_index_concurrently,
+    set_not_null_contract,
+)
+
+
+@contextmanager
+def operations(engine):
+    with engine.begin() as connection:
+        with Operations.context(MigrationContext.configure(connection)):
+            yield connection
+
+
+@pytest.fixture
+def accounts(engine):
+    with engine.begin() as connection:
+        connection.execute(
+            sa.text(
+                "CREATE TABLE accounts (id INTEGER PRIMARY KEY, email VARCHAR(100))"
+            )
+        )
+        connection.execute(
+            sa.text("INSERT INTO accounts (id, email) VALUES (:id, :email)"),
+            [{"id": i, "email": f"User{i}@Example.com"} for i in range(25)],
+        )
+    return engine
+
+
+def test_backfill_updates_in_batches(accounts):
+    statements = []
+    sa.event.listen(
+        accounts,
+        "before_cursor_execute",
+        lambda *args: statements.append(args[2]),
+    )
+    with operations(accounts):
+        updated = backfill(
+            "accounts", "email = lower(email)", "email <> lower(email)", batch_size=10
+        )
+
+    assert updated == 25
+    assert len([s for s in statements if s.startswith("UPDATE")]) == 3
+    with accounts.connect() as connection:
+        assert (
+            connection.scalar(
+                sa.text("SELECT count(*) FROM accounts WHERE email <> lower(email)")
+            )
+            == 0
+        )
+
+
+def test_expand_and_contract(accounts):
+    with operations(accounts) as connection:
+        with pytest.raises(ValueError):
+            add_column_expand(
+                "accounts", sa.Column("tenant_id", sa.String(64), nullable=False)
+            )
+        add_column_expand("accounts", sa.Column("tenant_id", sa.String(64)))
+        backfill("accounts", "tenant_id = 'default'", "tenant_id IS NULL")
+        set_not_null_contract("accounts", "tenant_id")
+        create_index_concurrently("ix_accounts_tenant_id", "accounts", ["tenant_id"])
+
+        columns = {c["name"]: c for c in sa.inspect(connection).get_columns("accounts")}
+        indexes = sa.inspect(connection).get_indexes("accounts")
+    assert columns["tenant_id"]["nullable"] is False
+    assert [index["name"] for index in indexes] == ["ix_accounts_tenant_id"]
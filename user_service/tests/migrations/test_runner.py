@@ -0,0 +1,35 @@
+import pytest
+from alembic.autogenerate import compare_metadata
+from alembic.runtime.migration import MigrationContext
+from sqlalchemy.ext.asyncio import create_async_engine
+from user_service.src.migrations.runner import upgrade_database
+from user_service.src.models import Base
+
+
+@pytest.fixture
+async def async_engine(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'runner.db'}")
+    yield engine
+    await engine.dispose()
+
+
+def schema_diff(connection) -> list:
+    context = MigrationContext.configure(connection, opts={"compare_type": False})
+    return compare_metadata(context, Base.metadata)
+
+
+@pytest.mark.filterwarnings("ignore:Skipped unsupported reflection of expression")
+@pytest.mark.filterwarnings(
+    "ignore:autogenerate skipping metadata-specified expression"
+)
+async def test_upgrade_database(async_engine, script):
+    await upgrade_database(async_engine)
+    # Already at head: a second run, e.g. by another worker, does nothing.
+    await upgrade_database(async_engine)
+
+    async with async_engine.connect() as connection:
+        current = await connection.run_sync(
+            lambda c: MigrationContext.configure(c).get_current_revision()
+        )
+        assert current == script.get_current_head()
+        assert await connection.run_sync(schema_diff) == []
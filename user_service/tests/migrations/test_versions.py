@@ -0,0 +1,86 @@
+import pytest
+from alembic.autogenerate import compare_metadata
+from alembic.runtime.migration import MigrationContext
+from sqlalchemy import inspect, text
+from user_service.src.models import Base
+from user_service.tests.migrations.conftest import migrate
+
+ARCHIVED_ID = "8b0c3f52-6a1e-4d7b-9f24-3c5e7a9d1b60"
+
+
+class TestMigrations:
+    def test_single_head(self, script):
+        assert len(script.get_heads()) == 1
+
+    @pytest.mark.filterwarnings("ignore:Skipped unsupported reflection of expression")
+    def test_upgrade_matches_models(self, engine, script):
+        migrate(engine, script, "head")
+        with engine.connect() as connection:
+            # SQLite reflects the PostgreSQL UUID type as NUMERIC, so only compare the schema.
+            context = MigrationContext.configure(
+                connection, opts={"compare_type": False}
+            )
+            diff = compare_metadata(context, Base.metadata)
+        assert diff == []
+
+    def test_lower_email_index_rejects_duplicates(self, engine, script):
+        migrate(engine, script, "1f6c8e2d4b70")
+        with engine.begin() as connection:
+            connection.execute(
+                text(
+                    "INSERT INTO users "
+                    "(id, email, hashed_password, is_active, is_superuser, is_verified) "
+                    "VALUES (:id, :email, 'x', 1, 0, 0)"
+                ),
+                [
+                    {"id": "1", "email": "king.arthur@camelot.bt"},
+                    {"id": "2", "email": " King.Arthur@camelot.bt"},
+                    {"id": "3", "email": "lancelot@camelot.bt"},
+                ],
+            )
+
+        with pytest.raises(RuntimeError, match="king.arthur@camelot.bt") as excinfo:
+            migrate(engine, script, "head")
+        assert "lancelot" not in str(excinfo.value)
+        with engine.connect() as connection:
+            emails = connection.scalars(text("SELECT email FROM users ORDER BY id"))
+            assert list(emails) == [
+                "king.arthur@camelot.bt",
+                " King.Arthur@camelot.bt",
+                "lancelot@camelot.bt",
+            ]
+
+    def test_archive_oauth_accounts_backfill(self, engine, script):
+        migrate(engine, script, "6c4e2a8f0d17")
+        with engine.begin() as connection:
+            connection.execute(
+                text(
+                    "INSERT INTO users_archive (id, tenant_id, email, hashed_password, "
+                    "is_active, is_superuser, is_verified, version, archived_at, "
+                    "oauth_accounts) VALUES (:id, 'default', 'archived@example.com', "
+                    "'x', 0, 0, 0, 1, CURRENT_TIMESTAMP, :oauth_accounts)"
+                ),
+                {
+                    "id": ARCHIVED_ID,
+                    "oauth_accounts": '[{"oauth_name": "github", "account_id": "42"},'
+                    ' {"oauth_name": "google", "account_id": "7"}]',
+                },
+            )
+
+        migrate(engine, script, "head")
+        with engine.connect() as connection:
+            keys = connection.execute(
+                text(
+                    "SELECT user_id, oauth_name, account_id "
+                    "FROM users_archive_oauth_accounts ORDER BY oauth_name"
+                )
+            )
+            assert [tuple(row) for row in keys] == [
+                (ARCHIVED_ID, "github", "42"),
+                (ARCHIVED_ID, "google", "7"),
+            ]
+
+    def test_downgrade_to_base(self, engine, script):
+        migrate(engine, script, "head")
+        migrate(engine, script, "base")
+        assert set(inspect(engine).get_table_names()) <= {"alembic_version"}
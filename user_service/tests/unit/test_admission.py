@@ -0,0 +1,112 @@
+import asyncio
+import pytest
+from user_service.src.core.admission import (
+    AdmissionLimiter,
+    request_priority,
+    PRIORITY_ANONYMOUS,
+    PRIORITY_AUTHENTICATED,
+)
+from user_service.src.core.exceptions import ServiceOverloaded
+from user_service.src.core.security import (
+    password_hashing_limiter,
+    run_password_hashing,
+)
+
+
+async def hold(limiter: AdmissionLimiter, release: asyncio.Event, **kwargs) -> None:
+    async with limiter.limit(**kwargs):
+        await release.wait()
+
+
+class TestAdmissionLimiter:
+    async def test_admits_up_to_concurrency(self):
+        limiter = AdmissionLimiter("test", 2, max_queue=0, queue_timeout=1)
+        release = asyncio.Event()
+        holders = [asyncio.create_task(hold(limiter, release)) for _ in range(2)]
+        await asyncio.sleep(0)
+        assert limiter.in_flight == 2
+
+        with pytest.raises(ServiceOverloaded) as excinfo:
+            await limiter.acquire()
+        assert excinfo.value.retry_after == limiter.retry_after
+        assert limiter.metrics.shed == 1
+
+        release.set()
+        await asyncio.gather(*holders)
+        assert limiter.in_flight == 0
+        assert limiter.metrics.admitted == 2
+
+    async def test_queue_timeout(self):
+        limiter = AdmissionLimiter("test", 1, max_queue=1, queue_timeout=0.01)
+        release = asyncio.Event()
+        holder = asyncio.create_task(hold(limiter, release))
+        await asyncio.sleep(0)
+
+        with pytest.raises(ServiceOverloaded):
+            await limiter.acquire()
+        assert limiter.queue_depth == 0
+        assert (limiter.metrics.queued, limiter.metrics.timed_out) == (1, 1)
+
+        release.set()
+        await holder
+        assert limiter.in_flight == 0
+
+    async def test_priority_order(self):
+        limiter = AdmissionLimiter("test", 1, max_queue=10, queue_timeout=1)
+        release = asyncio.Event()
+        holder = asyncio.create_task(hold(limiter, release))
+        await asyncio.sleep(0)
+        order = []
+
+        async def wait(name: str, priority: int):
+            async with limiter.limit(priority):
+                order.append(name)
+
+        waiters = [
+            asyncio.create_task(wait("anonymous1", PRIORITY_ANONYMOUS)),
+            asyncio.create_task(wait("authenticated", PRIORITY_AUTHENTICATED)),
+            asyncio.create_task(wait("anonymous2", PRIORITY_ANONYMOUS)),
+        ]
+        await asyncio.sleep(0)
+        assert limiter.queue_depth == 3
+
+        release.set()
+        await asyncio.gather(holder, *waiters)
+        assert order == ["authenticated", "anonymous1", "anonymous2"]
+        assert limiter.in_flight == 0
+
+    async def test_cancelled_waiter_leaves_queue(self):
+        limiter = AdmissionLimiter("test", 1, max_queue=10, queue_timeout=1)
+        release = asyncio.Event()
+        holder = asyncio.create_task(hold(limiter, release))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        assert limiter.queue_depth == 1
+
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        assert limiter.queue_depth == 0
+
+        release.set()
+        await holder
+        assert limiter.in_flight == 0
+
+
+async def test_password_hashing_uses_request_priority(monkeypatch):
+    monkeypatch.setattr(password_hashing_limiter, "concurrency", 0)
+    monkeypatch.setattr(password_hashing_limiter, "queue_timeout", 0.01)
+    request_priority.set(PRIORITY_AUTHENTICATED)
+    queued = []
+    acquire = password_hashing_limiter.acquire
+
+    async def spy(priority=None):
+        queued.append(request_priority.get())
+        await acquire(priority)
+
+    monkeypatch.setattr(password_hashing_limiter, "acquire", spy)
+    with pytest.raises(ServiceOverloaded):
+        await run_password_hashing(str, "password")
+    assert queued == [PRIORITY_AUTHENTICATED]
+    assert password_hashing_limiter.queue_depth == 0
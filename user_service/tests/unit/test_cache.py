@@ -0,0 +1,58 @@
+import time
+import pytest
+from user_service.src.core.cache import TokenIntrospectionCache
+
+
+@pytest.fixture
+def token_cache() -> TokenIntrospectionCache:
+    return TokenIntrospectionCache(maxsize=2, ttl=60)
+
+
+class TestTokenIntrospectionCache:
+    async def test_get_missing(self, token_cache):
+        assert token_cache.get("token") is None
+
+    async def test_set_get(self, token_cache):
+        token_cache.set("token", {"active": True}, subject="sub")
+        assert token_cache.get("token") == {"active": True}
+
+    async def test_expired_token(self, token_cache):
+        token_cache.set("token", {"active": True}, expires_at=time.time() - 1)
+        assert token_cache.get("token") is None
+        assert len(token_cache) == 0
+
+    async def test_ttl(self):
+        token_cache = TokenIntrospectionCache(maxsize=2, ttl=0)
+        token_cache.set("token", {"active": True}, expires_at=time.time() + 60)
+        assert token_cache.get("token") is None
+
+    async def test_lru_eviction(self, token_cache):
+        token_cache.set("first", {"active": True})
+        token_cache.set("second", {"active": True})
+        token_cache.get("first")
+        token_cache.set("third", {"active": True})
+        assert len(token_cache) == 2
+        assert token_cache.get("second") is None
+        assert token_cache.get("first") is not None
+        assert token_cache.get("third") is not None
+
+    async def test_invalidate(self, token_cache):
+        token_cache.set("token", {"active": True}, subject="sub")
+        token_cache.invalidate("token")
+        assert token_cache.get("token") is None
+
+    async def test_invalidate_subject(self, token_cache):
+        token_cache.set("first", {"active": True}, subject="sub")
+        token_cache.set("second", {"active": True}, subject="other")
+        token_cache.invalidate_subject("sub")
+        assert token_cache.get("first") is None
+        assert token_cache.get("second") is not None
+
+    async def test_invalidate_session(self, token_cache):
+        token_cache.set("first", {"active": True}, subject="sub", jti="first-jti")
+        token_cache.set("second", {"active": True}, subject="sub", jti="second-jti")
+        token_cache.invalidate_session("first-jti")
+        assert token_cache.get("first") is None
+        assert token_cache.get("second") is not None
+        token_cache.invalidate_subject("sub")
+        assert len(token_cache) == 0
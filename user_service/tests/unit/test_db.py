@@ -1,9 +1,12 @@
+from uuid import uuid4
 import pytest
 import pytest_asyncio
+from sqlalchemy import insert, update
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy.exc import IntegrityError, InvalidRequestError
 from typing import AsyncGenerator
-from user_service.src.models import Base, UserTable, OAuthAccountTable
+from user_service.src.core.exceptions import UserAlreadyExists, UserUpdateConflict
+from user_service.src.models import Base, UserTable, OAuthAccountTable, UserSnapshot
 from user_service.src.db import SQLAlchemyUserDatabase
 
 
@@ -25,6 +28,24 @@ async def user_db() -> AsyncGenerator[SQLAlchemyUserDatabase, None]:
         await conn.run_sync(Base.metadata.drop_all)
 
 
+@pytest_asyncio.fixture(scope="function")
+async def oauth_user_db() -> AsyncGenerator[SQLAlchemyUserDatabase, None]:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async_session_maker = async_sessionmaker(
+        engine,
+        expire_on_commit=False,
+    )
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with async_session_maker() as session:
+        yield SQLAlchemyUserDatabase(session, UserTable, OAuthAccountTable)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+
+
 async def test_queries(user_db: SQLAlchemyUserDatabase):
     user_create_dict = {
         "email": "create@example.com",
@@ -76,5 +97,176 @@ async def test_create_existing_user(user_db: SQLAlchemyUserDatabase):
     }
     user = await user_db.create_user(user_create_dict)
 
-    with pytest.raises(IntegrityError):
+    with pytest.raises(UserAlreadyExists):
         await user_db.create_user(user_create_dict)
+
+
+async def test_queries_oauth(oauth_user_db: SQLAlchemyUserDatabase):
+    user = await oauth_user_db.create_user(
+        {
+            "email": "oauth@example.com",
+            "hashed_password": "$2b$password123456789",
+        }
+    )
+    oauth_account_dict = {
+        "oauth_name": "service1",
+        "access_token": "TOKEN",
+        "expires_at": 1579000751,
+        "account_id": "user_oauth1",
+        "account_email": "oauth@example.com",
+    }
+
+    # Link
+    linked_user = await oauth_user_db.upsert_oauth_account(user, oauth_account_dict)
+    assert linked_user.id == user.id
+    assert len(linked_user.oauth_accounts) == 1
+    assert linked_user.oauth_accounts[0].access_token == "TOKEN"
+
+    # Refresh tokens
+    refreshed_user = await oauth_user_db.upsert_oauth_account(
+        user, {**oauth_account_dict, "access_token": "NEW_TOKEN"}
+    )
+    assert len(refreshed_user.oauth_accounts) == 1
+    assert refreshed_user.oauth_accounts[0].access_token == "NEW_TOKEN"
+
+    # Get_By_Oauth_Account
+    oauth_user = await oauth_user_db.get_by_oauth_account("service1", "user_oauth1")
+    assert oauth_user.id == user.id
+    assert oauth_user.oauth_accounts[0].account_id == "user_oauth1"
+    assert await oauth_user_db.get_by_oauth_account("service1", "unknown") is None
+
+    # Linked to another user
+    other_user = await oauth_user_db.create_user(
+        {
+            "email": "other@example.com",
+            "hashed_password": "$2b$password123456789",
+        }
+    )
+    owner = await oauth_user_db.upsert_oauth_account(other_user, oauth_account_dict)
+    assert owner.id == user.id
+
+    # Delete cascades
+    await oauth_user_db.delete_user(owner)
+    assert await oauth_user_db.get_by_oauth_account("service1", "user_oauth1") is None
+
+
+async def test_oauth_accounts_not_lazy_loaded(oauth_user_db: SQLAlchemyUserDatabase):
+    user = await oauth_user_db.create_user(
+        {
+            "email": "oauth@example.com",
+            "hashed_password": "$2b$password123456789",
+        }
+    )
+    with pytest.raises(InvalidRequestError):
+        user.oauth_accounts
+
+
+async def test_tenant_scoping(user_db: SQLAlchemyUserDatabase):
+    tenant_a = SQLAlchemyUserDatabase(user_db.session, UserTable, tenant_id="a")
+    tenant_b = SQLAlchemyUserDatabase(user_db.session, UserTable, tenant_id="b")
+    user_create_dict = {
+        "email": "tenant@example.com",
+        "hashed_password": "$2b$password123456789",
+    }
+
+    # The same email can register once per tenant
+    user_a = await tenant_a.create_user(user_create_dict)
+    user_b = await tenant_b.create_user(user_create_dict)
+    assert user_a.tenant_id == "a"
+    assert user_b.tenant_id == "b"
+    with pytest.raises(UserAlreadyExists):
+        await tenant_a.create_user(user_create_dict)
+
+    # Lookups only see the tenant's users
+    assert (await tenant_a.get_user_by_email("tenant@example.com")).id == user_a.id
+    assert (await tenant_b.get_user_by_email("tenant@example.com")).id == user_b.id
+    assert await tenant_a.get_user_by_id(user_b.id) is None
+    assert await tenant_b.get_user_by_id(user_a.id) is None
+
+
+async def test_email_lookup_is_case_insensitive(user_db: SQLAlchemyUserDatabase):
+    user = await user_db.create_user(
+        {"email": "Mixed@Example.com", "hashed_password": "$2b$password123456789"}
+    )
+    assert user.email == "mixed@example.com"
+    assert (await user_db.get_user_by_email("MIXED@example.COM")).id == user.id
+
+    with pytest.raises(IntegrityError):
+        await user_db.session.execute(
+            insert(UserTable).values(
+                email="MIXED@example.com", hashed_password="$2b$password123456789"
+            )
+        )
+
+
+async def test_snapshots(user_db: SQLAlchemyUserDatabase):
+    user = await user_db.create_user(
+        {"email": "snapshot@example.com", "hashed_password": "$2b$password123456789"}
+    )
+    user_db.session.expunge_all()
+
+    by_id = await user_db.get_snapshot_by_id(user.id)
+    by_email = await user_db.get_snapshot_by_email("Snapshot@Example.com")
+    assert by_id == by_email == UserSnapshot.from_table(user)
+    # Snapshots never enter the identity map.
+    assert len(user_db.session.identity_map) == 0
+    assert await user_db.get_snapshot_by_email("missing@example.com") is None
+
+    assert by_id.to_user().model_dump() == {
+        "id": user.id,
+        "email": "snapshot@example.com",
+        "is_active": True,
+        "is_superuser": False,
+        "is_verified": False,
+    }
+    assert UserSnapshot.from_user(by_id.to_user(), user.hashed_password) == by_id
+    assert UserSnapshot.from_table(by_id.to_table()) == by_id
+
+
+async def test_projections(user_db: SQLAlchemyUserDatabase):
+    user = await user_db.create_user(
+        {"email": "projection@example.com", "hashed_password": "$2b$password123456789"}
+    )
+    user_db.session.expunge_all()
+
+    assert await user_db.get_credentials_by_email("Projection@example.com") == (
+        user.id,
+        "projection@example.com",
+        "$2b$password123456789",
+        True,
+    )
+    assert await user_db.get_identity_by_id(user.id) == (
+        user.id,
+        "projection@example.com",
+        True,
+    )
+    assert len(user_db.session.identity_map) == 0
+    assert await user_db.get_identity_by_id(uuid4()) is None
+
+
+async def test_optimistic_locking(user_db: SQLAlchemyUserDatabase):
+    user = await user_db.create_user(
+        {"email": "version@example.com", "hashed_password": "$2b$password123456789"}
+    )
+    assert user.version == 1
+    user = await user_db.update_user(user, {"is_verified": True})
+    assert user.version == 2
+
+    # Another writer changes the row behind the loaded instance.
+    await user_db.session.execute(
+        update(UserTable)
+        .where(UserTable.id == user.id)
+        .values(is_active=False, version=UserTable.version + 1)
+        .execution_options(synchronize_session=False)
+    )
+    await user_db.session.commit()
+
+    user_id = user.id
+    with pytest.raises(UserUpdateConflict):
+        await user_db.update_user(user, {"is_superuser": True})
+    reloaded = await user_db.get_user_by_id(user_id)
+    assert (reloaded.version, reloaded.is_active, reloaded.is_superuser) == (
+        3,
+        False,
+        False,
+    )
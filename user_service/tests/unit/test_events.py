@@ -0,0 +1,91 @@
+import asyncio
+import pytest
+import pytest_asyncio
+from user_service.src.core.events import Event, EventBus
+
+
+@pytest_asyncio.fixture(loop_scope="function")
+async def event_bus():
+    event_bus = EventBus(maxsize=2, workers=2, max_attempts=3, publish_timeout=0.01)
+    yield event_bus
+    await event_bus.stop(drain=False)
+
+
+class TestEventBus:
+    async def test_publish_delivers(self, event_bus):
+        received = []
+
+        async def handler(event: Event):
+            received.append(event.type)
+
+        event_bus.subscribe("user.registered", handler)
+        event_bus.subscribe("*", handler)
+        event_bus.start()
+        assert await event_bus.publish(Event("user.registered", {})) is True
+        assert await event_bus.publish(Event("user.updated", {})) is True
+        await event_bus.join()
+        assert sorted(received) == [
+            "user.registered",
+            "user.registered",
+            "user.updated",
+        ]
+        assert event_bus.metrics.published == 2
+        assert event_bus.metrics.delivered == 2
+
+    async def test_failed_handler_is_retried(self, event_bus):
+        attempts = []
+
+        async def handler(event: Event):
+            attempts.append(event.attempts)
+            if event.attempts < 2:
+                raise RuntimeError()
+
+        event_bus.subscribe("user.registered", handler)
+        event_bus.start()
+        await event_bus.publish(Event("user.registered", {}))
+        await event_bus.join()
+        assert attempts == [1, 2]
+        assert event_bus.metrics.retried == 1
+        assert event_bus.metrics.delivered == 1
+
+    async def test_gives_up_after_max_attempts(self, event_bus):
+        async def handler(event: Event):
+            raise RuntimeError()
+
+        event_bus.subscribe("user.registered", handler)
+        event_bus.start()
+        await event_bus.publish(Event("user.registered", {}))
+        await event_bus.join()
+        assert event_bus.metrics.retried == 2
+        assert event_bus.metrics.failed == 1
+        assert event_bus.metrics.delivered == 0
+
+    async def test_full_queue_drops_after_timeout(self, event_bus):
+        assert await event_bus.publish(Event("user.registered", {})) is True
+        assert await event_bus.publish(Event("user.registered", {})) is True
+        assert await event_bus.publish(Event("user.registered", {})) is False
+        assert event_bus.queue_depth == 2
+        assert event_bus.metrics.backpressure_waits == 1
+        assert event_bus.metrics.dropped == 1
+
+    async def test_full_queue_waits_for_room(self, event_bus):
+        event_bus.publish_timeout = 1
+        await event_bus.publish(Event("user.registered", {}))
+        await event_bus.publish(Event("user.registered", {}))
+        publish = asyncio.create_task(event_bus.publish(Event("user.registered", {})))
+        event_bus.start()
+        assert await publish is True
+        assert event_bus.metrics.backpressure_waits == 1
+        assert event_bus.metrics.dropped == 0
+
+    async def test_stop_drains_queue(self, event_bus):
+        received = []
+
+        async def handler(event: Event):
+            received.append(event.id)
+
+        event_bus.subscribe("*", handler)
+        event_bus.start()
+        await event_bus.publish(Event("user.registered", {}))
+        await event_bus.stop()
+        assert len(received) == 1
@@ -3,13 +3,16 @@ from uuid import uuid4
 import pytest
 import pathlib
 import asyncio
+import json
+import jwt
+from user_service.src.api.endpoints.jwks import render_jwks
 from user_service.src.core.config import settings
 from user_service.src.core.interfaces import ID
 from user_service.src.core.jwt_token import (
     JWTTokenService,
     JWTTokenServiceDestroyNotSupportedError,
 )
-from user_service.src.core.security import decode_jwt, encode_jwt
+from user_service.src.core.security import decode_jwt, encode_jwt, get_key_id
 
 
 async def create_private_key(private_key_path: pathlib.Path):
@@ -99,6 +102,19 @@ def jwt_token(certs) -> Callable[[Optional[ID]], str]:
     return _jwt_token
 
 
+@pytest.fixture(scope="module")
+async def rotated_certs(tmp_path_factory):
+    temp_dir = tmp_path_factory.mktemp("rotated_certs")
+    private_key_path = temp_dir / "private.pem"
+    public_key_path = temp_dir / "public.pem"
+    await create_private_key(private_key_path)
+    await create_public_key(private_key_path, public_key_path)
+    yield {
+        "private_key": private_key_path.read_text(),
+        "public_key": public_key_path.read_text(),
+    }
+
+
 @pytest.mark.jwt
 class TestWriteJWTToken:
     async def test_write_jwt_token(self, jwt_token_service, user, certs):
@@ -110,6 +126,10 @@ class TestWriteJWTToken:
         assert decoded_jwt["sub"] == str(user.id)
         assert decoded_jwt["email"] == user.email
 
+    async def test_write_jwt_token_kid(self, jwt_token_service, user):
+        token = await jwt_token_service.write_token(user)
+        assert jwt.get_unverified_header(token)["kid"] == jwt_token_service.key_id
+
 
 @pytest.mark.jwt
 class TestReadJWTToken:
@@ -143,6 +163,56 @@ class TestReadJWTToken:
         user = await jwt_token_service.read_token(jwt_token(user.id), user_manager)
         assert user
 
+    async def test_valid_token_unknown_kid(
+        self, jwt_token_service, user, user_manager, certs
+    ):
+        token = encode_jwt(
+            payload={"sub": str(user.id), "aud": settings.JWT_AUDIENCE},
+            key=certs["private_key"],
+            header={"kid": "unknown"},
+        )
+        user = await jwt_token_service.read_token(token, user_manager)
+        assert not user
+
+
+@pytest.mark.jwt
+class TestRotateJWTKeys:
+    async def test_jwks(self, certs, rotated_certs):
+        jwt_token_service = JWTTokenService(
+            private_key=rotated_certs["private_key"],
+            public_key=rotated_certs["public_key"],
+            additional_public_keys=[certs["public_key"]],
+        )
+        body, _ = render_jwks(
+            tuple(jwt_token_service.verification_keys.values()),
+            jwt_token_service.algorithm,
+        )
+        kids = [jwk["kid"] for jwk in json.loads(body)["keys"]]
+        assert len(kids) == 2
+        assert kids[0] == jwt_token_service.key_id
+        assert kids[1] == get_key_id(certs["public_key"])
+
+    async def test_read_token_signed_with_previous_key(
+        self, jwt_token_service, certs, rotated_certs, user, user_manager
+    ):
+        token = await jwt_token_service.write_token(user)
+        rotated_jwt_token_service = JWTTokenService(
+            private_key=rotated_certs["private_key"],
+            public_key=rotated_certs["public_key"],
+            additional_public_keys=[certs["public_key"]],
+        )
+        assert await rotated_jwt_token_service.read_token(token, user_manager)
+
+    async def test_read_token_signed_with_retired_key(
+        self, jwt_token_service, rotated_certs, user, user_manager
+    ):
+        token = await jwt_token_service.write_token(user)
+        rotated_jwt_token_service = JWTTokenService(
+            private_key=rotated_certs["private_key"],
+            public_key=rotated_certs["public_key"],
+        )
+        assert not await rotated_jwt_token_service.read_token(token, user_manager)
+
 
 @pytest.mark.jwt
 class TestDestroyJWTToken:
@@ -0,0 +1,56 @@
+import pytest
+from sqlalchemy import text
+from user_service.src.db.engine import create_db_engine
+from user_service.src.db.memory import InMemoryUserDatabase, InMemoryUserStore
+
+
+async def test_snapshot_round_trip(tmp_path):
+    store = InMemoryUserStore(tmp_path / "users.snapshot")
+    user_db = InMemoryUserDatabase(store)
+    user = await user_db.create_user(
+        {"email": "persist@example.com", "hashed_password": "$2b$password123456789"}
+    )
+    await user_db.upsert_oauth_account(
+        user,
+        {
+            "oauth_name": "service1",
+            "access_token": "TOKEN",
+            "expires_at": None,
+            "account_id": "user_oauth1",
+            "account_email": "persist@example.com",
+        },
+    )
+    assert store.dirty
+    assert await store.run_once() == 1
+    assert not store.dirty
+    assert await store.run_once() == 0
+
+    restored = InMemoryUserStore(tmp_path / "users.snapshot")
+    assert restored.load() == 1
+    restored_db = InMemoryUserDatabase(restored)
+    restored_user = await restored_db.get_user_by_email("persist@example.com")
+    assert restored_user.id == user.id
+    assert restored_user.hashed_password == user.hashed_password
+    assert (await restored_db.get_by_oauth_account("service1", "user_oauth1")).id == (
+        user.id
+    )
+
+
+async def test_load_without_snapshot(tmp_path):
+    assert InMemoryUserStore(tmp_path / "missing.snapshot").load() == 0
+    assert InMemoryUserStore(None).load() == 0
+
+
+async def test_load_rejects_unknown_version(tmp_path):
+    path = tmp_path / "users.snapshot"
+    path.write_text('{"version": 0}')
+    with pytest.raises(ValueError):
+        InMemoryUserStore(path).load()
+
+
+async def test_sqlite_engine_uses_wal(tmp_path):
+    engine = create_db_engine(f"sqlite+aiosqlite:///{tmp_path / 'wal.db'}", echo=False)
+    async with engine.connect() as connection:
+        assert await connection.scalar(text("PRAGMA journal_mode")) == "wal"
+        assert await connection.scalar(text("PRAGMA synchronous")) == 1
+    await engine.dispose()
@@ -0,0 +1,79 @@
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from user_service.src.core.exceptions import InvalidPasswordException
+from user_service.src.db import SQLAlchemyUserDatabase, UserManager
+from user_service.src.db.session import LazyAsyncSession
+from user_service.src.models import Base, UserTable
+from user_service.src.schemes import UserCreate
+
+
+@pytest.fixture
+async def engine(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'users.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+def checkouts(engine) -> list:
+    checkouts = []
+    event.listen(engine.sync_engine, "checkout", lambda *args: checkouts.append(args))
+    return checkouts
+
+
+@pytest.fixture
+async def session(engine):
+    session_maker = async_sessionmaker(engine, expire_on_commit=False)
+    async with LazyAsyncSession(session_maker) as session:
+        yield session
+
+
+@pytest.fixture
+def user_manager(session) -> UserManager:
+    return UserManager(SQLAlchemyUserDatabase(session, UserTable))
+
+
+class TestLazyAsyncSession:
+    async def test_invalid_password_never_touches_pool(
+        self, user_manager, session, checkouts
+    ):
+        with pytest.raises(InvalidPasswordException):
+            await user_manager.create_user(
+                UserCreate(email="lazy@example.com", password="short")
+            )
+        assert session.is_started is False
+        assert checkouts == []
+
+    async def test_create_user_releases_connection(
+        self, user_manager, session, engine, checkouts
+    ):
+        await user_manager.create_user(
+            UserCreate(email="lazy@example.com", password="secret123")
+        )
+        assert session.is_started is True
+        assert checkouts
+        assert engine.pool.checkedout() == 0
+
+    async def test_lookup_releases_connection(self, user_manager, session, engine):
+        created_user = await user_manager.create_user(
+            UserCreate(email="lazy@example.com", password="secret123")
+        )
+        user = await user_manager.get_user_by_id(created_user.id)
+        assert engine.pool.checkedout() == 0
+        assert user.email == "lazy@example.com"
+
+    async def test_lookup_inside_transaction_keeps_connection(self, session, engine):
+        user_db = SQLAlchemyUserDatabase(session, UserTable)
+        async with session.begin():
+            await user_db.get_user_by_email("lazy@example.com")
+            assert engine.pool.checkedout() == 1
+        assert engine.pool.checkedout() == 0
+
+    async def test_close_without_use(self, engine, checkouts):
+        session = LazyAsyncSession(async_sessionmaker(engine))
+        await session.close()
+        assert session.is_started is False
+        assert checkouts == []
@@ -0,0 +1,47 @@
+from typing import Annotated
+import pytest
+from fastapi import Depends, FastAPI, status
+from httpx import AsyncClient, ASGITransport
+from user_service.src.core.config import settings
+from user_service.src.core.exceptions import ErrorCode
+from user_service.src.core.tenant import get_tenant_id
+
+
+@pytest.fixture
+async def tenant_client():
+    app = FastAPI()
+
+    @app.get("/tenant")
+    async def tenant(
+        tenant_id: Annotated[str, Depends(get_tenant_id)],
+        again: Annotated[str, Depends(get_tenant_id, use_cache=False)],
+    ):
+        return {"tenant_id": tenant_id, "again": again}
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://localhost:80/"
+    ) as client:
+        yield client
+
+
+class TestGetTenantId:
+    async def test_header(self, tenant_client):
+        response = await tenant_client.get("/tenant", headers={"X-Tenant-ID": "acme"})
+        assert response.json() == {"tenant_id": "acme", "again": "acme"}
+
+    async def test_default(self, tenant_client):
+        response = await tenant_client.get("/tenant")
+        assert response.json()["tenant_id"] == settings.DEFAULT_TENANT_ID
+
+    async def test_required(self, tenant_client, monkeypatch):
+        monkeypatch.setattr(settings, "DEFAULT_TENANT_ID", None)
+        response = await tenant_client.get("/tenant")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.json() == {"detail": ErrorCode.INVALID_TENANT}
+
+    @pytest.mark.parametrize("tenant_id", ["a" * 65, "acme/../other", "a b"])
+    async def test_malformed(self, tenant_client, tenant_id):
+        response = await tenant_client.get(
+            "/tenant", headers={"X-Tenant-ID": tenant_id}
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
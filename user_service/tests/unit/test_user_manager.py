@@ -1,5 +1,6 @@
 from unittest.mock import AsyncMock
 import pytest
+from fastapi.security import OAuth2PasswordRequestForm
 from pydantic_core._pydantic_core import ValidationError
 
 from user_service.src.core.exceptions import (
@@ -7,9 +8,11 @@ from user_service.src.core.exceptions import (
     InvalidPasswordException,
     UserAlreadyExists,
     UserNotExists,
+    UserUpdateConflict,
 )
 from user_service.src.core.typing import StringType
 from user_service.src.db import UserManager
+from user_service.src.models import UserCredentials
 from user_service.src.schemes import UserCreate, UserUpdate
 from user_service.tests.conftest import FakeUserTable
 
@@ -62,7 +65,7 @@ class TestCreateUser:
     async def test_create_valid_user(self, user_manager: AsyncMock, email: StringType):
         user = UserCreate(email=email, password="secret123")
         created_user = await user_manager.create_user(user)
-        assert len(created_user.__annotations__) == 6
+        assert len(created_user.__annotations__) == 7
         assert created_user.email == email.lower()
         assert created_user.hashed_password.startswith("$2b$")
         assert user_manager.on_after_register.called is True
@@ -78,3 +81,58 @@ class TestUserManager:
             InvalidPasswordException, match=ErrorCode.UPDATE_USER_INVALID_PASSWORD
         ):
             await user_manager.update_user(user, update_dict)
+
+    async def test_update_user_retries_conflicts(
+        self, user_manager: UserManager, user: FakeUserTable, mocker
+    ):
+        update_user = mocker.patch.object(
+            user_manager.user_db,
+            "update_user",
+            side_effect=[UserUpdateConflict(), user],
+        )
+        get_user_by_id = mocker.spy(user_manager.user_db, "get_user_by_id")
+
+        updated_user = await user_manager.update_user(
+            user, UserUpdate(email="retry@example.com")
+        )
+
+        assert updated_user is user
+        assert update_user.call_count == 2
+        get_user_by_id.assert_called_once_with(user.id)
+
+    async def test_update_user_gives_up_after_retries(
+        self, user_manager: UserManager, user: FakeUserTable, mocker, monkeypatch
+    ):
+        monkeypatch.setattr(
+            "user_service.src.db.manager.settings.USER_UPDATE_MAX_RETRIES", 2
+        )
+        update_user = mocker.patch.object(
+            user_manager.user_db, "update_user", side_effect=UserUpdateConflict()
+        )
+
+        with pytest.raises(UserUpdateConflict):
+            await user_manager.update_user(user, UserUpdate(email="retry@example.com"))
+        assert update_user.call_count == 3
+        assert user_manager.on_after_update.called is False
+
+    async def test_authenticate_returns_credentials(
+        self, user_manager: UserManager, user: FakeUserTable, monkeypatch, mocker
+    ):
+        monkeypatch.setattr(user, "hashed_password", user.hashed_password)
+        monkeypatch.setattr(
+            "user_service.src.db.manager.verify_and_update_password",
+            lambda password, hashed_password: (True, "$2b$rehashed"),
+        )
+        update_user = mocker.spy(user_manager.user_db, "update_user")
+        credentials = OAuth2PasswordRequestForm(
+            username="User@Example.com", password="secret123"
+        )
+
+        authenticated = await user_manager.authenticate(credentials)
+
+        assert isinstance(authenticated, UserCredentials)
+        assert authenticated.id == user.id
+        assert authenticated.hashed_password == "$2b$rehashed"
+        assert update_user.call_count == 1
+        assert update_user.call_args.kwargs["emit_event"] is False
+        assert user_manager.on_after_update.called is False